@@ -6,6 +6,11 @@
 #              Don't modify the contents of this file.
 
 
+import random
+from hashlib import blake2b
+from math import log, log2
+
+
 # -------------- Used by both HashMaps (SC & OA)  -------------- #
 
 class DynamicArrayException(Exception):
@@ -78,6 +83,186 @@ class DynamicArray:
         return len(self._data)
 
 
+class FastDynamicArray(DynamicArray):
+    """
+    Dynamic Array for performance-sensitive code. Supports everything
+    DynamicArray does, plus iteration, slicing, preallocation to a length,
+    fill, extend, copy and the unchecked accessors get_unchecked and
+    set_unchecked for callers that already know their index is in range.
+    """
+
+    def __init__(self, arr=None, length: int = 0, value: object = None) -> None:
+        """
+        Initialize new array from a list or iterable, or else preallocate it
+        with length copies of value.
+        """
+        super().__init__()
+        self._data = list(arr) if arr is not None else [value] * length
+
+    def __iter__(self):
+        """Return an iterator over the elements of the array."""
+        return iter(self._data)
+
+    def __getitem__(self, index):
+        """Return element at index, or a new array for a slice."""
+        if isinstance(index, slice):
+            return FastDynamicArray(self._data[index])
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """Set element at index, or replace a slice with an iterable."""
+        if isinstance(index, slice):
+            self._data[index] = value
+        else:
+            self.set_at_index(index, value)
+
+    def get_unchecked(self, index: int):
+        """Return element at index without checking bounds."""
+        return self._data[index]
+
+    def set_unchecked(self, index: int, value: object) -> None:
+        """Set element at index without checking bounds."""
+        self._data[index] = value
+
+    def fill(self, value: object) -> None:
+        """Set every element of the array to value."""
+        self._data = [value] * len(self._data)
+
+    def extend(self, values) -> None:
+        """Append every element of an iterable to the end of the array."""
+        self._data.extend(values)
+
+    def copy(self) -> "FastDynamicArray":
+        """Return a shallow copy of the array."""
+        return FastDynamicArray(self._data)
+
+
+class FastArrayAttribute:
+    """
+    Class attribute that stores a plain DynamicArray assigned to it on an
+    instance as a FastDynamicArray, so code that can't be changed may keep
+    building DynamicArrays. Only assignment goes through the attribute;
+    reading it is an ordinary instance attribute lookup.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Remember the name the attribute was given in its class."""
+        self._name = name
+
+    def __set__(self, instance: object, value: DynamicArray) -> None:
+        """Store value on instance, as a FastDynamicArray if it isn't one."""
+        if not isinstance(value, FastDynamicArray):
+            value = FastDynamicArray(value._data)
+        instance.__dict__[self._name] = value
+
+
+def as_list(values) -> list:
+    """
+    Returns the elements of a DynamicArray (such as the key/value pairs
+    returned by get_keys_and_values) or of any iterable as a list.
+    """
+    if isinstance(values, DynamicArray):
+        return [values[i] for i in range(values.length())]
+    return list(values)
+
+
+class GenerationArray(FastDynamicArray):
+    """
+    Dynamic Array whose elements can all be reset to an empty value in O(1).
+    Every slot is stamped with the generation it was last written in, and a
+    slot from an older generation reads as a fresh empty value.
+    Supported methods are those of FastDynamicArray plus reset
+    """
+
+    def __init__(self, length: int, empty: callable = None) -> None:
+        """
+        Initialize array of given length. Slots read as empty() when first
+        accessed, or as None if empty isn't given.
+        """
+        super().__init__(length=length)
+        self._stamps = [0] * length
+        self._generation = 1
+        self._empty = empty
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return str(list(self))
+
+    def __iter__(self):
+        """Return an iterator over the elements of the array."""
+        return (self.get_unchecked(i) for i in range(len(self._data)))
+
+    def __getitem__(self, index):
+        """Return element at index, or a new array for a slice."""
+        if isinstance(index, slice):
+            return FastDynamicArray(list(self)[index])
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """Set value of element at a given index using [] syntax."""
+        self.set_at_index(index, value)
+
+    def reset(self) -> None:
+        """Empty every element of the array without touching them."""
+        self._generation += 1
+
+    def append(self, value: object) -> None:
+        """Add new element at the end of the array."""
+        self._data.append(value)
+        self._stamps.append(self._generation)
+
+    def pop(self):
+        """Remove element from end of the array and return it."""
+        value = self.get_at_index(self.length() - 1)
+        self._data.pop()
+        self._stamps.pop()
+        return value
+
+    def swap(self, i: int, j: int) -> None:
+        """Swap two elements in array given their indices."""
+        value = self.get_at_index(i)
+        self.set_at_index(i, self.get_at_index(j))
+        self.set_at_index(j, value)
+
+    def get_at_index(self, index: int):
+        """Return value of element at a given index."""
+        if index < 0 or index >= self.length():
+            raise DynamicArrayException
+        return self.get_unchecked(index)
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """Set value of element at a given index."""
+        if index < 0 or index >= self.length():
+            raise DynamicArrayException
+        self.set_unchecked(index, value)
+
+    def get_unchecked(self, index: int):
+        """Return element at index without checking bounds."""
+        if self._stamps[index] != self._generation:
+            self._data[index] = self._empty() if self._empty else None
+            self._stamps[index] = self._generation
+        return self._data[index]
+
+    def set_unchecked(self, index: int, value: object) -> None:
+        """Set element at index without checking bounds."""
+        self._data[index] = value
+        self._stamps[index] = self._generation
+
+    def fill(self, value: object) -> None:
+        """Set every element of the array to value."""
+        self._data = [value] * len(self._data)
+        self._stamps = [self._generation] * len(self._data)
+
+    def extend(self, values) -> None:
+        """Append every element of an iterable to the end of the array."""
+        for value in values:
+            self.append(value)
+
+    def copy(self) -> FastDynamicArray:
+        """Return a shallow copy of the array's current elements."""
+        return FastDynamicArray(list(self))
+
+
 def hash_function_1(key: str) -> int:
     """Sample Hash function #1 to be used with HashMap implementation"""
     hash = 0
@@ -96,6 +281,85 @@ def hash_function_2(key: str) -> int:
     return hash
 
 
+class SeededHash:
+    """
+    Keyed hash function for HashMaps that store untrusted keys. Each
+    instance hashes with its own random seed (BLAKE2b keyed mode), so keys
+    that collide in one map can't be crafted ahead of time.
+    """
+
+    def __init__(self, seed: int = None) -> None:
+        """Initialize hash function with seed, or a random 64-bit seed."""
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self._key = (self.seed % 2 ** 64).to_bytes(8, 'little')
+
+    def __call__(self, key: str) -> int:
+        """Return the 64-bit keyed hash of key."""
+        data = key.encode() if isinstance(key, str) else repr(key).encode()
+        digest = blake2b(data, digest_size=8, key=self._key).digest()
+        return int.from_bytes(digest, 'little')
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if other hashes every key the same way."""
+        return isinstance(other, SeededHash) and other.seed == self.seed
+
+    def __hash__(self) -> int:
+        """Return a hash consistent with __eq__."""
+        return hash(self.seed)
+
+
+class BlockedBloomFilter:
+    """
+    Bloom filter that answers "definitely absent" or "maybe present" for a
+    key's hash. All k bits of a key lie in one 512-bit block (a cache line),
+    so a check reads a single block.
+    Supported methods: add, might_contain
+    """
+
+    def __init__(self, expected: int, fp_rate: float = 0.01) -> None:
+        """
+        Initialize filter sized for about the given false-positive rate once
+        expected keys have been added.
+        """
+        self.expected = max(expected, 1)
+        self.fp_rate = fp_rate
+        self.count = 0
+
+        # Packing a key's bits into one block raises the false-positive
+        # rate, more so for low rates, which extra bits make up for.
+        bits_per_key = -log(fp_rate) / log(2) ** 2
+        bits_per_key *= 1 + 0.04 * log2(1 / fp_rate)
+        self._blocks = [0] * (int(self.expected * bits_per_key) // 512 + 1)
+        self._k = max(1, min(16, round(-log(fp_rate) / log(2))))
+
+    def add(self, hash: int) -> None:
+        """Add the key with the input hash."""
+        block, mask = self._locate(hash)
+        self._blocks[block] |= mask
+        self.count += 1
+
+    def might_contain(self, hash: int) -> bool:
+        """Return False if the key with the input hash was never added."""
+        block, mask = self._locate(hash)
+        return self._blocks[block] & mask == mask
+
+    def _locate(self, hash: int) -> (int, int):
+        """Return the block of a hash and the mask of its bits in it."""
+        # splitmix64 spreads weak hashes over all 64 bits.
+        x = (hash + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        x ^= x >> 31
+
+        # Bit positions step through the block by an odd stride.
+        position, step = x & 511, (x >> 9) & 511 | 1
+        mask = 0
+        for _ in range(self._k):
+            mask |= 1 << position
+            position = (position + step) & 511
+        return (x >> 18) % len(self._blocks), mask
+
+
 # --------- For use in Separate Chaining (SC) HashMap  --------- #
 
 class SLNode:
@@ -0,0 +1,258 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Bulk construction of HashMaps from a large input using a pool
+#              of worker processes. For the SC HashMap, workers hash the
+#              input and order each bucket range's pairs into chains, which
+#              are then stitched into one map. For the OA HashMap only the
+#              hashing is parallel.
+
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import as_list, hash_function_1, hash_function_2
+
+
+# Pairs and hash function of the build a worker is helping with, set once
+# per worker by share so that tasks only carry slice bounds.
+_pairs = None
+_function = None
+
+
+class SerialPool:
+    """
+    Stand-in for ProcessPoolExecutor that runs every call in this process,
+    used when only one worker is requested.
+    """
+
+    def __init__(self, initializer: callable, initargs: tuple) -> None:
+        """Run the initializer here, as a worker process would."""
+        initializer(*initargs)
+
+    def __enter__(self) -> "SerialPool":
+        """Return the pool."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Nothing to shut down."""
+        return None
+
+    def map(self, function: callable, *iterables):
+        """Return function applied to each group of arguments in order."""
+        return map(function, *iterables)
+
+
+def make_pool(workers: int, initializer: callable, initargs: tuple):
+    """
+    Returns a process pool with the input number of workers, each set up by
+    calling initializer(*initargs), or a SerialPool for one worker.
+    """
+    if workers == 1:
+        return SerialPool(initializer, initargs)
+    return ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                               initargs=initargs)
+
+
+def bounds(length: int, count: int) -> list:
+    """
+    Returns the (start, stop) bounds of count contiguous slices of near
+    equal length covering range(length).
+    """
+    size, extra = divmod(length, count)
+    slices, start = [], 0
+    for i in range(count):
+        stop = start + size + (1 if i < extra else 0)
+        slices.append((start, stop))
+        start = stop
+    return slices
+
+
+def share(pairs: list, function: callable) -> None:
+    """
+    Makes the pairs and hash function of a build available to the tasks
+    run by the workers.
+    """
+    global _pairs, _function
+    _pairs, _function = pairs, function
+
+
+def hash_slice(start: int, stop: int):
+    """
+    Returns the hashes of the keys of the shared pairs[start:stop], packed
+    into an array when they fit in 64 bits.
+    """
+    hashes = [_function(pair[0]) for pair in _pairs[start:stop]]
+    try:
+        return array('Q', hashes)
+    except OverflowError:
+        return hashes
+
+
+def index_slice(start: int, stop: int, capacity: int, partitions: int):
+    """
+    Returns a tuple of 1) the positions in the shared pairs of the pairs in
+    pairs[start:stop] and 2) their bucket indices, each a list of one array
+    per partition of the bucket indices, in input order.
+    """
+    positions = [array('q') for _ in range(partitions)]
+    indices = [array('q') for _ in range(partitions)]
+    for position in range(start, stop):
+        index = _function(_pairs[position][0]) % capacity
+        p = index * partitions // capacity
+        positions[p].append(position)
+        indices[p].append(index)
+    return positions, indices
+
+
+def order_partition(positions: list, indices: list):
+    """
+    Returns a tuple of 1) the positions of a partition's pairs grouped by
+    bucket, dropping all but the last pair of a repeated key, as with put,
+    and 2) the (index, count) runs of those groups, flattened. positions and
+    indices are the partition's arrays from each slice, in slice order.
+    """
+    positions = array('q', b''.join(part.tobytes() for part in positions))
+    indices = array('q', b''.join(part.tobytes() for part in indices))
+
+    # Note the last occurrence of every key so repeats are dropped without
+    # scanning chains, then let a stable sort group the rest by bucket.
+    last = {}
+    for i in range(len(positions)):
+        last[_pairs[positions[i]][0]] = i
+    kept = sorted(last.values())
+    kept.sort(key=indices.__getitem__)
+
+    order, runs = array('q'), array('q')
+    for i in kept:
+        order.append(positions[i])
+        if runs and runs[-2] == indices[i]:
+            runs[-1] += 1
+        else:
+            runs.append(indices[i])
+            runs.append(1)
+    return order, runs
+
+
+def hash_pairs(pairs: list, function: callable, workers: int):
+    """
+    Yields (slice of pairs, hashes of its keys) for consecutive slices of
+    the input pairs, hashed across workers processes. Each worker receives
+    the pairs once when it starts (inherited, not pickled, under the fork
+    start method).
+    """
+    with make_pool(workers, share, (pairs, function)) as pool:
+        slices = bounds(len(pairs), workers * 4)
+        results = pool.map(hash_slice, [start for start, stop in slices],
+                           [stop for start, stop in slices])
+        for (start, stop), hashes in zip(slices, results):
+            yield pairs[start:stop], hashes
+    share(None, None)
+
+
+def build_sc(pairs, capacity: int = 11, function: callable = hash_function_1,
+             workers: int = None) -> hash_map_sc.HashMap:
+    """
+    Returns a separate chaining HashMap holding the input key/value pairs,
+    built across workers processes (default: one per CPU). Workers hash
+    the keys and order each bucket range's pairs into chains; this process
+    stitches the chains in bucket by bucket, which is serial and bounds the
+    speed-up. function must be picklable, e.g. a module level function or a
+    SeededHash.
+    """
+    # Resizing an empty map gives it a table whose buckets are only created
+    # when used, instead of the capacity LinkedLists __init__ makes.
+    map = hash_map_sc.HashMap(1, function)
+    map.resize_table(capacity)
+    capacity = map.get_capacity()
+    pairs = as_list(pairs)
+    workers = workers or os.cpu_count() or 1
+    partitions = min(workers * 4, capacity)
+
+    # Workers only exchange arrays of positions in pairs and bucket indices;
+    # the pairs themselves reach each worker once, when it starts.
+    with make_pool(workers, share, (pairs, function)) as pool:
+        slices = bounds(len(pairs), partitions)
+        grouped = list(pool.map(index_slice, [start for start, stop in slices],
+                                [stop for start, stop in slices],
+                                [capacity] * partitions,
+                                [partitions] * partitions))
+        ordered = pool.map(order_partition,
+                           [[positions[p] for positions, indices in grouped]
+                            for p in range(partitions)],
+                           [[indices[p] for positions, indices in grouped]
+                            for p in range(partitions)])
+
+        # A flooded chain reseeds the map, after which the indices are
+        # stale and the remaining pairs are put one by one.
+        for order, runs in ordered:
+            start = 0
+            for r in range(0, len(runs), 2):
+                stop = start + runs[r + 1]
+                chain = [pairs[position] for position in order[start:stop]]
+                start = stop
+                if map._hash_function is function:
+                    map._fill_bucket(runs[r], chain)
+                else:
+                    for key, value in chain:
+                        map.put(key, value)
+    share(None, None)
+
+    return map
+
+
+def build_oa(pairs, capacity: int = 11, function: callable = hash_function_1,
+             workers: int = None) -> hash_map_oa.HashMap:
+    """
+    Returns an open addressing HashMap holding the input key/value pairs,
+    with keys hashed across workers processes (default: one per CPU). Only
+    the hashing is parallel: a quadratic probe sequence can reach any slot
+    of the table, so the keys are placed one by one in this process.
+    function must be picklable.
+    """
+    pairs = as_list(pairs)
+    map = hash_map_oa.HashMap(max(capacity, 2 * len(pairs) + 1), function)
+    workers = workers or os.cpu_count() or 1
+
+    # Precomputed hashes go stale once a flooded insert reseeds the map.
+    for chunk, hashes in hash_pairs(pairs, function, workers):
+        for (key, value), hash in zip(chunk, hashes):
+            if map._hash_function is function:
+                map._put_hashed(key, value, hash)
+            else:
+                map.put(key, value)
+
+    return map
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nbuild_sc example 1")
+    print("------------------")
+    pairs = [('str' + str(i // 2), i) for i in range(1000)]
+    for workers in (1, 2):
+        m = build_sc(pairs, 101, hash_function_2, workers)
+        print(workers, m.get_size(), m.get_capacity(), m.empty_buckets(),
+              m.get('str0'), m.get('str499'), m.contains_key('str500'))
+
+    print("\nbuild_oa example 1")
+    print("------------------")
+    for workers in (1, 2):
+        m = build_oa(pairs, 11, hash_function_2, workers)
+        print(workers, m.get_size(), m.get_capacity(), round(m.table_load(), 2),
+              m.get('str0'), m.get('str499'), m.contains_key('str500'))
+
+    print("\nrebuild from get_keys_and_values example 1")
+    print("------------------------------------------")
+    source = hash_map_sc.HashMap(11, hash_function_1)
+    for i in range(1, 6):
+        source.put(str(i), str(i * 10))
+    m = build_sc(source.get_keys_and_values(), 11, hash_function_1, 2)
+    print(m.get_keys_and_values())
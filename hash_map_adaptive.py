@@ -0,0 +1,421 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Hash map that keeps its entries in either a separate chaining
+#              or an open addressing HashMap, sampling its own workload and
+#              moving to the other layout when it resizes and the other
+#              layout looks cheaper for what it has seen.
+
+
+from math import log
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import (DynamicArray, SeededHash, as_list, hash_function_1,
+                        hash_function_2)
+
+
+# Layouts.
+SEPARATE_CHAINING = 'sc'
+OPEN_ADDRESSING = 'oa'
+
+# Average load of each layout over a growth cycle: SC doubles at load 1 and
+# OA at load .5, each leaving half that load after doubling.
+AVERAGE_LOAD = {SEPARATE_CHAINING: 0.75, OPEN_ADDRESSING: 0.375}
+
+# Returned by get for a key that doesn't exist, telling misses apart from
+# keys whose value is None.
+_MISSING = object()
+
+
+def chain_lengths(load: float) -> (float, float):
+    """
+    Returns the expected number of chained nodes visited by a separate
+    chaining lookup at the input load, for a hit and for a miss.
+    """
+    return 1 + load / 2, load
+
+
+def probe_lengths(load: float) -> (float, float):
+    """
+    Returns the expected number of buckets probed by a quadratic probing
+    lookup at the input load (counting tombstones), for a hit and for a
+    miss, the miss including the None bucket it stops at.
+    """
+    load = min(load, 0.95)
+    return (1 - log(1 - load) - load / 2,
+            1 / (1 - load) - load - log(1 - load))
+
+
+class AdaptiveHashMap:
+    # One lookup in SAMPLE_EVERY has the length of its chain or probe
+    # sequence sampled, along with the tombstone ratio.
+    SAMPLE_EVERY = 32
+
+    # Operations since the last resize needed before the layout may change.
+    MIN_OPERATIONS = 256
+
+    # The layout changes only if the other layout's estimated cost per
+    # operation is at least this fraction lower.
+    SWITCH_MARGIN = 0.2
+
+    # Estimated costs, in units of one probed OA bucket: finding an SC bucket
+    # and searching its chain, visiting one chained node, and rehashing one
+    # entry. Hashing a looked up key costs the same in both layouts and is
+    # left out.
+    BUCKET_COST = 1.4
+    NODE_COST = 0.15
+    REHASH_COST = 4.0
+
+    # Entries rehashed to clear out tombstones per OA removal, until it has
+    # been measured. New keys often reuse tombstones, so it is well below
+    # what filling the free half of the table with tombstones would cost.
+    REHASHES_PER_REMOVE = 0.5
+
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_function_1,
+                 layout: str = SEPARATE_CHAINING) -> None:
+        """
+        Initialize new AdaptiveHashMap that starts out in the input layout,
+        SEPARATE_CHAINING or OPEN_ADDRESSING.
+        """
+        if layout not in AVERAGE_LOAD:
+            raise ValueError("unknown layout: " + str(layout))
+
+        self._layout = layout
+        self._map = self._new_map(layout, capacity, function)
+
+        # Observed hash quality: sampled chain or probe lengths over what
+        # a uniform hash would give, remembered for each layout.
+        self._skew = {SEPARATE_CHAINING: 1.0, OPEN_ADDRESSING: 1.0}
+        self._rehashes_per_remove = self.REHASHES_PER_REMOVE
+        self._reset_stats()
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        return self._layout.upper() + '\n' + str(self._map)
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._map.get_size()
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._map.get_capacity()
+
+    def get_layout(self) -> str:
+        """
+        Return the current layout, SEPARATE_CHAINING or OPEN_ADDRESSING.
+        """
+        return self._layout
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Adds the input key/value pair to the AdaptiveHashMap.
+        """
+        # Resizes are done here rather than by the HashMap, so each one is
+        # a chance to change layout.
+        if self._needs_resize():
+            self._grow()
+
+        size = self._map.get_size()
+        self._map.put(key, value)
+        if self._map.get_size() > size:
+            self._inserts += 1
+        else:
+            self._updates += 1
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry or None if it doesn't exist.
+        """
+        value = self._map.get(key, _MISSING)
+        found = value is not _MISSING
+        self._lookups += 1
+        if found:
+            self._hits += 1
+        if self._lookups % self.SAMPLE_EVERY == 0:
+            self._sample(key, found)
+        return value if found else None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if input key is contained in the AdaptiveHashMap, False
+        otherwise.
+        """
+        found = self._map.contains_key(key)
+        self._lookups += 1
+        if found:
+            self._hits += 1
+        if self._lookups % self.SAMPLE_EVERY == 0:
+            self._sample(key, found)
+        return found
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the entry matching the input key from the AdaptiveHashMap.
+        """
+        size = self._map.get_size()
+        self._map.remove(key)
+        if self._map.get_size() < size:
+            self._removes += 1
+        else:
+            self._lookups += 1
+
+    def table_load(self) -> float:
+        """
+        Returns the load factor of the AdaptiveHashMap.
+        """
+        return self._map.table_load()
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets in the AdaptiveHashMap.
+        """
+        return self._map.empty_buckets()
+
+    def clear(self) -> None:
+        """
+        Clears all entries from the AdaptiveHashMap and starts sampling the
+        workload over.
+        """
+        self._map.clear()
+        self._reset_stats()
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the
+        AdaptiveHashMap.
+        """
+        return self._map.get_keys_and_values()
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes the AdaptiveHashMap to the input capacity, first moving to
+        the other layout if it looks cheaper for the workload seen since the
+        last resize. A layout change scales the capacity to the new layout's
+        load (halved for SC, doubled for OA).
+        """
+        self._resize(new_capacity, 0)
+
+    def estimate_costs(self, pending_rehash: int = 0) -> dict:
+        """
+        Returns a dictionary of each layout's estimated cost per operation
+        for the workload seen since the last resize, counting pending_rehash
+        entries about to be rehashed to clear out tombstones.
+        """
+        operations = self._lookups + self._inserts + self._updates + self._removes
+        if operations == 0:
+            return {SEPARATE_CHAINING: 0.0, OPEN_ADDRESSING: 0.0}
+
+        hit_rate = self._hits / self._lookups if self._lookups else 1.0
+        lookups = self._lookups / operations
+        inserts = self._inserts / operations
+        updates = self._updates / operations
+        removes = self._removes / operations
+
+        # Separate chaining: a bucket lookup plus a walk down its chain.
+        skew = self._skew[SEPARATE_CHAINING]
+        hit, miss = chain_lengths(AVERAGE_LOAD[SEPARATE_CHAINING])
+        hit = self.BUCKET_COST + self.NODE_COST * hit * skew
+        miss = self.BUCKET_COST + self.NODE_COST * miss * skew
+        sc = (lookups * (hit_rate * hit + (1 - hit_rate) * miss)
+              + inserts * miss + (updates + removes) * hit)
+
+        # Open addressing: probes that also pass over tombstones, plus the
+        # rehashes that clear tombstones out once they fill the table.
+        load = AVERAGE_LOAD[OPEN_ADDRESSING]
+        rehashes = self._rehashes_per_remove
+        if self._layout == OPEN_ADDRESSING:
+            tombstones = self._tombstones / self._samples if self._samples else 0.0
+            if self._removes:
+                rehashes = (self._rehashed + pending_rehash) / self._removes
+        else:
+            # Tombstones fill the free half of the table between rehashes,
+            # a quarter of it on average if removals outnumber new keys.
+            tombstones = 0.0
+            if removes:
+                share = min(1.0, removes / max(inserts, removes))
+                tombstones = (0.5 - load) / 2 * share
+        churn = removes * rehashes * self.REHASH_COST
+        skew = self._skew[OPEN_ADDRESSING]
+        hit, miss = probe_lengths(load + tombstones)
+        oa = (lookups * (hit_rate * hit + (1 - hit_rate) * miss) * skew
+              + (inserts * miss + (updates + removes) * hit) * skew + churn)
+
+        return {SEPARATE_CHAINING: sc, OPEN_ADDRESSING: oa}
+
+    def _new_map(self, layout: str, capacity: int, function: callable) -> object:
+        """
+        Returns an empty HashMap of the input layout. Resizing is left to the
+        AdaptiveHashMap, except as part of a flooding defense.
+        """
+        if layout == SEPARATE_CHAINING:
+            return hash_map_sc.HashMap(capacity, function)
+        return hash_map_oa.HashMap(capacity, function)
+
+    def _reset_stats(self) -> None:
+        """
+        Starts sampling the workload over.
+        """
+        self._lookups = self._hits = 0
+        self._inserts = self._updates = self._removes = 0
+        self._samples = 0
+        self._observed = self._expected = 0.0
+        self._tombstones = 0.0
+        self._rehashed = 0
+
+    def _sample(self, key: str, found: bool) -> None:
+        """
+        Records the chain or probe length of the lookup of key that just ran
+        next to what a uniform hash would give at the current load.
+        """
+        # A lookup in an empty map returns before searching.
+        map = self._map
+        if map.get_size() == 0:
+            return
+
+        load = map.get_size() / map.get_capacity()
+        if self._layout == SEPARATE_CHAINING:
+            # The bucket's length counts the key itself on a hit. Only
+            # sampled lookups pay for hashing the key again to find it.
+            observed = map._buckets.get_unchecked(map.calc_index(key)).length()
+            expected = 1 + load if found else load
+        else:
+            tombstones = (map._occupied - map.get_size()) / map.get_capacity()
+            observed = map._probe_length
+            expected = probe_lengths(load + tombstones)[0 if found else 1]
+            self._tombstones += tombstones
+
+        self._samples += 1
+        self._observed += observed
+        self._expected += expected
+
+    def _needs_resize(self) -> bool:
+        """
+        Returns True if the HashMap would resize itself (or clear out
+        tombstones) to make room for a new key.
+        """
+        map = self._map
+        if self._layout == SEPARATE_CHAINING:
+            return map.get_size() >= map.get_capacity()
+        return (map.table_load() >= 0.5
+                or (map._occupied + 1) * 2 > map.get_capacity())
+
+    def _grow(self) -> None:
+        """
+        Doubles the capacity, or for open addressing with mostly tombstones
+        in use, only rehashes to clear them out, as the HashMap would.
+        """
+        map = self._map
+        if (self._layout == OPEN_ADDRESSING and map.table_load() < 0.5
+                and map.get_size() * 4 < map.get_capacity()):
+            self._resize(map.get_capacity(), map.get_size())
+        else:
+            self._resize(map.get_capacity() * 2, 0)
+
+    def _resize(self, new_capacity: int, pending_rehash: int) -> None:
+        """
+        Resizes to the input capacity, in whichever layout is estimated to
+        be cheaper. pending_rehash is the number of entries this resize
+        rehashes only to clear out tombstones.
+        """
+        if self._samples and self._expected:
+            self._skew[self._layout] = self._observed / self._expected
+        if self._layout == OPEN_ADDRESSING and self._removes:
+            self._rehashes_per_remove = ((self._rehashed + pending_rehash)
+                                         / self._removes)
+
+        layout = self._layout
+        operations = self._lookups + self._inserts + self._updates + self._removes
+        if operations >= self.MIN_OPERATIONS:
+            costs = self.estimate_costs(pending_rehash)
+            other = (OPEN_ADDRESSING if layout == SEPARATE_CHAINING
+                     else SEPARATE_CHAINING)
+            if costs[other] < costs[layout] * (1 - self.SWITCH_MARGIN):
+                layout = other
+
+        # Clearing out tombstones doesn't start a new sample, so their cost
+        # adds up over the growth cycle.
+        if layout == self._layout:
+            self._map.resize_table(new_capacity)
+            self._rehashed += pending_rehash
+            if pending_rehash == 0:
+                self._reset_stats()
+            return
+
+        # Size the new table for the new layout's load, so it doesn't resize
+        # while the entries are moved over.
+        size = self._map.get_size()
+        if layout == SEPARATE_CHAINING:
+            new_capacity = max(new_capacity // 2, size)
+        else:
+            new_capacity = max(new_capacity * 2, size * 2 + 1)
+        new_map = self._new_map(layout, new_capacity, self._map._hash_function)
+        for key, value in as_list(self._map.get_keys_and_values()):
+            new_map.put(key, value)
+
+        self._map = new_map
+        self._layout = layout
+        self._reset_stats()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput / get / remove example 1")
+    print("----------------------------")
+    m = AdaptiveHashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.get_layout(), m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+    m.remove('str0')
+    print(m.get('str1'), m.get('str0'), m.contains_key('str149'), m.get_size())
+
+    print("\nclustering hash example 1")
+    print("--------------------------")
+    m = AdaptiveHashMap(11, hash_function_2, OPEN_ADDRESSING)
+    for i in range(2000):
+        m.put('key' + str(i), i)
+        for j in range(8):
+            m.get('key' + str(i * j // 8))
+    print(m.get_layout(), m.get_size(), m.get('key1999'), m.table_load() > 0.5)
+
+    print("\ndelete churn example 1")
+    print("----------------------")
+    m = AdaptiveHashMap(11, SeededHash(1), OPEN_ADDRESSING)
+    for i in range(20000):
+        m.put('key' + str(i), i)
+        if i >= 1000:
+            m.remove('key' + str(i - 1000))
+    print(m.get_layout(), m.get_size(), m.get('key19999'), m.get('key0'))
+    costs = m.estimate_costs()
+    print(sorted(costs), costs[SEPARATE_CHAINING] < costs[OPEN_ADDRESSING])
+
+    print("\nresize / clear example 1")
+    print("------------------------")
+    m = AdaptiveHashMap(5, hash_function_1, OPEN_ADDRESSING)
+    for i in range(5):
+        m.put(str(i), i)
+    m.resize_table(20)
+    print(m.get_layout(), m.get_capacity(), m.get('3'))
+    print(m)
+    m.clear()
+    print(m.get_size(), m.get('3'))
+    try:
+        AdaptiveHashMap(11, hash_function_1, 'tree')
+    except ValueError as error:
+        print(error)
@@ -0,0 +1,320 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Implementation of a hash map with string keys using open
+#              addressing with quadratic probing. Keys are stored as UTF-8
+#              bytes in one contiguous arena, and each slot holds the offset,
+#              length and hash of its key instead of a str object.
+
+
+from array import array
+
+from a6_include import (DynamicArray, FastDynamicArray, hash_function_1,
+                        hash_function_2)
+from hash_map_base import HashTableBase
+
+
+# Slot offset markers. Any other offset is the start of a key in the arena.
+EMPTY = -1
+TOMBSTONE = -2
+
+# Stored hashes are kept to 64 bits to fit the hash array.
+HASH_MASK = (1 << 64) - 1
+
+
+class ArenaHashMap(HashTableBase):
+    def __init__(self, capacity: int, function) -> None:
+        """
+        Initialize new ArenaHashMap that uses quadratic probing for collision
+        resolution
+        """
+        # capacity must be a prime number
+        self._capacity = self._next_prime(capacity)
+        self._allocate(self._capacity)
+
+        self._hash_function = function
+        self._size = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ""
+        for i in range(self._capacity):
+            if self._offsets[i] >= 0:
+                out += (str(i) + ": " + self._key_at(i) + ": "
+                        + str(self._values.get_unchecked(i)) + "\n")
+        return out
+
+    def __iter__(self):
+        """
+        Return an iterator over the keys of the map.
+        """
+        return (self._key_at(i) for i in range(self._capacity)
+                if self._offsets[i] >= 0)
+
+    def get_arena_size(self) -> int:
+        """
+        Return the number of bytes in the key arena, including the bytes of
+        removed keys not yet compacted away.
+        """
+        return len(self._arena)
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Adds the input key/value pair to an ArenaHashMap object. Keys must be
+        strings.
+        """
+        # Resize (or just clear out tombstones) before the new key would fill
+        # over half the slots, so every probe sequence reaches an empty one.
+        if (self._occupied + 1) * 2 > self._capacity:
+            if self._size * 4 >= self._capacity:
+                self.resize_table(self._capacity * 2)
+            else:
+                self.resize_table(self._capacity)
+
+        # Reusing a tombstone doesn't raise _occupied, so also compact once
+        # removed keys' bytes outweigh the live ones and the slots together.
+        elif self._dead > len(self._arena) - self._dead + self._capacity:
+            self.resize_table(self._capacity)
+
+        encoded = key.encode()
+        hash = self._hash_function(key) & HASH_MASK
+        index, found = self._probe(encoded, hash)
+        if found:
+            self._values.set_unchecked(index, value)
+            return
+
+        if (self.FLOOD_PROBE_LENGTH is not None
+                and self._probe_length > self.FLOOD_PROBE_LENGTH):
+            self.reseed()
+            hash = self._hash_function(key) & HASH_MASK
+            index, found = self._probe(encoded, hash)
+
+        self._store(index, encoded, hash, value)
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty slots in an ArenaHashMap object.
+        """
+        return self._capacity - self._occupied
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes an ArenaHashMap object's capacity to the input capacity.
+        Adjusts the new capacity to a prime number if it is not. Keys keep
+        their stored hashes, so nothing is rehashed, and the arena is
+        compacted so removed keys' bytes are dropped.
+        """
+        if new_capacity < self._size:
+            return
+
+        # Make sure new capacity is prime and make it next nearest prime if
+        # not, doubling it until the map would be at most half full.
+        if not self._is_prime(new_capacity):
+            new_capacity = self._next_prime(new_capacity)
+        while self._size * 2 > new_capacity:
+            new_capacity = self._next_prime(new_capacity * 2)
+
+        arena, offsets, lengths = self._arena, self._offsets, self._lengths
+        hashes, values = self._hashes, self._values
+        old_capacity = self._capacity
+        self._capacity = new_capacity
+        self._allocate(new_capacity)
+        self._size = 0
+
+        # Copy each live key's bytes straight from the old arena.
+        for i in range(old_capacity):
+            offset = offsets[i]
+            if offset >= 0:
+                encoded = arena[offset:offset + lengths[i]]
+                index, found = self._probe(encoded, hashes[i])
+                self._store(index, encoded, hashes[i], values.get_unchecked(i))
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry or None if it doesn't exist.
+        """
+        index, found = self._probe(key.encode(),
+                                   self._hash_function(key) & HASH_MASK)
+        if found:
+            return self._values.get_unchecked(index)
+
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if input key is contained in the ArenaHashMap, False
+        otherwise.
+        """
+        if self._size == 0:
+            return False
+
+        return self._probe(key.encode(), self._hash_function(key) & HASH_MASK)[1]
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the entry matching the input key from the ArenaHashMap.
+        """
+        self.pop(key)
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes the entry matching input key and returns its value, or returns
+        default if the key doesn't exist.
+        """
+        index, found = self._probe(key.encode(),
+                                   self._hash_function(key) & HASH_MASK)
+        if not found:
+            return default
+
+        # The key's bytes stay in the arena until the next resize.
+        value = self._values.get_unchecked(index)
+        self._offsets[index] = TOMBSTONE
+        self._dead += self._lengths[index]
+        self._values.set_unchecked(index, None)
+        self._size -= 1
+        return value
+
+    def clear(self) -> None:
+        """
+        Clears the ArenaHashMap of all entries.
+        """
+        self._allocate(self._capacity)
+        self._size = 0
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the
+        ArenaHashMap.
+        """
+        table_array = DynamicArray()
+        for i in range(self._capacity):
+            if self._offsets[i] >= 0:
+                table_array.append((self._key_at(i), self._values.get_unchecked(i)))
+
+        return table_array
+
+    def _rehash_keys(self) -> None:
+        """
+        Recomputes the stored hash of every key with the hash function.
+        """
+        for i in range(self._capacity):
+            if self._offsets[i] >= 0:
+                self._hashes[i] = self._hash_function(self._key_at(i)) & HASH_MASK
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replaces the arena and slot arrays with empty ones for capacity slots,
+        with no removed keys' bytes counted.
+        """
+        self._arena = bytearray()
+        self._offsets = array('q', [EMPTY]) * capacity
+        self._lengths = array('I', [0]) * capacity
+        self._hashes = array('Q', [0]) * capacity
+        self._values = FastDynamicArray(length=capacity)
+        self._occupied = 0
+        self._dead = 0
+
+    def _key_at(self, index: int) -> str:
+        """
+        Returns the key of the slot at index, decoded from the arena.
+        """
+        offset = self._offsets[index]
+        return self._arena[offset:offset + self._lengths[index]].decode()
+
+    def _store(self, index: int, encoded: bytes, hash: int,
+               value: object) -> None:
+        """
+        Appends an absent key's bytes to the arena and fills the slot at index
+        with its offset, length, hash and value.
+        """
+        if self._offsets[index] == EMPTY:
+            self._occupied += 1
+        self._offsets[index] = len(self._arena)
+        self._lengths[index] = len(encoded)
+        self._hashes[index] = hash
+        self._values.set_unchecked(index, value)
+        self._arena += encoded
+        self._size += 1
+
+    def _probe(self, encoded: bytes, hash: int) -> (int, bool):
+        """
+        Returns a tuple of 1) the index of the slot holding the key with the
+        input UTF-8 bytes, or the index a new key should be placed at, and
+        2) whether the key was found.
+        """
+        offsets, arena = self._offsets, self._arena
+        length = len(encoded)
+        index_init = hash % self._capacity
+        index = index_init
+        offset = offsets[index]
+        tombstone_i = None
+        j = 1
+
+        # Probe until an empty slot, comparing stored hashes and lengths
+        # before the bytes themselves, which startswith compares in place.
+        while offset != EMPTY:
+            if offset == TOMBSTONE:
+                if tombstone_i is None:
+                    tombstone_i = index
+            elif (self._hashes[index] == hash
+                  and self._lengths[index] == length
+                  and arena.startswith(encoded, offset)):
+                self._probe_length = j
+                return index, True
+            index = (index_init + j ** 2) % self._capacity
+            offset = offsets[index]
+            j += 1
+
+        self._probe_length = j
+        if tombstone_i is not None:
+            return tombstone_i, False
+        return index, False
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example 1")
+    print("-------------")
+    m = ArenaHashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nget / contains_key / remove example 1")
+    print("-------------------------------------")
+    m = ArenaHashMap(79, hash_function_2)
+    keys = [i for i in range(1, 1000, 20)]
+    for key in keys:
+        m.put(str(key), key * 42)
+    print(m.get_size(), m.get_capacity())
+    result = True
+    for key in keys:
+        # all inserted keys must be present
+        result &= m.contains_key(str(key)) and m.get(str(key)) == key * 42
+        # NOT inserted keys must be absent
+        result &= not m.contains_key(str(key + 1))
+    print(result)
+    for key in keys[::2]:
+        m.remove(str(key))
+    print(m.get_size(), m.contains_key('1'), m.contains_key('21'))
+
+    print("\narena / resize / clear example 1")
+    print("--------------------------------")
+    m = ArenaHashMap(11, hash_function_2)
+    for key in ('1', '2', 'über', '日本', '5'):
+        m.put(key, key * 2)
+    print(m.get_arena_size(), m.get('über'), m.get('日本'), m.pop('2'), m.get_arena_size())
+    m.resize_table(7)
+    print(m.get_arena_size(), sorted(m), m.get_capacity())
+    print(m)
+    m.clear()
+    print(m.get_size(), m.empty_buckets(), m.get_arena_size())
@@ -0,0 +1,254 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Base class of the hash maps and sets, holding the prime
+#              capacity helpers, the size and load accessors and hash-flooding
+#              defense they share, and a mixin holding the output, snapshot
+#              and Bloom filter features of the SC and OA HashMaps.
+
+
+from weakref import WeakSet
+
+from a6_include import BlockedBloomFilter, SeededHash
+
+
+class HashTableBase:
+    """
+    Base class for hash tables that keep their size in _size, their number
+    of buckets in _capacity and their hash function in _hash_function.
+    Subclasses provide resize_table, and override _rehash_keys if they store
+    the hashes of their keys.
+    """
+
+    # An insert whose chain holds more than FLOOD_CHAIN_LENGTH keys (and well
+    # past what the load factor explains), or whose probe passes more than
+    # FLOOD_PROBE_LENGTH slots, is treated as a hash-flooding attack: the
+    # table reseeds. Chaining tables check the first and open addressing
+    # tables the second. None disables the check.
+    FLOOD_CHAIN_LENGTH = 16
+    FLOOD_PROBE_LENGTH = 32
+
+    def _next_prime(self, capacity: int) -> int:
+        """
+        Increment from given number to find the closest prime number
+        """
+        if capacity % 2 == 0:
+            capacity += 1
+
+        while not self._is_prime(capacity):
+            capacity += 2
+
+        return capacity
+
+    @staticmethod
+    def _is_prime(capacity: int) -> bool:
+        """
+        Determine if given integer is a prime number and return boolean
+        """
+        if capacity == 2 or capacity == 3:
+            return True
+
+        if capacity == 1 or capacity % 2 == 0:
+            return False
+
+        factor = 3
+        while factor ** 2 <= capacity:
+            if capacity % factor == 0:
+                return False
+            factor += 2
+
+        return True
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    def table_load(self) -> float:
+        """
+        Returns the load factor (entries per bucket) of the table.
+        """
+        return float(self.get_size() / self.get_capacity())
+
+    def reseed(self, seed: int = None) -> None:
+        """
+        Switches the table to a SeededHash function with the input seed (or a
+        random one) and rehashes all entries.
+        """
+        self._hash_function = SeededHash(seed)
+        self._rehash_keys()
+        self.resize_table(self._capacity)
+
+    def _rehash_keys(self) -> None:
+        """
+        Recomputes the stored hashes of the keys after the hash function
+        changed. Tables that don't store hashes have nothing to do.
+        """
+        pass
+
+
+class HashMapMixin:
+    """
+    Bounded output, copy-on-write snapshots and a Bloom filter of the keys
+    for the SC and OA HashMaps, which keep their buckets in _buckets and
+    their number of non-empty buckets in _occupied. Each map provides the
+    layout-specific hooks _is_empty_bucket, _copy_bucket_at, _live_keys and
+    _make_snapshot.
+    """
+
+    # Live snapshots that still share this map's bucket array, and the number
+    # of snapshots taken, which _preserved maps bucket indices to once those
+    # buckets have been copied for every snapshot. Created by snapshot().
+    _snapshots = None
+    _snapshot_count = 0
+
+    # Bloom filter of the keys' hashes that lets get and contains_key skip
+    # searching for keys that are definitely absent. Created by
+    # enable_bloom_filter().
+    _bloom = None
+
+    def enable_bloom_filter(self, fp_rate: float = 0.01) -> None:
+        """
+        Keeps a blocked Bloom filter of the HashMap's keys with about the
+        input false-positive rate, so get and contains_key answer most
+        misses without searching the table.
+        """
+        self._bloom_fp_rate = fp_rate
+        self._rebuild_bloom()
+
+    def disable_bloom_filter(self) -> None:
+        """
+        Drops the HashMap's Bloom filter.
+        """
+        self._bloom = None
+
+    def snapshot(self):
+        """
+        Returns a read-only view of the HashMap as it is now. The view shares
+        the HashMap's buckets, and a bucket is only copied when the HashMap
+        first changes it after the snapshot, so a snapshot costs O(changes)
+        rather than O(size). Values changed in place through nodes the
+        HashMap hands out aren't tracked.
+        """
+        if self._snapshots is None:
+            self._snapshots = WeakSet()
+            self._preserved = {}
+        snapshot = self._make_snapshot()
+        self._snapshots.add(snapshot)
+        self._snapshot_count += 1
+        return snapshot
+
+    def iter_lines(self, only_nonempty: bool = True, limit: int = None):
+        """
+        Yields the lines of the HashMap's string output one bucket at a time,
+        skipping empty buckets if only_nonempty and stopping after limit
+        lines if given.
+        """
+        if limit is None:
+            limit = self._capacity
+        remaining = self._occupied if only_nonempty else self._capacity
+        remaining = min(remaining, limit)
+
+        # Stop as soon as every requested bucket has been written.
+        for i in range(self._capacity):
+            if remaining <= 0:
+                return
+            bucket = self._buckets.get_unchecked(i)
+            if only_nonempty and self._is_empty_bucket(bucket):
+                continue
+            yield str(i) + ': ' + str(bucket) + '\n'
+            remaining -= 1
+
+    def write_to(self, fileobj, only_nonempty: bool = True,
+                 limit: int = None) -> int:
+        """
+        Writes the HashMap's string output to fileobj line by line instead of
+        building it in memory. Returns the number of lines written.
+        """
+        written = 0
+        for line in self.iter_lines(only_nonempty, limit):
+            fileobj.write(line)
+            written += 1
+
+        return written
+
+    def summary(self) -> str:
+        """
+        Returns a one line description of the HashMap whose length doesn't
+        depend on its contents, for logging.
+        """
+        return (f"HashMap(size={self._size}, capacity={self._capacity}, "
+                f"load={round(self.table_load(), 2)}, "
+                f"empty_buckets={self.empty_buckets()}"
+                f"{self._summary_extra()})")
+
+    def __repr__(self) -> str:
+        """Return the bounded summary of the HashMap."""
+        return self.summary()
+
+    def _summary_extra(self) -> str:
+        """
+        Returns the layout-specific fields appended to the summary, each
+        starting with ', '.
+        """
+        return ''
+
+    def _add_to_bloom(self, hash: int) -> None:
+        """
+        Adds the hash of a new key to the Bloom filter, rebuilding the filter
+        once more keys have been added than it was sized for.
+        """
+        self._bloom.add(hash)
+        if self._bloom.count > self._bloom.expected:
+            self._rebuild_bloom()
+
+    def _rebuild_bloom(self) -> None:
+        """
+        Replaces the Bloom filter with one holding only the current keys,
+        with room for the HashMap to double in size.
+        """
+        bloom = BlockedBloomFilter(max(2 * self._size, 64), self._bloom_fp_rate)
+        for key in self._live_keys():
+            bloom.add(self._hash_function(key))
+        self._bloom = bloom
+
+    def _release_snapshots(self) -> None:
+        """
+        Stops sharing the bucket array with snapshots, either because the
+        HashMap replaced it or because no snapshot is left.
+        """
+        self._snapshots = None
+        self._preserved = None
+
+    def _preserve(self, index: int) -> None:
+        """
+        Gives the snapshots sharing the bucket array a copy of the bucket at
+        index, unless it was already copied since the latest snapshot. Called
+        before the bucket or what it holds is changed.
+        """
+        # Once every snapshot has been garbage collected nothing needs the
+        # copies, so the map stops preserving buckets.
+        if not self._snapshots:
+            self._release_snapshots()
+            return
+        if self._preserved.get(index) == self._snapshot_count:
+            return
+        self._preserved[index] = self._snapshot_count
+
+        # Snapshots that saved the bucket earlier keep their older copy; the
+        # rest share one copy of it as it is now.
+        copied, copy = False, None
+        for snapshot in self._snapshots:
+            if index not in snapshot._saved:
+                if not copied:
+                    copied, copy = True, self._copy_bucket_at(index)
+                snapshot._saved[index] = copy
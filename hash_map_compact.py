@@ -0,0 +1,316 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Implementation of a hash map using separate chaining with
+#              compact buckets. Empty buckets are None and cost nothing,
+#              and each chain is one flat [key, value, key, value, ...] list
+#              instead of a LinkedList of SLNodes.
+
+
+from a6_include import (DynamicArray, FastDynamicArray, hash_function_1,
+                        hash_function_2)
+from hash_map_base import HashTableBase
+
+
+class CompactHashMap(HashTableBase):
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_function_1) -> None:
+        """
+        Initialize new CompactHashMap that uses separate chaining for
+        collision resolution. Buckets are only allocated once used.
+        """
+        # capacity must be a prime number
+        self._capacity = self._next_prime(capacity)
+        self._buckets = FastDynamicArray(length=self._capacity)
+
+        self._hash_function = function
+        self._size = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._buckets.length()):
+            out += str(i) + ': ' + str(self._buckets[i]) + '\n'
+        return out
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Adds the input key/value pair to a CompactHashMap object.
+        """
+        index = self.calc_index(key)
+        bucket = self._buckets.get_unchecked(index)
+        i = self._find(bucket, key)
+        if i is not None:
+            bucket[i + 1] = value
+        else:
+            self._insert(index, bucket, key, value)
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Returns the value of the input key's entry, first adding the key with
+        the default value if it doesn't exist.
+        """
+        index = self.calc_index(key)
+        bucket = self._buckets.get_unchecked(index)
+        i = self._find(bucket, key)
+        if i is not None:
+            return bucket[i + 1]
+
+        self._insert(index, bucket, key, default)
+        return default
+
+    def compute(self, key: str, function: callable) -> object:
+        """
+        Replaces the value of the input key's entry with function(value),
+        where value is None if the key doesn't exist yet. Returns the new
+        value.
+        """
+        index = self.calc_index(key)
+        bucket = self._buckets.get_unchecked(index)
+        i = self._find(bucket, key)
+        if i is not None:
+            bucket[i + 1] = function(bucket[i + 1])
+            return bucket[i + 1]
+
+        value = function(None)
+        self._insert(index, bucket, key, value)
+        return value
+
+    def increment(self, key: str, delta: int = 1) -> int:
+        """
+        Adds delta to the value of the input key's entry, starting from 0 if
+        the key doesn't exist yet. Returns the new value.
+        """
+        index = self.calc_index(key)
+        bucket = self._buckets.get_unchecked(index)
+        i = self._find(bucket, key)
+        if i is not None:
+            bucket[i + 1] += delta
+            return bucket[i + 1]
+
+        self._insert(index, bucket, key, delta)
+        return delta
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes the entry matching input key and returns its value, or returns
+        default if the key doesn't exist.
+        """
+        index = self.calc_index(key)
+        bucket = self._buckets.get_unchecked(index)
+        i = self._find(bucket, key)
+        if i is None:
+            return default
+
+        value = bucket[i + 1]
+        self._delete(index, bucket, i)
+        return value
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets in a CompactHashMap.
+        """
+        empty = 0
+        for index in range(self._capacity):
+            if self._buckets.get_unchecked(index) is None:
+                empty += 1
+
+        return empty
+
+    def clear(self) -> None:
+        """
+        Clears all entries from a CompactHashMap.
+        """
+        self._buckets = FastDynamicArray(length=self._capacity)
+        self._size = 0
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes the CompactHashMap's capacity to the input capacity. If new
+        capacity is not prime, the next prime is used.
+        """
+        if new_capacity < 1:
+            return
+
+        # Make sure new capacity is prime and make it next nearest prime if
+        # not.
+        if not self._is_prime(new_capacity):
+            new_capacity = self._next_prime(new_capacity)
+
+        # Rehash every key/value pair of the used buckets into the new table,
+        # only allocating the buckets that receive entries.
+        new_buckets = FastDynamicArray(length=new_capacity)
+        for i in range(self._capacity):
+            bucket = self._buckets.get_unchecked(i)
+            if bucket is None:
+                continue
+            for j in range(0, len(bucket), 2):
+                index = self._hash_function(bucket[j]) % new_capacity
+                new_bucket = new_buckets.get_unchecked(index)
+                if new_bucket is None:
+                    new_buckets.set_unchecked(index, [bucket[j], bucket[j + 1]])
+                else:
+                    new_bucket.append(bucket[j])
+                    new_bucket.append(bucket[j + 1])
+
+        self._buckets = new_buckets
+        self._capacity = new_capacity
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry if it exists or None
+        otherwise.
+        """
+        bucket = self._buckets.get_unchecked(self.calc_index(key))
+        i = self._find(bucket, key)
+        if i is not None:
+            return bucket[i + 1]
+
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the input key exists in the CompactHashMap or False
+        otherwise.
+        """
+        if self._size == 0:
+            return False
+
+        bucket = self._buckets.get_unchecked(self.calc_index(key))
+        return self._find(bucket, key) is not None
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the entry matching input key from the CompactHashMap.
+        """
+        index = self.calc_index(key)
+        bucket = self._buckets.get_unchecked(index)
+        i = self._find(bucket, key)
+        if i is not None:
+            self._delete(index, bucket, i)
+
+        return
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the
+        CompactHashMap.
+        """
+        table_array = DynamicArray()
+        for i in range(self._capacity):
+            bucket = self._buckets.get_unchecked(i)
+            if bucket is not None:
+                for j in range(0, len(bucket), 2):
+                    table_array.append((bucket[j], bucket[j + 1]))
+
+        return table_array
+
+    def calc_index(self, key):
+        """
+        Returns the index for a CompactHashMap entry calculated from input key.
+        """
+        index = self._hash_function(key) % self._capacity
+        return index
+
+    @staticmethod
+    def _find(bucket: list, key: str) -> int:
+        """
+        Returns the position of input key in bucket, or None if it's absent.
+        """
+        if bucket is None:
+            return None
+
+        for i in range(0, len(bucket), 2):
+            if bucket[i] == key:
+                return i
+        return None
+
+    def _insert(self, index: int, bucket: list, key: str,
+                value: object) -> None:
+        """
+        Appends a key not yet in the CompactHashMap to the bucket at index,
+        allocating the bucket if it's empty.
+        """
+        self._size += 1
+        if bucket is None:
+            self._buckets.set_unchecked(index, [key, value])
+            return
+
+        bucket.append(key)
+        bucket.append(value)
+        if (self.FLOOD_CHAIN_LENGTH is not None
+                and len(bucket) // 2 > self.FLOOD_CHAIN_LENGTH
+                and len(bucket) // 2 > 4 * self.table_load()):
+            self.reseed()
+
+    def _delete(self, index: int, bucket: list, i: int) -> None:
+        """
+        Removes the key/value pair at position i of the bucket at index,
+        releasing the bucket once it's empty.
+        """
+        self._size -= 1
+        if len(bucket) == 2:
+            self._buckets.set_unchecked(index, None)
+            return
+
+        # Move the last pair into the hole so removal doesn't shift the list.
+        bucket[i] = bucket[-2]
+        bucket[i + 1] = bucket[-1]
+        del bucket[-2:]
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example 1")
+    print("-------------")
+    m = CompactHashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nget / contains_key / remove example 1")
+    print("-------------------------------------")
+    m = CompactHashMap(79, hash_function_2)
+    keys = [i for i in range(1, 1000, 20)]
+    for key in keys:
+        m.put(str(key), key * 42)
+    print(m.get_size(), m.get_capacity())
+    result = True
+    for key in keys:
+        # all inserted keys must be present
+        result &= m.contains_key(str(key)) and m.get(str(key)) == key * 42
+        # NOT inserted keys must be absent
+        result &= not m.contains_key(str(key + 1))
+    print(result)
+    for key in keys[::2]:
+        m.remove(str(key))
+    print(m.get_size(), m.contains_key('1'), m.contains_key('21'))
+
+    print("\nresize / clear example 1")
+    print("------------------------")
+    m = CompactHashMap(11, hash_function_2)
+    for i in range(1, 6):
+        m.put(str(i), str(i * 10))
+    m.resize_table(2)
+    print(m.get_keys_and_values())
+    print(m)
+    m.clear()
+    print(m.get_size(), m.empty_buckets(), m.get_capacity())
+
+    print("\nsetdefault / compute / increment / pop example 1")
+    print("-------------------------------------------------")
+    m = CompactHashMap(53, hash_function_1)
+    print(m.setdefault('key1', 10), m.setdefault('key1', 20), m.get_size())
+    print(m.compute('key1', lambda v: v * 3), m.compute('key2', lambda v: [v]))
+    print(m.increment('key3'), m.increment('key3', 5), m.get('key3'))
+    print(m.pop('key3'), m.pop('key3'), m.pop('key3', 'missing'), m.get_size())
@@ -0,0 +1,400 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Implementation of a hash map using bucketized cuckoo hashing.
+#              Every key lives in one of SLOTS slots of one of two buckets
+#              (or in a small stash), so a lookup touches a constant number
+#              of slots no matter how full the table is.
+
+
+import random
+
+from a6_include import (DynamicArray, FastDynamicArray, SeededHash,
+                        hash_function_1, hash_function_2)
+from hash_map_base import HashTableBase
+
+
+# Constants of the multiplicative mixer used to derive the two bucket
+# indices from one hash value.
+MASK_64 = 2 ** 64 - 1
+GOLDEN_64 = 0x9E3779B97F4A7C15
+
+
+def mix_hash(hash: int, seed: int) -> int:
+    """
+    Returns a 64-bit hash derived from hash and seed, so one hash function
+    can yield several independent-looking bucket indices.
+    """
+    mixed = ((hash ^ seed) * GOLDEN_64) & MASK_64
+    return mixed ^ (mixed >> 29)
+
+
+class CuckooHashMap(HashTableBase):
+    # Slots per bucket, entries the stash may hold and load (entries per
+    # bucket) past which the table doubles.
+    SLOTS = 4
+    STASH_SIZE = 4
+    MAX_LOAD = 3.6
+
+    # Evictions tried before an insert gives up and uses the stash, and
+    # rebuilds with fresh seeds before the map switches to a SeededHash (the
+    # keys' hashes collide outright) and then grows.
+    MAX_KICKS = 100
+    MAX_REHASHES = 3
+
+    def __init__(self, capacity: int, function) -> None:
+        """
+        Initialize new CuckooHashMap with capacity buckets that uses cuckoo
+        hashing for collision resolution
+        """
+        # capacity must be a prime number
+        self._capacity = self._next_prime(capacity)
+        self._hash_function = function
+        self._size = 0
+        self._allocate(self._capacity)
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ""
+        for i in range(self._capacity):
+            entries = []
+            for slot in range(i * self.SLOTS, (i + 1) * self.SLOTS):
+                key = self._keys.get_unchecked(slot)
+                if key is not None:
+                    entries.append(str(key) + ": " + str(self._values[slot]))
+            out += str(i) + ": [" + ", ".join(entries) + "]\n"
+        out += "stash: " + str([entry[1:] for entry in self._stash]) + "\n"
+        return out
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Adds the input key/value pair to a CuckooHashMap object.
+        """
+        hash = self._hash_function(key)
+        slot = self._find_slot(key, hash)
+        if slot is not None:
+            self._values.set_unchecked(slot, value)
+            return
+
+        i = self._find_stash(key)
+        if i is not None:
+            self._stash[i] = (hash, key, value)
+            return
+
+        # Double the table if it's too full; the hash function may change
+        # when the table is rebuilt.
+        if self._size + 1 > self._capacity * self.MAX_LOAD:
+            self.resize_table(self._capacity * 2)
+            hash = self._hash_function(key)
+
+        self._size += 1
+        homeless = self._place(hash, key, value)
+        if homeless is not None:
+            self._stash.append(homeless)
+            if len(self._stash) > self.STASH_SIZE:
+                self._rebuild(self._capacity)
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of buckets with no entries in a CuckooHashMap.
+        """
+        empty = 0
+        for i in range(self._capacity):
+            for slot in range(i * self.SLOTS, (i + 1) * self.SLOTS):
+                if self._keys.get_unchecked(slot) is not None:
+                    break
+            else:
+                empty += 1
+
+        return empty
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes a CuckooHashMap object's capacity to the input number of
+        buckets. Adjusts the new capacity to a prime number if it is not.
+        """
+        if new_capacity * self.SLOTS < self._size:
+            return
+
+        # Make sure new capacity is prime and make it next nearest prime if
+        # not.
+        if not self._is_prime(new_capacity):
+            new_capacity = self._next_prime(new_capacity)
+
+        self._rebuild(new_capacity)
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry or None if it doesn't exist.
+        """
+        slot = self._find_slot(key, self._hash_function(key))
+        if slot is not None:
+            return self._values.get_unchecked(slot)
+
+        i = self._find_stash(key)
+        if i is not None:
+            return self._stash[i][2]
+
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if input key is contained in the CuckooHashMap, False
+        otherwise.
+        """
+        if self._size == 0:
+            return False
+
+        if self._find_slot(key, self._hash_function(key)) is not None:
+            return True
+
+        return self._find_stash(key) is not None
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the entry matching the input key from the CuckooHashMap.
+        """
+        slot = self._find_slot(key, self._hash_function(key))
+        if slot is not None:
+            self._hashes.set_unchecked(slot, 0)
+            self._keys.set_unchecked(slot, None)
+            self._values.set_unchecked(slot, None)
+            self._size -= 1
+            self._drain_stash()
+            return
+
+        i = self._find_stash(key)
+        if i is not None:
+            del self._stash[i]
+            self._size -= 1
+
+        return
+
+    def clear(self) -> None:
+        """
+        Clears the CuckooHashMap of all entries.
+        """
+        self._allocate(self._capacity)
+        self._size = 0
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the
+        CuckooHashMap.
+        """
+        table_array = DynamicArray()
+        for slot in range(self._keys.length()):
+            key = self._keys.get_unchecked(slot)
+            if key is not None:
+                table_array.append((key, self._values.get_unchecked(slot)))
+        for hash, key, value in self._stash:
+            table_array.append((key, value))
+
+        return table_array
+
+    def calc_indices(self, hash: int) -> (int, int):
+        """
+        Returns the two bucket indices for a CuckooHashMap entry calculated
+        from the hash of its key.
+        """
+        return (mix_hash(hash, self._seeds[0]) % self._capacity,
+                mix_hash(hash, self._seeds[1]) % self._capacity)
+
+    def _rehash_keys(self) -> None:
+        """
+        Recomputes the stored hash of every entry with the hash function.
+        """
+        for slot in range(self._keys.length()):
+            key = self._keys.get_unchecked(slot)
+            if key is not None:
+                self._hashes.set_unchecked(slot, self._hash_function(key))
+        self._stash = [(self._hash_function(key), key, value)
+                       for hash, key, value in self._stash]
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replaces the table with an empty one of capacity buckets and draws
+        new seeds for the bucket indices.
+        """
+        slots = capacity * self.SLOTS
+        self._hashes = FastDynamicArray(length=slots, value=0)
+        self._keys = FastDynamicArray(length=slots)
+        self._values = FastDynamicArray(length=slots)
+        self._stash = []
+        self._seeds = (random.getrandbits(64), random.getrandbits(64))
+        self._capacity = capacity
+
+    def _find_slot(self, key: str, hash: int) -> int:
+        """
+        Returns the slot holding input key in either of its buckets, or None.
+        """
+        for bucket in self.calc_indices(hash):
+            for slot in range(bucket * self.SLOTS, (bucket + 1) * self.SLOTS):
+                if (self._hashes.get_unchecked(slot) == hash
+                        and self._keys.get_unchecked(slot) == key):
+                    return slot
+        return None
+
+    def _find_stash(self, key: str) -> int:
+        """
+        Returns the position of input key in the stash, or None.
+        """
+        for i in range(len(self._stash)):
+            if self._stash[i][1] == key:
+                return i
+        return None
+
+    def _free_slot(self, bucket: int) -> int:
+        """
+        Returns an empty slot of bucket, or None if the bucket is full.
+        """
+        for slot in range(bucket * self.SLOTS, (bucket + 1) * self.SLOTS):
+            if self._keys.get_unchecked(slot) is None:
+                return slot
+        return None
+
+    def _set_slot(self, slot: int, hash: int, key: str, value: object) -> None:
+        """
+        Writes an entry into slot.
+        """
+        self._hashes.set_unchecked(slot, hash)
+        self._keys.set_unchecked(slot, key)
+        self._values.set_unchecked(slot, value)
+
+    def _place(self, hash: int, key: str, value: object) -> tuple:
+        """
+        Places an entry in one of its buckets, evicting entries to their other
+        bucket as needed. Returns the (hash, key, value) entry left without a
+        slot after MAX_KICKS evictions, or None if everything fit.
+        """
+        first, second = self.calc_indices(hash)
+        slot = self._free_slot(first)
+        if slot is None:
+            slot = self._free_slot(second)
+        if slot is not None:
+            self._set_slot(slot, hash, key, value)
+            return None
+
+        # Both buckets are full: swap the entry with a random victim and move
+        # the victim to its other bucket, repeating until one fits.
+        bucket = random.choice((first, second))
+        for _ in range(self.MAX_KICKS):
+            slot = bucket * self.SLOTS + random.randrange(self.SLOTS)
+            victim = (self._hashes.get_unchecked(slot),
+                      self._keys.get_unchecked(slot),
+                      self._values.get_unchecked(slot))
+            self._set_slot(slot, hash, key, value)
+            hash, key, value = victim
+
+            first, second = self.calc_indices(hash)
+            bucket = second if bucket == first else first
+            slot = self._free_slot(bucket)
+            if slot is not None:
+                self._set_slot(slot, hash, key, value)
+                return None
+
+        return hash, key, value
+
+    def _drain_stash(self) -> None:
+        """
+        Moves stashed entries into their buckets where a slot has freed up.
+        """
+        for i in range(len(self._stash) - 1, -1, -1):
+            hash, key, value = self._stash[i]
+            for bucket in self.calc_indices(hash):
+                slot = self._free_slot(bucket)
+                if slot is not None:
+                    self._set_slot(slot, hash, key, value)
+                    del self._stash[i]
+                    break
+
+    def _rebuild(self, capacity: int) -> None:
+        """
+        Reinserts every entry into a new table of capacity buckets, retrying
+        with new seeds, then a SeededHash, then a larger table until all
+        entries fit with the stash no more than STASH_SIZE.
+        """
+        entries = list(self._stash)
+        for slot in range(self._keys.length()):
+            key = self._keys.get_unchecked(slot)
+            if key is not None:
+                entries.append((self._hashes.get_unchecked(slot), key,
+                                self._values.get_unchecked(slot)))
+
+        attempts = 0
+        while True:
+            self._allocate(capacity)
+            for hash, key, value in entries:
+                homeless = self._place(hash, key, value)
+                if homeless is not None:
+                    self._stash.append(homeless)
+                    if len(self._stash) > self.STASH_SIZE:
+                        break
+            else:
+                return
+
+            attempts += 1
+            if attempts == self.MAX_REHASHES:
+                self._hash_function = SeededHash()
+                entries = [(self._hash_function(key), key, value)
+                           for hash, key, value in entries]
+            elif attempts > self.MAX_REHASHES:
+                capacity = self._next_prime(capacity * 2)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example 1")
+    print("-------------")
+    m = CuckooHashMap(53, hash_function_2)
+    for i in range(150):
+        m.put("str" + str(i), i * 100)
+        if i % 25 == 24:
+            print(round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nget / contains_key / remove example 1")
+    print("-------------------------------------")
+    m = CuckooHashMap(11, hash_function_2)
+    keys = [i for i in range(1, 1000, 20)]
+    for key in keys:
+        m.put(str(key), key * 42)
+    print(m.get_size(), m.get_capacity())
+    result = True
+    for key in keys:
+        # all inserted keys must be present
+        result &= m.contains_key(str(key)) and m.get(str(key)) == key * 42
+        # NOT inserted keys must be absent
+        result &= not m.contains_key(str(key + 1))
+    print(result)
+    for key in keys[::2]:
+        m.remove(str(key))
+    print(m.get_size(), m.contains_key("1"), m.contains_key("21"))
+
+    print("\ncolliding keys example 1")
+    print("------------------------")
+    from itertools import permutations
+    m = CuckooHashMap(11, hash_function_1)
+    anagrams = ["".join(p) for p in permutations("abcde")]
+    for i, key in enumerate(anagrams):
+        m.put(key, i)
+    print(m.get_size(), isinstance(m._hash_function, SeededHash))
+    print(m.get("edcba"), m.contains_key("abcdf"))
+
+    print("\nresize / clear example 1")
+    print("------------------------")
+    m = CuckooHashMap(11, hash_function_2)
+    for i in range(1, 6):
+        m.put(str(i), str(i * 10))
+    m.resize_table(2)
+    kv = m.get_keys_and_values()
+    print(m.get_size(), m.get_capacity(), sorted(kv[i] for i in range(kv.length())))
+    m.clear()
+    print(m.get_size(), m.empty_buckets(), m.get_capacity())
@@ -0,0 +1,326 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Durable hash map on top of the separate chaining HashMap. Every
+#              put and clear is appended to a write-ahead log before it is
+#              applied, and every remove that found its key right after, the
+#              map is checkpointed to a snapshot file now and then, and both
+#              are replayed when the map is reopened.
+
+
+import os
+import pickle
+import struct
+from zlib import crc32
+
+from a6_include import DynamicArray, as_list, hash_function_1, hash_function_2
+from hash_map_sc import HashMap
+
+
+# Log record header: payload length and CRC-32 of the payload.
+HEADER = struct.Struct('<II')
+
+# Operation codes of log records.
+PUT = 'p'
+REMOVE = 'r'
+CLEAR = 'c'
+
+# Sync policies: fsync after every record, after every batch of records
+# (group commit), or never (left to the operating system).
+SYNC_ALWAYS = 'always'
+SYNC_BATCH = 'batch'
+SYNC_NONE = 'none'
+
+# Returned by pop for a key that doesn't exist.
+_MISSING = object()
+
+
+def encode_record(record: tuple) -> bytes:
+    """
+    Returns the bytes of a log record: a header followed by the pickled
+    record.
+    """
+    payload = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+    return HEADER.pack(len(payload), crc32(payload)) + payload
+
+
+def read_records(fileobj):
+    """
+    Yields (record, end offset) for each complete, intact record of a log
+    file, stopping at the first torn or corrupt one.
+    """
+    offset = 0
+    while True:
+        header = fileobj.read(HEADER.size)
+        if len(header) < HEADER.size:
+            return
+        length, checksum = HEADER.unpack(header)
+        payload = fileobj.read(length)
+        if len(payload) < length or crc32(payload) != checksum:
+            return
+        offset += HEADER.size + length
+        yield pickle.loads(payload), offset
+
+
+class DurableHashMap:
+    def __init__(self,
+                 path: str,
+                 capacity: int = 11,
+                 function: callable = hash_function_1,
+                 sync: str = SYNC_BATCH,
+                 batch_size: int = 64,
+                 checkpoint_every: int = 10000) -> None:
+        """
+        Initialize new DurableHashMap stored in path + '.snapshot' and
+        path + '.log', recovering any state left there. With sync 'batch',
+        records are written and fsynced batch_size at a time, so the last
+        unflushed batch can be lost in a crash; call flush() to make writes
+        durable. A checkpoint is taken every checkpoint_every log records,
+        or never if it is None.
+        """
+        if sync not in (SYNC_ALWAYS, SYNC_BATCH, SYNC_NONE):
+            raise ValueError("unknown sync policy: " + str(sync))
+
+        self._map = HashMap(capacity, function)
+        self._snapshot_path = path + '.snapshot'
+        self._log_path = path + '.log'
+        self._sync = sync
+        self._batch_size = batch_size
+        self._checkpoint_every = checkpoint_every
+        self._pending = []
+        self._log_records = 0
+
+        self._recover()
+        self._log = open(self._log_path, 'ab')
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        return str(self._map)
+
+    def __enter__(self) -> "DurableHashMap":
+        """Return the map for use in a with statement."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the map at the end of a with statement."""
+        self.close()
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._map.get_size()
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._map.get_capacity()
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Logs and then adds the input key/value pair to the DurableHashMap.
+        """
+        self._append((PUT, key, value))
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the entry matching input key, if it exists, and logs the
+        removal.
+        """
+        # A key that wasn't there leaves nothing to log or replay.
+        if self._map.pop(key, _MISSING) is _MISSING:
+            return
+
+        self._append((REMOVE, key), applied=True)
+
+    def clear(self) -> None:
+        """
+        Logs and then clears all entries from the DurableHashMap.
+        """
+        self._append((CLEAR,))
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry if it exists or None
+        otherwise.
+        """
+        return self._map.get(key)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the input key exists in the DurableHashMap or False
+        otherwise.
+        """
+        return self._map.contains_key(key)
+
+    def table_load(self) -> float:
+        """
+        Returns the current load factor of the DurableHashMap.
+        """
+        return self._map.table_load()
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets in the DurableHashMap.
+        """
+        return self._map.empty_buckets()
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes the DurableHashMap's capacity to the input capacity. The
+        capacity isn't logged; it only affects the in-memory table.
+        """
+        self._map.resize_table(new_capacity)
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the
+        DurableHashMap.
+        """
+        return self._map.get_keys_and_values()
+
+    def flush(self) -> None:
+        """
+        Writes any batched log records and fsyncs the log (unless the sync
+        policy is 'none'), making every earlier change durable.
+        """
+        if self._pending:
+            self._log.write(b''.join(self._pending))
+            self._pending = []
+        self._log.flush()
+        if self._sync != SYNC_NONE:
+            os.fsync(self._log.fileno())
+
+    def checkpoint(self) -> None:
+        """
+        Writes the whole map to the snapshot file and empties the log. The
+        snapshot replaces the old one atomically. A crash before the log is
+        emptied replays it over the new snapshot, which gives the same map,
+        since replaying a log over its own result changes nothing.
+        """
+        self.flush()
+        pairs = as_list(self._map.get_keys_and_values())
+        temp_path = self._snapshot_path + '.tmp'
+        with open(temp_path, 'wb') as fileobj:
+            fileobj.write(encode_record(pairs))
+            fileobj.flush()
+            os.fsync(fileobj.fileno())
+        os.replace(temp_path, self._snapshot_path)
+
+        # Records before the snapshot are no longer needed.
+        self._log.truncate(0)
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._log_records = 0
+
+    def close(self) -> None:
+        """
+        Flushes the log and closes it. The map can't be changed afterwards.
+        """
+        if not self._log.closed:
+            self.flush()
+            self._log.close()
+
+    def _append(self, record: tuple, applied: bool = False) -> None:
+        """
+        Appends a record to the log following the sync policy and applies
+        it, unless it was already applied, taking a checkpoint once enough
+        records have been logged.
+        """
+        self._pending.append(encode_record(record))
+        if self._sync == SYNC_ALWAYS or len(self._pending) >= self._batch_size:
+            self.flush()
+        if not applied:
+            self._apply(record)
+
+        self._log_records += 1
+        if (self._checkpoint_every is not None
+                and self._log_records >= self._checkpoint_every):
+            self.checkpoint()
+
+    def _apply(self, record: tuple) -> None:
+        """
+        Applies the operation of a log record to the in-memory map.
+        """
+        if record[0] == PUT:
+            self._map.put(record[1], record[2])
+        elif record[0] == REMOVE:
+            self._map.remove(record[1])
+        else:
+            self._map.clear()
+
+    def _recover(self) -> None:
+        """
+        Loads the snapshot file and replays the log on top of it. A torn or
+        corrupt record at the end of the log (from a crash mid-write) and
+        everything after it is discarded.
+        """
+        if os.path.exists(self._snapshot_path):
+            with open(self._snapshot_path, 'rb') as fileobj:
+                for pairs, end in read_records(fileobj):
+                    for key, value in pairs:
+                        self._map.put(key, value)
+
+        if not os.path.exists(self._log_path):
+            return
+
+        valid = 0
+        with open(self._log_path, 'rb') as fileobj:
+            for record, valid in read_records(fileobj):
+                self._apply(record)
+                self._log_records += 1
+
+        if valid != os.path.getsize(self._log_path):
+            with open(self._log_path, 'r+b') as fileobj:
+                fileobj.truncate(valid)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    import tempfile
+
+    print("\nput / remove / reopen example 1")
+    print("-------------------------------")
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'store')
+    with DurableHashMap(path, 53, hash_function_1) as m:
+        for i in range(10):
+            m.put('key' + str(i), i)
+        m.remove('key3')
+        m.remove('missing')
+        m.put('key1', 100)
+    m = DurableHashMap(path, 53, hash_function_1)
+    print(m.get_size(), m.get('key1'), m.get('key3'), m.get('key9'))
+
+    print("\ncheckpoint / clear example 1")
+    print("----------------------------")
+    m.checkpoint()
+    print(os.path.getsize(path + '.log'), os.path.getsize(path + '.snapshot') > 0)
+    m.clear()
+    m.put('after', 'clear')
+    m.close()
+    m = DurableHashMap(path, 53, hash_function_2, sync=SYNC_ALWAYS)
+    print(m.get_size(), m.get('key1'), m.get('after'))
+
+    print("\ntorn write example 1")
+    print("--------------------")
+    m.put('last', 'write')
+    m.close()
+    with open(path + '.log', 'ab') as fileobj:
+        fileobj.write(encode_record((PUT, 'torn', 1))[:-3])
+    m = DurableHashMap(path, 53, hash_function_1)
+    print(m.get_size(), m.get('last'), m.contains_key('torn'))
+    m.put('next', 'write')
+    m.close()
+    m = DurableHashMap(path, 53, hash_function_1)
+    print(m.get_size(), m.get('next'))
+    m.close()
@@ -0,0 +1,224 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Read-only hash map built once from key/value pairs using a
+#              minimal perfect hash (CHD, "compress, hash and displace"). The
+#              n keys fill exactly n slots, and a lookup reads a single slot.
+
+
+from array import array
+
+from a6_include import DynamicArray, FastDynamicArray, SeededHash, as_list
+
+
+class FrozenHashMap:
+    # Average number of keys per displacement bucket. Larger buckets mean a
+    # smaller displacement table but a slower build.
+    BUCKET_SIZE = 2
+
+    # Displacements tried for one bucket before the build starts over with a
+    # new seed.
+    MAX_DISPLACEMENTS = 100000
+
+    def __init__(self, pairs, seed: int = None) -> None:
+        """
+        Initialize new FrozenHashMap holding the input key/value pairs, a
+        DynamicArray as returned by get_keys_and_values or any iterable. A key
+        given more than once keeps its last value, as with put.
+        """
+        # Keep the last value of each key, in first-seen order.
+        values = {}
+        for key, value in as_list(pairs):
+            values[key] = value
+
+        self._size = len(values)
+        self._buckets = max(1, -(-self._size // self.BUCKET_SIZE))
+        self._keys = FastDynamicArray(length=self._size)
+        self._values = FastDynamicArray(length=self._size)
+        self._hashes = array('Q', [0]) * self._size
+        self._d0 = array('I', [0]) * self._buckets
+        self._d1 = array('I', [0]) * self._buckets
+
+        self._hash_function = SeededHash(seed)
+        while not self._build(values):
+            self._hash_function = SeededHash()
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ""
+        for i in range(self._size):
+            out += (str(i) + ": " + str(self._keys.get_unchecked(i)) + ": "
+                    + str(self._values.get_unchecked(i)) + "\n")
+        return out
+
+    def __iter__(self):
+        """
+        Return an iterator over the keys of the map.
+        """
+        return iter(self._keys)
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map, which is its size
+        """
+        return self._size
+
+    # ------------------------------------------------------------------ #
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry or None if it doesn't exist.
+        """
+        if self._size == 0:
+            return None
+
+        hash = self._hash_function(key)
+        slot = self._slot(hash)
+        if self._hashes[slot] == hash and self._keys.get_unchecked(slot) == key:
+            return self._values.get_unchecked(slot)
+
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if input key is contained in the FrozenHashMap, False
+        otherwise.
+        """
+        if self._size == 0:
+            return False
+
+        hash = self._hash_function(key)
+        slot = self._slot(hash)
+        return self._hashes[slot] == hash and self._keys.get_unchecked(slot) == key
+
+    def table_load(self) -> float:
+        """
+        Returns the load factor of a FrozenHashMap object, which is always 1
+        unless it is empty.
+        """
+        return 1.0 if self._size else 0.0
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty slots in a FrozenHashMap, which is 0.
+        """
+        return 0
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the
+        FrozenHashMap.
+        """
+        table_array = DynamicArray()
+        for i in range(self._size):
+            table_array.append((self._keys.get_unchecked(i),
+                                self._values.get_unchecked(i)))
+
+        return table_array
+
+    def _slot(self, hash: int) -> int:
+        """
+        Returns the slot of a key with the input hash: its bucket's
+        displacement applied to two values taken from higher hash bits.
+        """
+        bucket = hash % self._buckets
+        h1 = (hash >> 20) % self._size
+        h2 = (hash >> 40) % self._size
+        return (h1 + self._d0[bucket] * h2 + self._d1[bucket]) % self._size
+
+    def _build(self, values: dict) -> bool:
+        """
+        Finds a displacement for every bucket so that all keys land in
+        distinct slots, and fills the slots. Returns False if the hash
+        function can't tell two keys apart or a bucket can't be placed.
+        """
+        n, buckets = self._size, self._buckets
+        hashed = [(self._hash_function(key), key) for key in values]
+        if len(set(hash for hash, key in hashed)) != n:
+            return False
+
+        groups = [[] for _ in range(buckets)]
+        for hash, key in hashed:
+            groups[hash % buckets].append(hash)
+
+        # Place the largest buckets first, while most slots are free.
+        taken = bytearray(n)
+        order = sorted(range(buckets), key=lambda b: len(groups[b]), reverse=True)
+        free = None
+        for b in order:
+            group = groups[b]
+            if not group:
+                break
+
+            if len(group) == 1:
+                # A lone key can go straight to any free slot.
+                if free is None:
+                    free = [slot for slot in range(n) if not taken[slot]]
+                slot = free.pop()
+                hash = group[0]
+                self._d0[b] = 0
+                self._d1[b] = (slot - (hash >> 20)) % n
+                continue
+
+            pairs = [((hash >> 20) % n, (hash >> 40) % n) for hash in group]
+            for d in range(self.MAX_DISPLACEMENTS):
+                d0, d1 = divmod(d, n)
+                slots = {(h1 + d0 * h2 + d1) % n for h1, h2 in pairs}
+                if len(slots) == len(group) and not any(taken[s] for s in slots):
+                    break
+            else:
+                return False
+
+            for slot in slots:
+                taken[slot] = 1
+            self._d0[b] = d0
+            self._d1[b] = d1
+
+        for hash, key in hashed:
+            slot = self._slot(hash)
+            self._keys.set_unchecked(slot, key)
+            self._values.set_unchecked(slot, values[key])
+            self._hashes[slot] = hash
+        return True
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    from hash_map_oa import HashMap
+    from a6_include import hash_function_2
+
+    print("\nbuild / get example 1")
+    print("---------------------")
+    m = FrozenHashMap([('str' + str(i), i * 100) for i in range(150)], 1)
+    print(m.get_size(), m.get_capacity(), m.table_load(), m.empty_buckets())
+    result = True
+    for i in range(150):
+        # all keys must be present
+        result &= m.contains_key('str' + str(i)) and m.get('str' + str(i)) == i * 100
+        # NOT given keys must be absent
+        result &= not m.contains_key('str' + str(i + 150))
+    print(result, m.get('missing'))
+
+    print("\nfrom get_keys_and_values example 1")
+    print("----------------------------------")
+    source = HashMap(11, hash_function_2)
+    for i in range(1, 6):
+        source.put(str(i), str(i * 10))
+    m = FrozenHashMap(source.get_keys_and_values(), 1)
+    print(sorted(m), m.get('3'), m.get('30'))
+    m = FrozenHashMap([('a', 1), ('b', 2), ('a', 3)], 1)
+    print(m.get_size(), m.get('a'), m.get('b'))
+    m = FrozenHashMap([])
+    print(m.get_size(), m.get('a'), m.contains_key('a'), m.get_keys_and_values())
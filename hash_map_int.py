@@ -0,0 +1,357 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Implementation of a hash map specialized for integer keys and
+#              values using open addressing. Keys and values are stored in
+#              typed arrays instead of HashEntry objects, the capacity is a
+#              power of two, and keys are hashed by Fibonacci hashing.
+
+
+from array import array
+
+from a6_include import DynamicArray
+
+
+# 2**64 divided by the golden ratio. Multiplying by it mixes every bit of a
+# key into the high bits of the product, which pick the slot.
+FIBONACCI = 11400714819323198485
+MASK_64 = (1 << 64) - 1
+
+# Slot states.
+EMPTY = 0
+FULL = 1
+TOMBSTONE = 2
+
+
+class IntHashMap:
+    def __init__(self, capacity: int = 16) -> None:
+        """
+        Initialize new IntHashMap. Keys and values must be integers that fit
+        in 64 bits. Capacity is rounded up to a power of two.
+        """
+        self._allocate(self._next_power_of_two(capacity))
+        self._size = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ""
+        for i in range(self._capacity):
+            if self._states[i] == FULL:
+                out += str(i) + ": " + str(self._keys[i]) + ": " + str(self._values[i]) + "\n"
+        return out
+
+    def __iter__(self):
+        """
+        Return an iterator over the keys of the map.
+        """
+        return (self._keys[i] for i in range(self._capacity)
+                if self._states[i] == FULL)
+
+    @staticmethod
+    def _next_power_of_two(capacity: int) -> int:
+        """
+        Return the smallest power of two at least capacity
+        """
+        return 1 << max(capacity - 1, 0).bit_length()
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: int, value: int) -> None:
+        """
+        Adds the input key/value pair to an IntHashMap object.
+        """
+        index, found = self._probe_for_insert(key)
+        if found:
+            self._values[index] = value
+        else:
+            self._store(index, key, value)
+
+    def increment(self, key: int, delta: int = 1) -> int:
+        """
+        Adds delta to the value of the input key's entry, starting from 0 if
+        the key doesn't exist yet. Returns the new value.
+        """
+        index, found = self._probe_for_insert(key)
+        if found:
+            self._values[index] += delta
+            return self._values[index]
+
+        self._store(index, key, delta)
+        return delta
+
+    def increment_all(self, keys) -> None:
+        """
+        Adds 1 to the value of every key in the input iterable, starting from
+        0 for new keys. Same as calling increment for each key, with the
+        probe written out in the loop. Raises TypeError at the first key that
+        isn't an int; the keys before it have been counted.
+        """
+        states, stored, values = self._states, self._keys, self._values
+        mask, shift = self._capacity - 1, self._shift
+        for key in keys:
+            if type(key) is not int:
+                raise TypeError('IntHashMap key must be an int: ' + repr(key))
+
+            # Resize (or just clear out tombstones) before the new key would
+            # fill over half the slots.
+            if (self._occupied + 1) * 2 > self._capacity:
+                self._grow()
+                states, stored, values = self._states, self._keys, self._values
+                mask, shift = self._capacity - 1, self._shift
+
+            index = ((key * FIBONACCI) & MASK_64) >> shift
+            j = 1
+            while states[index] != EMPTY:
+                if states[index] == FULL and stored[index] == key:
+                    values[index] += 1
+                    break
+                index = (index + j) & mask
+                j += 1
+            else:
+                # No tombstone is reused here, which only leaves the next
+                # resize more to clear out.
+                self._store(index, key, 1)
+
+    def table_load(self) -> float:
+        """
+        Returns the load factor of an IntHashMap object.
+        """
+        return float(self.get_size() / self.get_capacity())
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty slots in an IntHashMap object.
+        """
+        return self._capacity - self._occupied
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes an IntHashMap object's capacity to the input capacity,
+        rounded up to a power of two. Does nothing if the capacity is
+        smaller than the size.
+        """
+        if new_capacity < self._size:
+            return
+
+        # Keep the map at most half full, so probes always reach an empty slot.
+        new_capacity = self._next_power_of_two(new_capacity)
+        while self._size * 2 > new_capacity:
+            new_capacity *= 2
+
+        states, keys, values = self._states, self._keys, self._values
+        self._allocate(new_capacity)
+        self._size = 0
+        for i in range(len(states)):
+            if states[i] == FULL:
+                index, found = self._probe(keys[i])
+                self._store(index, keys[i], values[i])
+
+    def get(self, key: int) -> int:
+        """
+        Returns the value of the input key's entry or None if it doesn't exist.
+        """
+        index, found = self._probe(key)
+        if found:
+            return self._values[index]
+
+        return None
+
+    def contains_key(self, key: int) -> bool:
+        """
+        Returns True if input key is contained in the IntHashMap, False
+        otherwise.
+        """
+        return self._probe(key)[1]
+
+    def remove(self, key: int) -> None:
+        """
+        Removes the entry matching the input key from the IntHashMap.
+        """
+        index, found = self._probe(key)
+        if found:
+            self._states[index] = TOMBSTONE
+            self._size -= 1
+
+    def clear(self) -> None:
+        """
+        Clears the IntHashMap of all entries.
+        """
+        self._allocate(self._capacity)
+        self._size = 0
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the
+        IntHashMap.
+        """
+        table_array = DynamicArray()
+        for i in range(self._capacity):
+            if self._states[i] == FULL:
+                table_array.append((self._keys[i], self._values[i]))
+
+        return table_array
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replaces the slot arrays with empty ones for capacity slots.
+        """
+        self._capacity = capacity
+        self._shift = 64 - (capacity.bit_length() - 1)
+        self._states = bytearray(capacity)
+        self._keys = array('q', [0]) * capacity
+        self._values = array('q', [0]) * capacity
+        self._occupied = 0
+
+    def _grow(self) -> None:
+        """
+        Doubles the capacity, or only rehashes to clear out tombstones if
+        most of the occupied slots are tombstones.
+        """
+        if (self._size + 1) * 4 > self._capacity:
+            self.resize_table(self._capacity * 2)
+        else:
+            self.resize_table(self._capacity)
+
+    def _store(self, index: int, key: int, value: int) -> None:
+        """
+        Fills the slot at index, which must not hold a key, with the input
+        key/value pair.
+        """
+        # The arrays raise OverflowError for numbers that don't fit in 64
+        # bits, which must leave the slot and counts as they were.
+        self._keys[index] = key
+        self._values[index] = value
+        if self._states[index] == EMPTY:
+            self._occupied += 1
+        self._states[index] = FULL
+        self._size += 1
+
+    def _probe_for_insert(self, key: int) -> (int, bool):
+        """
+        Same as _probe, but first makes room for a new key.
+        """
+        if (self._occupied + 1) * 2 > self._capacity:
+            self._grow()
+        return self._probe(key)
+
+    def _probe(self, key: int) -> (int, bool):
+        """
+        Returns a tuple of 1) the index of the slot holding input key, or the
+        index a new key should be placed at, and 2) whether the key was found.
+        """
+        states, keys, mask = self._states, self._keys, self._capacity - 1
+        index = ((key * FIBONACCI) & MASK_64) >> self._shift
+        tombstone_i = None
+        j = 1
+
+        # Probe by triangular numbers (1, 3, 6, ...), which reach every slot
+        # of a power-of-two table.
+        while states[index] != EMPTY:
+            if states[index] == TOMBSTONE:
+                if tombstone_i is None:
+                    tombstone_i = index
+            elif keys[index] == key:
+                return index, True
+            index = (index + j) & mask
+            j += 1
+
+        if tombstone_i is not None:
+            return tombstone_i, False
+        return index, False
+
+
+def find_mode(values, size: int = None) -> (DynamicArray, int):
+    """
+    Returns a tuple of 1) an array of the highest occurrence values in the
+    input list (or iterable of size values) of ints and 2) the number of
+    occurrences of those values. Raises TypeError for a value that isn't an
+    int and OverflowError for one that doesn't fit in 64 bits.
+    """
+    map = IntHashMap((len(values) if size is None else size) // 4)
+    map.increment_all(values)
+
+    mode_arr = DynamicArray()
+    count = 0
+    keys, counts, states = map._keys, map._values, map._states
+    for i in range(map.get_capacity()):
+        if states[i] != FULL:
+            continue
+        if counts[i] == count:
+            mode_arr.append(keys[i])
+        if counts[i] > count:
+            mode_arr = DynamicArray()
+            mode_arr.append(keys[i])
+            count = counts[i]
+
+    return mode_arr, count
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example 1")
+    print("-------------")
+    m = IntHashMap(50)
+    for i in range(150):
+        m.put(i * 1000, i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nget / contains_key / remove example 1")
+    print("-------------------------------------")
+    m = IntHashMap()
+    keys = [i for i in range(-990, 1000, 20)]
+    for key in keys:
+        m.put(key, key * 42)
+    print(m.get_size(), m.get_capacity())
+    result = True
+    for key in keys:
+        # all inserted keys must be present
+        result &= m.contains_key(key) and m.get(key) == key * 42
+        # NOT inserted keys must be absent
+        result &= not m.contains_key(key + 1)
+    print(result)
+    for key in keys[::2]:
+        m.remove(key)
+    print(m.get_size(), m.contains_key(-990), m.contains_key(-970), m.get(-990))
+
+    print("\nincrement / resize / clear example 1")
+    print("------------------------------------")
+    m = IntHashMap(4)
+    for key in (3, 1, 3, 2 ** 62, 3, -1):
+        m.increment(key)
+    m.increment_all([-1, 2 ** 62, 7])
+    print(sorted((key, m.get(key)) for key in m), m.get_capacity())
+    m.resize_table(64)
+    print(m.get(3), m.get(2 ** 62), m.get_capacity())
+    print(m)
+    m.clear()
+    print(m.get_size(), m.empty_buckets(), m.get(3))
+
+    print("\nfind_mode example 1")
+    print("-------------------")
+    test_cases = (
+        [1, 1, 2, 3, 3, 4],
+        [5, -5, 5, -5, 5, 2 ** 63 - 1],
+        [7],
+    )
+    for case in test_cases:
+        mode, frequency = find_mode(case)
+        print(f"Input: {case}\nMode : {mode}, Frequency: {frequency}\n")
@@ -6,10 +6,21 @@
 # Description: Implementation of a hash map using open addressing.
 
 
-from a6_include import DynamicArray, HashEntry, hash_function_1, hash_function_2
+from a6_include import (BlockedBloomFilter, DynamicArray, FastArrayAttribute,
+                        FastDynamicArray, GenerationArray, HashEntry,
+                        SeededHash, as_list, hash_function_1, hash_function_2)
+from hash_map_base import HashMapMixin, HashTableBase
 
 
-class HashMap:
+class HashMap(HashMapMixin, HashTableBase):
+    # The DynamicArray of buckets built by __init__ is stored as a
+    # FastDynamicArray, whose unchecked accessors the hot paths use.
+    _buckets = FastArrayAttribute()
+
+    # Number of non-None buckets (entries and tombstones), kept up to date by
+    # every insert so empty_buckets() doesn't scan the table.
+    _occupied = 0
+
     def __init__(self, capacity: int, function) -> None:
         """
         Initialize new HashMap that uses
@@ -89,43 +100,138 @@ class HashMap:
         """
         Adds the input key/value pair to a HashMap object.
         """
-        # Resize table if load factor >= .5.
-        if self.table_load() >= 0.5:
-            self.resize_table(self._capacity * 2)
-
-        index_init = self.calc_index(key)
-        index = self.calc_index(key)
-        entry = self._buckets[index]
-        tombstone_i = None
-        j = 1
+        self._put_hashed(key, value, None)
 
-        # Probe through used buckets until None, marking first tombstone if
-        # existent. If a matching key is found, replace old value with new
-        # and make proper adjustments if the entry was a tombstone.
-        while entry:
-            if entry.key == key:
-                entry.value = value
-                if entry.is_tombstone:
-                    entry.is_tombstone = False
-                    self._size += 1
-                return
-            if entry.is_tombstone:
-                tombstone_i = index
-            index = (index_init + j ** 2) % self._capacity
-            entry = self._buckets[index]
-            j += 1
+    def _put_hashed(self, key: str, value: object, hash: int) -> None:
+        """
+        Adds the input key/value pair given the key's hash, or None to
+        compute it, so hashes can be computed ahead of time in bulk.
+        """
+        index, entry = self._probe_for_insert(key, hash)
 
-        # Place new key/value at first tombstone if it exists.
-        if tombstone_i:
-            self._buckets[tombstone_i] = HashEntry(key, value)
-            self._size += 1
+        # If a matching key is found, replace old value with new. Otherwise
+        # insert it at first tombstone or None.
+        if entry and not entry.is_tombstone:
+            if self._snapshots is not None:
+                self._preserve(index)
+            entry.value = value
             return
 
-        # Insert new HashEntry upon arriving at None and increment size.
-        self._buckets[index] = HashEntry(key, value)
-        self._size += 1
+        self._store(index, entry, key, value)
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Returns the value of the input key's entry, first adding the key with
+        the default value if it doesn't exist.
+        """
+        index, entry = self._probe_for_insert(key)
+        if entry and not entry.is_tombstone:
+            return entry.value
+
+        self._store(index, entry, key, default)
+        return default
+
+    def compute(self, key: str, function: callable) -> object:
+        """
+        Replaces the value of the input key's entry with function(value),
+        where value is None if the key doesn't exist yet. Returns the new
+        value.
+        """
+        index, entry = self._probe_for_insert(key)
+        if entry and not entry.is_tombstone:
+            value = function(entry.value)
+            if self._snapshots is not None:
+                self._preserve(index)
+            entry.value = value
+            return value
+
+        value = function(None)
+        self._store(index, entry, key, value)
+        return value
+
+    def increment(self, key: str, delta: int = 1) -> int:
+        """
+        Adds delta to the value of the input key's entry, starting from 0 if
+        the key doesn't exist yet. Returns the new value.
+        """
+        index, entry = self._probe_for_insert(key)
+        if entry and not entry.is_tombstone:
+            if self._snapshots is not None:
+                self._preserve(index)
+            entry.value += delta
+            return entry.value
+
+        self._store(index, entry, key, delta)
+        return delta
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes the entry matching input key and returns its value, or returns
+        default if the key doesn't exist.
+        """
+        index, entry = self._probe(key)
+        if not entry or entry.is_tombstone:
+            return default
+
+        if self._snapshots is not None:
+            self._preserve(index)
+        entry.is_tombstone = True
+        self._size -= 1
+        return entry.value
+
+    def merge(self, other: "HashMap", combine: callable = None) -> None:
+        """
+        Adds every key/value pair of other to the HashMap. The value of a key
+        in both maps becomes combine(value, other's value), or other's value
+        if combine is None.
+        """
+        # An empty map with the same capacity and hash function takes a copy
+        # of other's table, every entry (and tombstone, which probes may pass
+        # through) at the same index, so no key is hashed.
+        if (self._size == 0 and other._capacity == self._capacity
+                and other._hash_function == self._hash_function):
+            buckets = FastDynamicArray(length=self._capacity)
+            for i in range(other._capacity):
+                entry = other._buckets.get_unchecked(i)
+                if entry:
+                    copy = HashEntry(entry.key, entry.value)
+                    copy.is_tombstone = entry.is_tombstone
+                    buckets.set_unchecked(i, copy)
+
+            # Snapshots keep the old buckets, which nothing changes any more.
+            self._buckets = buckets
+            self._occupied = other._occupied
+            self._size = other._size
+            self._release_snapshots()
+            if self._bloom is not None:
+                self._rebuild_bloom()
+            return
 
-        return
+        # Entries don't keep their hashes, so each key is hashed once here.
+        # Growing the table once up front keeps the inserts from resizing.
+        size = self._size + other._size
+        if size * 2 >= self._capacity:
+            self.resize_table(size * 2 + 1)
+
+        # The pairs are taken first, in case other is this map and an insert
+        # rehashes it.
+        pairs = []
+        for i in range(other._capacity):
+            entry = other._buckets.get_unchecked(i)
+            if entry and not entry.is_tombstone:
+                pairs.append((entry.key, entry.value))
+
+        for key, value in pairs:
+            index, own = self._probe_for_insert(key)
+            if not own or own.is_tombstone:
+                self._store(index, own, key, value)
+                continue
+
+            if combine is not None:
+                value = combine(own.value, value)
+            if self._snapshots is not None:
+                self._preserve(index)
+            own.value = value
 
     def table_load(self) -> float:
         """
@@ -137,12 +243,7 @@ class HashMap:
         """
         Returns the number of empty buckets in a HashMap object.
         """
-        empty = 0
-        for index in range(self._capacity):
-            if self._buckets[index] is None:
-                empty += 1
-
-        return empty
+        return self._capacity - self._occupied
 
     def resize_table(self, new_capacity: int) -> None:
         """
@@ -157,40 +258,42 @@ class HashMap:
         if not self._is_prime(new_capacity):
             new_capacity = self._next_prime(new_capacity)
 
-        # Create new map to use put for filling.
+        # Create new map to use put for filling. Flooding is checked by this
+        # map, not the temporary one.
         new_map = HashMap(new_capacity, self._hash_function)
+        new_map.FLOOD_PROBE_LENGTH = None
 
         # Put all non-tombstone entries in old HashMap into the new one.
         for i in range(self._capacity):
-            entry = self._buckets[i]
+            entry = self._buckets.get_unchecked(i)
             if entry:
                 if not entry.is_tombstone:
                     new_map.put(entry.key, entry.value)
 
-        # Reassign new buckets and capacity to the resized HashMap.
+        # Reassign new buckets and capacity to the resized HashMap. Snapshots
+        # keep the old buckets, which nothing changes any more.
         self._buckets = new_map._buckets
         self._capacity = new_map._capacity
+        self._occupied = new_map._occupied
+        self._release_snapshots()
+        if self._bloom is not None:
+            self._rebuild_bloom()
 
-    def get(self, key: str) -> object:
+    def get(self, key: str, default: object = None) -> object:
         """
-        Returns the value of the input key's entry or None if it doesn't exist.
+        Returns the value of the input key's entry, or default if it doesn't
+        exist.
         """
-        index_init = self.calc_index(key)
-        index = self.calc_index(key)
-        j = 1
-        entry = self._buckets[index]
+        # Skip probing for keys the Bloom filter rules out.
+        hash = self._hash_function(key)
+        if self._bloom is not None and not self._bloom.might_contain(hash):
+            return default
 
-        # Probe through HashMap for matching key.
-        while entry:
-            if entry.key == key:
-                if entry.is_tombstone:
-                    return None
-                return entry.value
-            index = (index_init + j ** 2) % self._capacity
-            entry = self._buckets[index]
-            j += 1
+        index, entry = self._probe(key, hash)
+        if entry and not entry.is_tombstone:
+            return entry.value
 
-        return None
+        return default
 
     def contains_key(self, key: str) -> bool:
         """
@@ -199,20 +302,13 @@ class HashMap:
         if self._size == 0:
             return False
 
-        index_init = self.calc_index(key)
-        index = self.calc_index(key)
-        j = 1
-        entry = self._buckets[index]
+        hash = self._hash_function(key)
+        if self._bloom is not None and not self._bloom.might_contain(hash):
+            return False
 
-        # Probe through HashMap, looking for input key.
-        while entry:
-            if entry.key == key:
-                if entry.is_tombstone:
-                    return False
-                return True
-            index = (index_init + j ** 2) % self._capacity
-            entry = self._buckets[index]
-            j += 1
+        index, entry = self._probe(key, hash)
+        if entry and not entry.is_tombstone:
+            return True
 
         return False
 
@@ -220,23 +316,13 @@ class HashMap:
         """
         Removes the entry matching the input key from the HashMap.
         """
-        index_init = self.calc_index(key)
-        index = self.calc_index(key)
-        j = 1
-        entry = self._buckets[index]
-
-        # Probe through HashMap looking for key. If found, set tombstone
-        # marker and decrement size to delete.
-        while entry:
-            if entry.key == key:
-                if entry.is_tombstone:
-                    return
-                entry.is_tombstone = True
-                self._size -= 1
-                return
-            index = (index_init + j ** 2) % self._capacity
-            entry = self._buckets[index]
-            j += 1
+        # If key is found, set tombstone marker and decrement size to delete.
+        index, entry = self._probe(key)
+        if entry and not entry.is_tombstone:
+            if self._snapshots is not None:
+                self._preserve(index)
+            entry.is_tombstone = True
+            self._size -= 1
 
         return
 
@@ -244,9 +330,18 @@ class HashMap:
         """
         Clears the HashMap of all entries.
         """
-        for i in range(self._capacity):
-            self._buckets[i] = None
+        # Buckets of a GenerationArray are emptied without touching them,
+        # unless snapshots still read them.
+        if isinstance(self._buckets, GenerationArray) and not self._snapshots:
+            self._buckets.reset()
+        else:
+            self._buckets = GenerationArray(self._capacity)
         self._size = 0
+        self._occupied = 0
+        self._release_snapshots()
+        if self._bloom is not None:
+            self._bloom = BlockedBloomFilter(self._bloom.expected,
+                                             self._bloom_fp_rate)
 
     def get_keys_and_values(self) -> DynamicArray:
         """
@@ -256,7 +351,7 @@ class HashMap:
         # to the DA.
         table_array = DynamicArray()
         for i in range(self._capacity):
-            entry = self._buckets[i]
+            entry = self._buckets.get_unchecked(i)
             if entry:
                 if not entry.is_tombstone:
                     tuple = (entry.key, entry.value)
@@ -271,6 +366,221 @@ class HashMap:
         index = self._hash_function(key) % self._capacity
         return index
 
+    def _probe(self, key: str, hash: int = None) -> (int, HashEntry):
+        """
+        Returns a tuple of 1) the index of the entry matching input key, or
+        the index a new entry for the key should be placed at, and 2) the
+        matching entry (possibly a tombstone) or None if the key is absent.
+        The key's hash is computed unless given.
+        """
+        if hash is None:
+            index_init = self.calc_index(key)
+        else:
+            index_init = hash % self._capacity
+        index = index_init
+        entry = self._buckets.get_unchecked(index)
+        tombstone_i = None
+        j = 1
+
+        # Probe through used buckets until None, marking first tombstone if
+        # existent.
+        while entry:
+            if entry.key == key:
+                self._probe_length = j
+                return index, entry
+            if entry.is_tombstone and tombstone_i is None:
+                tombstone_i = index
+            index = (index_init + j ** 2) % self._capacity
+            entry = self._buckets.get_unchecked(index)
+            j += 1
+
+        self._probe_length = j
+        if tombstone_i is not None:
+            return tombstone_i, None
+        return index, None
+
+    def _probe_for_insert(self, key: str, hash: int = None) -> (int, HashEntry):
+        """
+        Resizes the table if load factor >= .5, or if the new key would fill
+        over half of the buckets (just clearing out tombstones if they are
+        most of those), then probes for input key, reseeding the hash
+        function if the probe looks like an attack.
+        """
+        if self.table_load() >= 0.5:
+            self.resize_table(self._capacity * 2)
+        elif (self._occupied + 1) * 2 > self._capacity:
+            # Otherwise a probe could find no None bucket to stop at, since
+            # quadratic probing only reaches about half of the buckets.
+            if self._size * 4 >= self._capacity:
+                self.resize_table(self._capacity * 2)
+            else:
+                self.resize_table(self._capacity)
+
+        if hash is None:
+            hash = self._hash_function(key)
+        index, entry = self._probe(key, hash)
+        if (self.FLOOD_PROBE_LENGTH is not None
+                and self._probe_length > self.FLOOD_PROBE_LENGTH):
+            self.reseed()
+            hash = self._hash_function(key)
+            index, entry = self._probe(key, hash)
+
+        # Kept for _store, which adds the hash to the Bloom filter.
+        self._probe_hash = hash
+        return index, entry
+
+    def _make_snapshot(self) -> "HashMapSnapshot":
+        """
+        Returns a new snapshot of the HashMap, for snapshot().
+        """
+        return HashMapSnapshot(self)
+
+    @staticmethod
+    def _is_empty_bucket(entry: HashEntry) -> bool:
+        """
+        Returns True if the bucket has never held an entry. Tombstones are
+        shown in the output, so they don't count as empty.
+        """
+        return entry is None
+
+    def _copy_bucket_at(self, index: int) -> HashEntry:
+        """
+        Returns a copy of the entry at index (None if there is none) for the
+        snapshots to keep.
+        """
+        entry = self._buckets.get_unchecked(index)
+        if entry is not None:
+            copy = HashEntry(entry.key, entry.value)
+            copy.is_tombstone = entry.is_tombstone
+            entry = copy
+        return entry
+
+    def _live_keys(self):
+        """
+        Yields every key of the HashMap.
+        """
+        for i in range(self._capacity):
+            entry = self._buckets.get_unchecked(i)
+            if entry and not entry.is_tombstone:
+                yield entry.key
+
+    def _summary_extra(self) -> str:
+        """
+        Returns the number of tombstones for the summary.
+        """
+        return f", tombstones={self._occupied - self._size}"
+
+    def _store(self, index: int, entry: HashEntry, key: str,
+               value: object) -> None:
+        """
+        Stores a key/value pair for an absent key at the index returned by
+        _probe_for_insert, reviving the key's own tombstone if there is one.
+        """
+        if self._snapshots is not None:
+            self._preserve(index)
+        if entry:
+            entry.value = value
+            entry.is_tombstone = False
+        else:
+            if self._buckets.get_unchecked(index) is None:
+                self._occupied += 1
+            self._buckets.set_unchecked(index, HashEntry(key, value))
+        self._size += 1
+
+        # A revived key's bits may have been dropped by a rebuild.
+        if self._bloom is not None:
+            self._add_to_bloom(self._probe_hash)
+
+class HashMapSnapshot:
+    """
+    Read-only view of a HashMap at the time HashMap.snapshot() was called.
+    Buckets the HashMap has changed since are read from the copies it saved
+    here; all others are read from the HashMap's bucket array.
+    Supported methods are the read methods of HashMap
+    """
+
+    def __init__(self, map: HashMap) -> None:
+        """Initialize view of the current state of map."""
+        self._buckets = map._buckets
+        self._saved = {}
+        self._capacity = map._capacity
+        self._hash_function = map._hash_function
+        self._size = map._size
+        self._occupied = map._occupied
+
+    def get_size(self) -> int:
+        """Return size of the map when the snapshot was taken."""
+        return self._size
+
+    def get_capacity(self) -> int:
+        """Return capacity of the map when the snapshot was taken."""
+        return self._capacity
+
+    def table_load(self) -> float:
+        """Returns the load factor of the snapshot."""
+        return float(self._size / self._capacity)
+
+    def empty_buckets(self) -> int:
+        """Returns the number of empty buckets in the snapshot."""
+        return self._capacity - self._occupied
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry or None if it doesn't exist.
+        """
+        entry = self._find(key)
+        if entry and not entry.is_tombstone:
+            return entry.value
+
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if input key is contained in the snapshot, False otherwise.
+        """
+        if self._size == 0:
+            return False
+
+        entry = self._find(key)
+        return bool(entry and not entry.is_tombstone)
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the snapshot.
+        """
+        table_array = DynamicArray()
+        for i in range(self._capacity):
+            entry = self._bucket(i)
+            if entry and not entry.is_tombstone:
+                table_array.append((entry.key, entry.value))
+
+        return table_array
+
+    def _bucket(self, index: int) -> HashEntry:
+        """Return the bucket at index as it was when the snapshot was taken."""
+        if index in self._saved:
+            return self._saved[index]
+        return self._buckets.get_unchecked(index)
+
+    def _find(self, key: str) -> HashEntry:
+        """
+        Returns the entry (possibly a tombstone) matching input key, or None
+        if the key is absent.
+        """
+        index_init = self._hash_function(key) % self._capacity
+        index = index_init
+        entry = self._bucket(index)
+        j = 1
+
+        while entry:
+            if entry.key == key:
+                return entry
+            index = (index_init + j ** 2) % self._capacity
+            entry = self._bucket(index)
+            j += 1
+
+        return None
+
 
 # ------------------- BASIC TESTING ---------------------------------------- #
 
@@ -438,6 +748,25 @@ if __name__ == "__main__":
     print(m.get("key1"))
     m.remove("key4")
 
+    print("\nsetdefault / compute / increment / pop example 1")
+    print("-------------------------------------------------")
+    m = HashMap(53, hash_function_1)
+    print(m.setdefault("key1", 10), m.setdefault("key1", 20), m.get_size())
+    print(m.compute("key1", lambda v: v * 3), m.compute("key2", lambda v: [v]))
+    print(m.increment("key3"), m.increment("key3", 5), m.get("key3"))
+    print(m.pop("key3"), m.pop("key3"), m.pop("key3", "missing"), m.get_size())
+    print(m.increment("key3"), m.get_size())
+
+    print("\nreseed example 1")
+    print("----------------")
+    from itertools import permutations
+    m = HashMap(11, hash_function_1)
+    anagrams = ["".join(p) for p in permutations("abcde")]
+    for i, key in enumerate(anagrams):
+        m.put(key, i)
+    print(m.get_size(), isinstance(m._hash_function, SeededHash))
+    print(m.get("edcba"), m.contains_key("abcdf"), m._probe_length <= 32)
+
     print("\nPDF - clear example 1")
     print("---------------------")
     m = HashMap(101, hash_function_1)
@@ -462,6 +791,83 @@ if __name__ == "__main__":
     m.clear()
     print(m.get_size(), m.get_capacity())
 
+    print("\nclear / empty_buckets example 3")
+    print("-------------------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(20):
+        m.put("key" + str(i), i)
+    print(m.get_size(), m.empty_buckets())
+    m.clear()
+    print(m.get_size(), m.empty_buckets(), m.get("key1"))
+    m.put("key1", 10)
+    m.clear()
+    m.put("key2", 20)
+    print(m.get_size(), m.empty_buckets(), m.get("key1"), m.get("key2"))
+
+    print("\nsnapshot example 1")
+    print("------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(10):
+        m.put("key" + str(i), i)
+    first = m.snapshot()
+    m.put("key1", 100)
+    m.increment("key2")
+    m.remove("key3")
+    m.put("new", "value")
+    second = m.snapshot()
+    m.clear()
+    print(first.get_size(), first.get("key1"), first.get("key2"), first.get("key3"),
+          first.contains_key("new"), len(first._saved))
+    print(second.get_size(), second.get("key1"), second.get("key2"),
+          second.contains_key("key3"), second.get("new"), m.get_size())
+    print(sorted(as_list(first.get_keys_and_values())) == [("key" + str(i), i) for i in range(10)])
+
+    print("\nbloom filter example 1")
+    print("----------------------")
+    m = HashMap(53, hash_function_1)
+    m.enable_bloom_filter(0.01)
+    for i in range(200):
+        m.put("key" + str(i), i)
+    for i in range(0, 200, 2):
+        m.remove("key" + str(i))
+    misses = sum(not m._bloom.might_contain(m._hash_function("miss" + str(i)))
+                 for i in range(1000))
+    print(m.get("key1"), m.get("key2"), m.contains_key("key3"), misses > 900)
+    m.resize_table(500)
+    m.clear()
+    print(m.get("key1"), m._bloom.count)
+    m.disable_bloom_filter()
+
+    print("\nmerge example 1")
+    print("---------------")
+    a = HashMap(53, hash_function_1)
+    b = HashMap(53, hash_function_1)
+    for i in range(30):
+        a.increment("key" + str(i % 20))
+        b.increment("key" + str(i % 25 + 10))
+    a.merge(b, lambda x, y: x + y)
+    print(a.get_size(), a.get("key0"), a.get("key12"), a.get("key24"), a.get_capacity())
+    c = HashMap(11, hash_function_2)
+    c.put("key0", "zero")
+    c.merge(a)
+    print(c.get_size(), c.get("key0"), c.get("key12"), c.get_capacity())
+    d = HashMap(53, hash_function_1)
+    d.merge(b)
+    print(d.get_size(), d.get("key10"), d.get_capacity(), d.empty_buckets() == b.empty_buckets())
+
+    print("\nwrite_to / summary example 1")
+    print("----------------------------")
+    import io
+    m = HashMap(53, hash_function_1)
+    for i in range(20):
+        m.put("key" + str(i), i)
+    m.remove("key3")
+    out = io.StringIO()
+    print(m.write_to(out), m.write_to(out, only_nonempty=False) == m.get_capacity())
+    print(out.getvalue().endswith(str(m)), m.write_to(out, limit=3))
+    print("".join(m.iter_lines(limit=2)), end="")
+    print(m.summary())
+
     print("\nPDF - get_keys_and_values example 1")
     print("------------------------")
     m = HashMap(11, hash_function_2)
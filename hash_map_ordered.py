@@ -0,0 +1,318 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Implementation of an insertion-ordered hash map using open
+#              addressing with a compact layout. A sparse index array holds
+#              entry numbers, and the entries themselves (hash, key, value)
+#              are appended to dense arrays in insertion order.
+
+
+from array import array
+
+from a6_include import (DynamicArray, FastDynamicArray, hash_function_1,
+                        hash_function_2)
+from hash_map_base import HashTableBase
+
+
+# Index slot markers. Any other value is the position of an entry.
+EMPTY = -1
+DUMMY = -2
+
+
+class _Deleted:
+    """
+    Placeholder key of a removed entry, waiting to be compacted away.
+    """
+
+    def __repr__(self) -> str:
+        """Return a readable name for the placeholder."""
+        return '<deleted>'
+
+
+_DELETED = _Deleted()
+
+
+class OrderedHashMap(HashTableBase):
+    def __init__(self, capacity: int, function) -> None:
+        """
+        Initialize new OrderedHashMap that uses quadratic probing over a
+        compact index for collision resolution
+        """
+        # capacity must be a prime number
+        self._capacity = self._next_prime(capacity)
+        self._index = array('q', [EMPTY]) * self._capacity
+
+        self._hashes = FastDynamicArray()
+        self._keys = FastDynamicArray()
+        self._values = FastDynamicArray()
+
+        self._hash_function = function
+        self._size = 0
+        self._filled = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ""
+        for i in range(self._keys.length()):
+            key = self._keys.get_unchecked(i)
+            if key is not _DELETED:
+                out += str(i) + ": " + str(key) + ": " + str(self._values[i]) + "\n"
+        return out
+
+    def __iter__(self):
+        """
+        Return an iterator over the keys in insertion order.
+        """
+        return (key for key in self._keys if key is not _DELETED)
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Adds the input key/value pair to an OrderedHashMap object. Updating
+        an existing key keeps its place in the order.
+        """
+        # Resize (or just compact) once the entries, removed ones included,
+        # would fill half the index. Every new entry is appended even when it
+        # reuses a dummy, so counting only filled slots lets churn grow the
+        # entry arrays without bound.
+        if (self._keys.length() + 1) * 2 > self._capacity:
+            if self._size * 4 >= self._capacity:
+                self.resize_table(self._capacity * 2)
+            else:
+                self.resize_table(self._capacity)
+
+        hash = self._hash_function(key)
+        index, position = self._probe(key, hash)
+        if position is not None:
+            self._values.set_unchecked(position, value)
+            return
+
+        if (self.FLOOD_PROBE_LENGTH is not None
+                and self._probe_length > self.FLOOD_PROBE_LENGTH):
+            self.reseed()
+            hash = self._hash_function(key)
+            index, position = self._probe(key, hash)
+
+        if self._index[index] == EMPTY:
+            self._filled += 1
+        self._index[index] = self._keys.length()
+        self._hashes.append(hash)
+        self._keys.append(key)
+        self._values.append(value)
+        self._size += 1
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty index slots in an OrderedHashMap object.
+        """
+        return self._capacity - self._filled
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes an OrderedHashMap object's index to the input capacity.
+        Adjusts the new capacity to a prime number if it is not. Entries
+        keep their stored hashes, so only the index is rebuilt.
+        """
+        if new_capacity < self._size:
+            return
+
+        # Make sure new capacity is prime and make it next nearest prime if
+        # not, doubling it until the index would be at most half full.
+        if not self._is_prime(new_capacity):
+            new_capacity = self._next_prime(new_capacity)
+        while self._size * 2 > new_capacity:
+            new_capacity = self._next_prime(new_capacity * 2)
+
+        # Drop removed entries so entry positions are dense again.
+        if self._keys.length() != self._size:
+            hashes, keys, values = (FastDynamicArray(), FastDynamicArray(),
+                                    FastDynamicArray())
+            for i in range(self._keys.length()):
+                if self._keys.get_unchecked(i) is not _DELETED:
+                    hashes.append(self._hashes.get_unchecked(i))
+                    keys.append(self._keys.get_unchecked(i))
+                    values.append(self._values.get_unchecked(i))
+            self._hashes, self._keys, self._values = hashes, keys, values
+
+        # Place every entry number in the new index at the first empty slot
+        # of its probe sequence.
+        new_index = array('q', [EMPTY]) * new_capacity
+        for position in range(self._size):
+            index_init = self._hashes.get_unchecked(position) % new_capacity
+            index = index_init
+            j = 1
+            while new_index[index] != EMPTY:
+                index = (index_init + j ** 2) % new_capacity
+                j += 1
+            new_index[index] = position
+
+        self._index = new_index
+        self._capacity = new_capacity
+        self._filled = self._size
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry or None if it doesn't exist.
+        """
+        index, position = self._probe(key, self._hash_function(key))
+        if position is not None:
+            return self._values.get_unchecked(position)
+
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if input key is contained in the OrderedHashMap, False
+        otherwise.
+        """
+        if self._size == 0:
+            return False
+
+        index, position = self._probe(key, self._hash_function(key))
+        return position is not None
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the entry matching the input key from the OrderedHashMap.
+        """
+        self.pop(key)
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes the entry matching input key and returns its value, or returns
+        default if the key doesn't exist.
+        """
+        index, position = self._probe(key, self._hash_function(key))
+        if position is None:
+            return default
+
+        # Leave a dummy in the index so probe sequences stay intact, and a
+        # placeholder in the entries so later positions don't shift.
+        value = self._values.get_unchecked(position)
+        self._index[index] = DUMMY
+        self._keys.set_unchecked(position, _DELETED)
+        self._values.set_unchecked(position, None)
+        self._size -= 1
+        return value
+
+    def clear(self) -> None:
+        """
+        Clears the OrderedHashMap of all entries.
+        """
+        self._index = array('q', [EMPTY]) * self._capacity
+        self._hashes = FastDynamicArray()
+        self._keys = FastDynamicArray()
+        self._values = FastDynamicArray()
+        self._size = 0
+        self._filled = 0
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the
+        OrderedHashMap, in the order the keys were first put.
+        """
+        table_array = DynamicArray()
+        for i in range(self._keys.length()):
+            key = self._keys.get_unchecked(i)
+            if key is not _DELETED:
+                table_array.append((key, self._values.get_unchecked(i)))
+
+        return table_array
+
+    def _rehash_keys(self) -> None:
+        """
+        Recomputes the stored hash of every entry with the hash function.
+        """
+        for i in range(self._keys.length()):
+            key = self._keys.get_unchecked(i)
+            if key is not _DELETED:
+                self._hashes.set_unchecked(i, self._hash_function(key))
+
+    def _probe(self, key: str, hash: int) -> (int, int):
+        """
+        Returns a tuple of 1) the index slot holding input key's entry
+        number, or the slot a new entry number should be placed in, and
+        2) the position of the key's entry or None if the key is absent.
+        """
+        index_init = hash % self._capacity
+        index = index_init
+        position = self._index[index]
+        dummy_i = None
+        j = 1
+
+        # Probe until an empty slot, comparing stored hashes before keys and
+        # marking the first dummy for reuse.
+        while position != EMPTY:
+            if position == DUMMY:
+                if dummy_i is None:
+                    dummy_i = index
+            elif (self._hashes.get_unchecked(position) == hash
+                  and self._keys.get_unchecked(position) == key):
+                self._probe_length = j
+                return index, position
+            index = (index_init + j ** 2) % self._capacity
+            position = self._index[index]
+            j += 1
+
+        self._probe_length = j
+        if dummy_i is not None:
+            return dummy_i, None
+        return index, None
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example 1")
+    print("-------------")
+    m = OrderedHashMap(53, hash_function_1)
+    for i in range(150):
+        m.put("str" + str(i), i * 100)
+        if i % 25 == 24:
+            print(
+                m.empty_buckets(),
+                round(m.table_load(), 2),
+                m.get_size(),
+                m.get_capacity(),
+            )
+
+    print("\nget / contains_key / remove example 1")
+    print("-------------------------------------")
+    m = OrderedHashMap(79, hash_function_2)
+    keys = [i for i in range(1, 1000, 20)]
+    for key in keys:
+        m.put(str(key), key * 42)
+    print(m.get_size(), m.get_capacity())
+    result = True
+    for key in keys:
+        # all inserted keys must be present
+        result &= m.contains_key(str(key)) and m.get(str(key)) == key * 42
+        # NOT inserted keys must be absent
+        result &= not m.contains_key(str(key + 1))
+    print(result)
+    for key in keys[::2]:
+        m.remove(str(key))
+    print(m.get_size(), m.contains_key("1"), m.contains_key("21"))
+
+    print("\ninsertion order example 1")
+    print("-------------------------")
+    m = OrderedHashMap(11, hash_function_2)
+    for i in range(5, 0, -1):
+        m.put(str(i), str(i * 10))
+    print(m.get_keys_and_values())
+    m.put("3", "300")
+    m.remove("4")
+    m.resize_table(2)
+    m.put("4", "400")
+    m.resize_table(37)
+    print(m.get_keys_and_values())
+    print(list(m), m.pop("5"), m.pop("5", "missing"))
+    print(m)
+    m.clear()
+    print(m.get_size(), m.empty_buckets(), m.get_capacity())
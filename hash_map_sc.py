@@ -6,11 +6,117 @@
 # Description: Implementation of a hash map using separate chaining.
 
 
-from a6_include import (DynamicArray, LinkedList,
-                        hash_function_1, hash_function_2)
+from bisect import bisect_left
 
+import hash_map_int
+from a6_include import (BlockedBloomFilter, DynamicArray, FastArrayAttribute,
+                        FastDynamicArray, GenerationArray, LinkedList,
+                        SeededHash, SLNode, as_list, hash_function_1,
+                        hash_function_2)
+from hash_map_base import HashMapMixin, HashTableBase
+
+
+class TreeBucket:
+    """
+    Bucket used in place of a LinkedList once a chain grows long. Nodes are
+    kept sorted by key so a lookup is a binary search instead of a linear
+    scan, which bounds the cost of heavily colliding keys at O(log n). A key
+    that can't be ordered against the others is still found by a linear
+    scan, but can't be inserted.
+    Supported methods match LinkedList: insert, remove, contains, length,
+    iterator
+    """
+
+    def __init__(self, bucket: LinkedList = None) -> None:
+        """
+        Initialize new tree bucket, taking the nodes of bucket if given.
+        Raises TypeError if the keys can't be ordered against each other.
+        """
+        self._nodes = sorted(bucket, key=lambda node: node.key) if bucket else []
+        self._keys = [node.key for node in self._nodes]
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return 'TREE [' + ', '.join(str(node) for node in self._nodes) + ']'
+
+    def __iter__(self):
+        """Return an iterator over the nodes in key order."""
+        return iter(self._nodes)
+
+    def insert(self, key: str, value: object) -> None:
+        """
+        Insert new node for a key not yet in the bucket. Raises TypeError if
+        the key can't be ordered against the others.
+        """
+        index = bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._nodes.insert(index, SLNode(key, value))
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove node with matching key.
+        Return True if removal was successful, False otherwise.
+        """
+        return self.pop(key) is not None
+
+    def pop(self, key: str) -> SLNode:
+        """Remove node with matching key and return it, or None if no match"""
+        index = self._find(key)
+        if index is None:
+            return None
+        del self._keys[index]
+        return self._nodes.pop(index)
+
+    def contains(self, key: str) -> SLNode:
+        """Return node with matching key, or None if no match"""
+        index = self._find(key)
+        if index is None:
+            return None
+        return self._nodes[index]
+
+    def length(self) -> int:
+        """Return the number of nodes in the bucket."""
+        return len(self._nodes)
+
+    def copy(self) -> "TreeBucket":
+        """Return a new tree bucket holding copies of the nodes."""
+        copy = TreeBucket()
+        copy._nodes = [SLNode(node.key, node.value) for node in self._nodes]
+        copy._keys = list(self._keys)
+        return copy
+
+    def _find(self, key: str) -> int:
+        """Return the position of the node with matching key, or None."""
+        try:
+            index = bisect_left(self._keys, key)
+        except TypeError:
+            # An unorderable key can still equal a stored one.
+            for index in range(len(self._keys)):
+                if self._keys[index] == key:
+                    return index
+            return None
+
+        if index < len(self._keys) and self._keys[index] == key:
+            return index
+        return None
+
+
+class HashMap(HashMapMixin, HashTableBase):
+    # Chains longer than TREEIFY_THRESHOLD are converted to TreeBuckets, and
+    # converted back to LinkedLists once they shrink below
+    # UNTREEIFY_THRESHOLD. Set per map to tune, or set TREEIFY_THRESHOLD to
+    # None to keep every bucket a LinkedList.
+    TREEIFY_THRESHOLD = 8
+    UNTREEIFY_THRESHOLD = 6
+
+    # The DynamicArray of buckets built by __init__ is stored as a
+    # FastDynamicArray, whose unchecked accessors the hot paths use.
+    _buckets = FastArrayAttribute()
+
+    # Number of non-empty buckets, kept up to date by every insert and
+    # removal so empty_buckets() doesn't scan the table.
+    _occupied = 0
 
-class HashMap:
     def __init__(self,
                  capacity: int = 11,
                  function: callable = hash_function_1) -> None:
@@ -92,26 +198,158 @@ class HashMap:
         """
         Adds the input key/value pair to a HashMap object.
         """
-        # Check if key already exists and replace with new value if so.
-        # Otherwise, create new node with key and value.
-        node = self.get_node(key)
+        self._put_hashed(key, value, self._hash_function(key))
+
+    def _put_hashed(self, key: str, value: object, hash: int) -> None:
+        """
+        Adds the input key/value pair given the key's hash, so hashes can be
+        computed ahead of time in bulk.
+        """
+        # Check if key already exists in its bucket and replace with new
+        # value if so. Otherwise, insert new node into the same bucket.
+        index = hash % self._capacity
+        bucket = self._buckets.get_unchecked(index)
+        node = bucket.contains(key)
         if node:
+            if self._snapshots is not None:
+                self._preserve(index)
             node.value = value
         else:
-            index = self.calc_index(key)
-            self._buckets[index].insert(key, value)
-            self._size += 1
+            self._insert(index, bucket, key, value, hash)
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Returns the value of the input key's entry, first adding the key with
+        the default value if it doesn't exist.
+        """
+        hash = self._hash_function(key)
+        index = hash % self._capacity
+        bucket = self._buckets.get_unchecked(index)
+        node = bucket.contains(key)
+        if node:
+            return node.value
+
+        self._insert(index, bucket, key, default, hash)
+        return default
+
+    def compute(self, key: str, function: callable) -> object:
+        """
+        Replaces the value of the input key's entry with function(value),
+        where value is None if the key doesn't exist yet. Returns the new
+        value.
+        """
+        hash = self._hash_function(key)
+        index = hash % self._capacity
+        bucket = self._buckets.get_unchecked(index)
+        node = bucket.contains(key)
+        if node:
+            value = function(node.value)
+            if self._snapshots is not None:
+                self._preserve(index)
+            node.value = value
+            return value
+
+        value = function(None)
+        self._insert(index, bucket, key, value, hash)
+        return value
+
+    def increment(self, key: str, delta: int = 1) -> int:
+        """
+        Adds delta to the value of the input key's entry, starting from 0 if
+        the key doesn't exist yet. Returns the new value.
+        """
+        hash = self._hash_function(key)
+        index = hash % self._capacity
+        bucket = self._buckets.get_unchecked(index)
+        node = bucket.contains(key)
+        if node:
+            if self._snapshots is not None:
+                self._preserve(index)
+            node.value += delta
+            return node.value
+
+        self._insert(index, bucket, key, delta, hash)
+        return delta
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes the entry matching input key and returns its value, or returns
+        default if the key doesn't exist.
+        """
+        index = self.calc_index(key)
+        node = self._delete(index, self._buckets.get_unchecked(index), key)
+        if node is None:
+            return default
+
+        return node.value
+
+    def put_if_absent(self, key: str, value: object) -> SLNode:
+        """
+        Adds the input key/value pair if the key doesn't exist yet. Returns
+        the node already holding the key, or None if the pair was added.
+        """
+        hash = self._hash_function(key)
+        index = hash % self._capacity
+        bucket = self._buckets.get_unchecked(index)
+        node = bucket.contains(key)
+        if node:
+            return node
+
+        self._insert(index, bucket, key, value, hash)
+        return None
+
+    def merge(self, other: "HashMap", combine: callable = None) -> None:
+        """
+        Adds every key/value pair of other to the HashMap. The value of a key
+        in both maps becomes combine(value, other's value), or other's value
+        if combine is None.
+        """
+        # With the same capacity and hash function, each of other's keys
+        # belongs in the bucket at the same index, so none are hashed.
+        # Otherwise the table is grown once up front, not key by key.
+        aligned = (other._capacity == self._capacity
+                   and other._hash_function == self._hash_function)
+        if not aligned and self._size + other._size > self._capacity:
+            self.resize_table(self._size + other._size)
+        function = self._hash_function if aligned else None
+
+        for i in range(other._capacity):
+            other_bucket = other._buckets.get_unchecked(i)
+            if other_bucket.length() == 0:
+                continue
+
+            # A reseed by a flooded insert ends the alignment.
+            if (self._hash_function is function
+                    and self._buckets.get_unchecked(i).length() == 0):
+                self._fill_bucket(i, [(node.key, node.value)
+                                      for node in other_bucket])
+                continue
+
+            for node in other_bucket:
+                if self._hash_function is function:
+                    hash = None
+                    index = i
+                else:
+                    hash = self._hash_function(node.key)
+                    index = hash % self._capacity
+                bucket = self._buckets.get_unchecked(index)
+                own = bucket.contains(node.key)
+                if not own:
+                    self._insert(index, bucket, node.key, node.value, hash)
+                    continue
+
+                value = node.value
+                if combine is not None:
+                    value = combine(own.value, value)
+                if self._snapshots is not None:
+                    self._preserve(index)
+                own.value = value
 
     def empty_buckets(self) -> int:
         """
         Returns the number of empty buckets in a HashMap.
         """
-        empty = 0
-        for index in range(self._capacity):
-            if self._buckets[index].length() == 0:
-                empty += 1
-
-        return empty
+        return self._capacity - self._occupied
 
     def table_load(self) -> float:
         """
@@ -123,9 +361,18 @@ class HashMap:
         """
         Clears all entries from a HashMap.
         """
-        for i in range(self._capacity):
-            self._buckets[i] = LinkedList()
+        # Buckets of a GenerationArray are emptied without touching them,
+        # unless snapshots still read them.
+        if isinstance(self._buckets, GenerationArray) and not self._snapshots:
+            self._buckets.reset()
+        else:
+            self._buckets = GenerationArray(self._capacity, LinkedList)
         self._size = 0
+        self._occupied = 0
+        self._release_snapshots()
+        if self._bloom is not None:
+            self._bloom = BlockedBloomFilter(self._bloom.expected,
+                                             self._bloom_fp_rate)
 
     def resize_table(self, new_capacity: int) -> None:
         """
@@ -140,46 +387,66 @@ class HashMap:
         if not self._is_prime(new_capacity):
             new_capacity = self._next_prime(new_capacity)
 
-        # Fill new table with linked lists.
-        new_buckets = DynamicArray()
-        for i in range(new_capacity):
-            new_buckets.append(LinkedList())
+        # New table creates its linked lists as buckets are first used.
+        new_buckets = GenerationArray(new_capacity, LinkedList)
+        occupied = 0
+        long_buckets = []
 
         # Iterate through old table, stopping at indices with non-empty
         # lists. Iterate through lists, rehashing and copying nodes to new
         # table.
         for i in range(self._capacity):
-            bucket = self._buckets[i]
+            bucket = self._buckets.get_unchecked(i)
             for node in bucket:
                 index = self._hash_function(node.key) % new_capacity
-                new_buckets[index].insert(node.key, node.value)
-
-        # Reassign new buckets and capacity to the HashMap.
+                new_bucket = new_buckets.get_unchecked(index)
+                new_bucket.insert(node.key, node.value)
+                if new_bucket.length() == 1:
+                    occupied += 1
+                elif new_bucket.length() - 1 == self.TREEIFY_THRESHOLD:
+                    long_buckets.append(index)
+
+        # Long chains become TreeBuckets only once all of their nodes are
+        # placed, so a key the others can't be ordered against keeps its
+        # chain a list instead of failing to insert.
+        for index in long_buckets:
+            self._treeify_if_long(new_buckets, index,
+                                  new_buckets.get_unchecked(index))
+
+        # Reassign new buckets and capacity to the HashMap. Snapshots keep
+        # the old buckets, which nothing changes any more.
         self._buckets = new_buckets
         self._capacity = new_capacity
+        self._occupied = occupied
+        self._release_snapshots()
+        if self._bloom is not None:
+            self._rebuild_bloom()
 
-    def get(self, key: str) -> object:
+    def get(self, key: str, default: object = None) -> object:
         """
-        Returns the value of the input key's entry if it exists or None
+        Returns the value of the input key's entry if it exists or default
         otherwise.
         """
-        # Grab the bucket to search for key in.
-        index = self.calc_index(key)
-        bucket = self._buckets[index]
+        # Skip keys the Bloom filter rules out, then grab the bucket to
+        # search for key in.
+        hash = self._hash_function(key)
+        if self._bloom is not None and not self._bloom.might_contain(hash):
+            return default
+        bucket = self._buckets.get_unchecked(hash % self._capacity)
 
         # Search the LinkedList in the bucket.
         node = bucket.contains(key)
         if node:
             return node.value
 
-        return None
+        return default
 
     def get_node(self, key: str) -> object:
         """
         Returns the node matching input key or None if node doesn't exist.
         """
         index = self.calc_index(key)
-        bucket = self._buckets[index]
+        bucket = self._buckets.get_unchecked(index)
         return bucket.contains(key)
 
     def contains_key(self, key: str) -> bool:
@@ -189,8 +456,11 @@ class HashMap:
         if self._size == 0:
             return False
 
-        index = self.calc_index(key)
-        if self._buckets[index].contains(key):
+        hash = self._hash_function(key)
+        if self._bloom is not None and not self._bloom.might_contain(hash):
+            return False
+        bucket = self._buckets.get_unchecked(hash % self._capacity)
+        if bucket.contains(key):
             return True
 
         return False
@@ -199,12 +469,9 @@ class HashMap:
         """
         Removes the entry matching input key from the HashMap.
         """
-        # Grab proper bucket and search for entry to remove. If entry is
-        # removed, decrement size.
+        # Grab proper bucket and search for entry to remove.
         index = self.calc_index(key)
-        bucket = self._buckets[index]
-        if bucket.remove(key):
-            self._size -= 1
+        self._delete(index, self._buckets.get_unchecked(index), key)
 
         return
 
@@ -215,7 +482,7 @@ class HashMap:
         # Iterate through HashMap, copying all key/value pairs to the DA.
         table_array = DynamicArray()
         for i in range(self._capacity):
-            bucket = self._buckets[i]
+            bucket = self._buckets.get_unchecked(i)
             if bucket:
                 for node in bucket:
                     tuple = (node.key, node.value)
@@ -230,22 +497,268 @@ class HashMap:
         index = self._hash_function(key) % self._capacity
         return index
 
+    def _make_snapshot(self) -> "HashMapSnapshot":
+        """
+        Returns a new snapshot of the HashMap, for snapshot().
+        """
+        return HashMapSnapshot(self)
+
+    @staticmethod
+    def _is_empty_bucket(bucket: object) -> bool:
+        """
+        Returns True if the bucket holds no keys.
+        """
+        return bucket.length() == 0
+
+    def _copy_bucket_at(self, index: int) -> object:
+        """
+        Returns a copy of the bucket at index for the snapshots to keep.
+        """
+        return _copy_bucket(self._buckets.get_unchecked(index))
+
+    def _live_keys(self):
+        """
+        Yields every key of the HashMap.
+        """
+        for i in range(self._capacity):
+            for node in self._buckets.get_unchecked(i):
+                yield node.key
+
+    def _insert(self, index: int, bucket: object, key: str,
+                value: object, hash: int = None) -> None:
+        """
+        Inserts a key not yet in the HashMap into the bucket at index,
+        converting the bucket to a TreeBucket if its chain gets too long and
+        reseeding the hash function if the chain looks like an attack. hash
+        is the key's hash if the caller computed it.
+        """
+        if self._snapshots is not None:
+            self._preserve(index)
+        try:
+            bucket.insert(key, value)
+        except TypeError:
+            # The key can't be ordered against a TreeBucket's keys, so the
+            # bucket goes back to being a list.
+            bucket = self._untreeify(index, bucket)
+            bucket.insert(key, value)
+        self._size += 1
+        if bucket.length() == 1:
+            self._occupied += 1
+        self._treeify_if_long(self._buckets, index, bucket)
+        if self._bloom is not None:
+            self._add_to_bloom(self._hash_function(key) if hash is None
+                               else hash)
+
+        if (self.FLOOD_CHAIN_LENGTH is not None
+                and bucket.length() > self.FLOOD_CHAIN_LENGTH
+                and bucket.length() > 4 * self.table_load()):
+            self.reseed()
+
+    def _fill_bucket(self, index: int, pairs: list) -> None:
+        """
+        Inserts key/value pairs into the empty bucket at index without
+        looking them up, reseeding the hash function if the chain looks like
+        an attack. The keys must be distinct and belong in that bucket; used
+        to stitch in buckets built elsewhere.
+        """
+        if not pairs:
+            return
+
+        if self._snapshots is not None:
+            self._preserve(index)
+        bucket = self._buckets.get_unchecked(index)
+        for key, value in pairs:
+            bucket.insert(key, value)
+            if self._bloom is not None:
+                self._add_to_bloom(self._hash_function(key))
+        self._size += len(pairs)
+        self._occupied += 1
+        self._treeify_if_long(self._buckets, index, bucket)
+
+        if (self.FLOOD_CHAIN_LENGTH is not None
+                and bucket.length() > self.FLOOD_CHAIN_LENGTH
+                and bucket.length() > 4 * self.table_load()):
+            self.reseed()
+
+    def _delete(self, index: int, bucket: object, key: str) -> SLNode:
+        """
+        Removes input key from the bucket at index, converting a TreeBucket
+        that got short back to a LinkedList. Returns the removed node, or
+        None if key wasn't there.
+        """
+        if self._snapshots is not None and bucket.contains(key):
+            self._preserve(index)
+        node = _unlink(bucket, key)
+        if node is None:
+            return None
+
+        self._size -= 1
+        if bucket.length() == 0:
+            self._occupied -= 1
+        if (isinstance(bucket, TreeBucket)
+                and bucket.length() < self.UNTREEIFY_THRESHOLD):
+            self._untreeify(index, bucket)
+        return node
+
+    def _untreeify(self, index: int, bucket: TreeBucket) -> LinkedList:
+        """
+        Replaces the TreeBucket at index with a LinkedList of its nodes and
+        returns the list.
+        """
+        # Insert nodes back to front so the list keeps key order.
+        chain = LinkedList()
+        for i in range(bucket.length() - 1, -1, -1):
+            chain.insert(bucket._nodes[i].key, bucket._nodes[i].value)
+        self._buckets.set_unchecked(index, chain)
+        return chain
+
+    def _treeify_if_long(self, buckets: FastDynamicArray, index: int,
+                         bucket: object) -> None:
+        """
+        Replaces the LinkedList at index of buckets with a TreeBucket if it
+        is longer than TREEIFY_THRESHOLD.
+        """
+        if (self.TREEIFY_THRESHOLD is None
+                or bucket.length() <= self.TREEIFY_THRESHOLD
+                or isinstance(bucket, TreeBucket)):
+            return
+
+        # Keys that can't be ordered against each other stay in the list.
+        try:
+            buckets[index] = TreeBucket(bucket)
+        except TypeError:
+            pass
+
+
+class HashMapSnapshot:
+    """
+    Read-only view of a HashMap at the time HashMap.snapshot() was called.
+    Buckets the HashMap has changed since are read from the copies it saved
+    here; all others are read from the HashMap's bucket array.
+    Supported methods are the read methods of HashMap
+    """
+
+    def __init__(self, map: HashMap) -> None:
+        """Initialize view of the current state of map."""
+        self._buckets = map._buckets
+        self._saved = {}
+        self._capacity = map._capacity
+        self._hash_function = map._hash_function
+        self._size = map._size
+        self._occupied = map._occupied
+
+    def get_size(self) -> int:
+        """Return size of the map when the snapshot was taken."""
+        return self._size
+
+    def get_capacity(self) -> int:
+        """Return capacity of the map when the snapshot was taken."""
+        return self._capacity
+
+    def table_load(self) -> float:
+        """Returns the load factor of the snapshot."""
+        return float(self._size / self._capacity)
+
+    def empty_buckets(self) -> int:
+        """Returns the number of empty buckets in the snapshot."""
+        return self._capacity - self._occupied
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry if it exists or None
+        otherwise.
+        """
+        node = self._bucket(self._hash_function(key) % self._capacity).contains(key)
+        if node:
+            return node.value
+
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the input key exists in the snapshot or False otherwise.
+        """
+        if self._size == 0:
+            return False
+
+        return bool(self._bucket(self._hash_function(key) % self._capacity).contains(key))
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the snapshot.
+        """
+        table_array = DynamicArray()
+        for i in range(self._capacity):
+            for node in self._bucket(i):
+                table_array.append((node.key, node.value))
+
+        return table_array
+
+    def _bucket(self, index: int) -> object:
+        """Return the bucket at index as it was when the snapshot was taken."""
+        bucket = self._saved.get(index)
+        if bucket is None:
+            bucket = self._buckets.get_unchecked(index)
+        return bucket
+
+
+def _unlink(bucket: object, key: str) -> SLNode:
+    """
+    Removes the node with matching key from a LinkedList or TreeBucket in a
+    single scan and returns it, or returns None if no match.
+    """
+    if isinstance(bucket, TreeBucket):
+        return bucket.pop(key)
+
+    previous, node = None, bucket._head
+    while node:
+        if node.key == key:
+            if previous:
+                previous.next = node.next
+            else:
+                bucket._head = node.next
+            bucket._size -= 1
+            return node
+        previous, node = node, node.next
+    return None
+
+
+def _copy_bucket(bucket: object) -> object:
+    """
+    Returns a copy of a LinkedList or TreeBucket with copies of its nodes, so
+    later changes to the nodes' values don't show in the copy.
+    """
+    if isinstance(bucket, TreeBucket):
+        return bucket.copy()
+
+    # Insert nodes back to front so the copy keeps their order.
+    nodes = list(bucket)
+    copy = LinkedList()
+    for i in range(len(nodes) - 1, -1, -1):
+        copy.insert(nodes[i].key, nodes[i].value)
+    return copy
+
 
 def find_mode(da: DynamicArray) -> (DynamicArray, int):
     """
     Returns a tuple of 1) an array of the highest occurrence values in the
     HashMap and 2) the number of occurrences of those values.
     """
+    # The string hash functions can't hash ints, so input that starts with an
+    # int is counted in an IntHashMap instead, unless a later value turns out
+    # not to be a 64-bit int.
+    if da.length() > 0 and type(da[0]) is int:
+        try:
+            return hash_map_int.find_mode((da[i] for i in range(da.length())),
+                                          da.length())
+        except (TypeError, OverflowError):
+            pass
+
     map = HashMap()
     # Add DA values as keys, count as values to map. If key exists, increment
     # value instead of replace.
     for i in range(da.length()):
-        key = da[i]
-        node = map.get_node(key)
-        if node:
-            node.value += 1
-        else:
-            map.put(key, 1)
+        map.increment(da[i])
 
     mode_arr = DynamicArray()
     keys_vals = map.get_keys_and_values()
@@ -433,6 +946,115 @@ if __name__ == "__main__":
     print(m.get('key1'))
     m.remove('key4')
 
+    print("\nsetdefault / compute / increment / pop example 1")
+    print("-------------------------------------------------")
+    m = HashMap(53, hash_function_1)
+    print(m.setdefault('key1', 10), m.setdefault('key1', 20), m.get_size())
+    print(m.compute('key1', lambda v: v * 3), m.compute('key2', lambda v: [v]))
+    print(m.increment('key3'), m.increment('key3', 5), m.get('key3'))
+    print(m.pop('key3'), m.pop('key3'), m.pop('key3', 'missing'), m.get_size())
+
+    print("\ntree bucket example 1")
+    print("---------------------")
+    m = HashMap(11, hash_function_1)
+    anagrams = ['abcd', 'abdc', 'acbd', 'acdb', 'adbc', 'adcb',
+                'bacd', 'badc', 'bcad', 'bcda', 'bdac', 'bdca']
+    for i, key in enumerate(anagrams):
+        m.put(key, i)
+    print(m.get_size(), m.empty_buckets(), m.get('bcad'), m.contains_key('dcba'))
+    print(m._buckets[m.calc_index('abcd')])
+    for key in anagrams[:7]:
+        m.remove(key)
+    print(m.get_size(), m.get('bdca'), m._buckets[m.calc_index('abcd')])
+
+    print("\nreseed example 1")
+    print("----------------")
+    m = HashMap(101, hash_function_1)
+    for i, key in enumerate(anagrams):
+        m.put(key, i)
+    print(m.get_size(), m.empty_buckets(), m._hash_function is hash_function_1)
+    anagrams += ['cabd', 'cadb', 'cbad', 'cbda', 'cdab', 'cdba']
+    for i, key in enumerate(anagrams):
+        m.put(key, i)
+    print(m.get_size(), m.empty_buckets() > 83, isinstance(m._hash_function, SeededHash))
+    print(m.get('bdca'), m.contains_key('dcba'))
+
+    print("\nclear / empty_buckets example 3")
+    print("-------------------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(20):
+        m.put('key' + str(i), i)
+    print(m.get_size(), m.empty_buckets())
+    m.clear()
+    print(m.get_size(), m.empty_buckets(), m.get('key1'))
+    m.put('key1', 10)
+    m.clear()
+    m.put('key2', 20)
+    print(m.get_size(), m.empty_buckets(), m.get('key1'), m.get('key2'))
+
+    print("\nsnapshot example 1")
+    print("------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(10):
+        m.put('key' + str(i), i)
+    first = m.snapshot()
+    m.put('key1', 100)
+    m.increment('key2')
+    m.remove('key3')
+    m.put('new', 'value')
+    second = m.snapshot()
+    m.clear()
+    print(first.get_size(), first.get('key1'), first.get('key2'), first.get('key3'),
+          first.contains_key('new'), len(first._saved))
+    print(second.get_size(), second.get('key1'), second.get('key2'),
+          second.contains_key('key3'), second.get('new'), m.get_size())
+    print(sorted(as_list(first.get_keys_and_values())) == [('key' + str(i), i) for i in range(10)])
+
+    print("\nbloom filter example 1")
+    print("----------------------")
+    m = HashMap(53, hash_function_1)
+    m.enable_bloom_filter(0.01)
+    for i in range(200):
+        m.put('key' + str(i), i)
+    for i in range(0, 200, 2):
+        m.remove('key' + str(i))
+    misses = sum(not m._bloom.might_contain(m._hash_function('miss' + str(i)))
+                 for i in range(1000))
+    print(m.get('key1'), m.get('key2'), m.contains_key('key3'), misses > 900)
+    m.resize_table(500)
+    m.clear()
+    print(m.get('key1'), m._bloom.count)
+    m.disable_bloom_filter()
+
+    print("\nmerge example 1")
+    print("---------------")
+    a = HashMap(53, hash_function_1)
+    b = HashMap(53, hash_function_1)
+    for i in range(30):
+        a.increment("key" + str(i % 20))
+        b.increment("key" + str(i % 25 + 10))
+    a.merge(b, lambda x, y: x + y)
+    print(a.get_size(), a.get("key0"), a.get("key12"), a.get("key24"), a.get_capacity())
+    c = HashMap(11, hash_function_2)
+    c.put("key0", "zero")
+    c.merge(a)
+    print(c.get_size(), c.get("key0"), c.get("key12"), c.get_capacity())
+    d = HashMap(53, hash_function_1)
+    d.merge(b)
+    print(d.get_size(), d.get("key10"), d.get_capacity(), d.empty_buckets() == b.empty_buckets())
+
+    print("\nwrite_to / summary example 1")
+    print("----------------------------")
+    import io
+    m = HashMap(53, hash_function_1)
+    for i in range(20):
+        m.put('key' + str(i), i)
+    out = io.StringIO()
+    print(m.write_to(out), m.write_to(out, only_nonempty=False) == m.get_capacity())
+    print(out.getvalue().endswith(str(m)), m.write_to(out, limit=3))
+    print(''.join(m.iter_lines(limit=2)), end='')
+    print(m.summary())
+
     print("\nPDF - get_keys_and_values example 1")
     print("------------------------")
     m = HashMap(11, hash_function_2)
@@ -466,3 +1088,15 @@ if __name__ == "__main__":
         da = DynamicArray(case)
         mode, frequency = find_mode(da)
         print(f"Input: {da}\nMode : {mode}, Frequency: {frequency}\n")
+
+    print("\nfind_mode example 3")
+    print("-----------------------------")
+    test_cases = (
+        [2, 4, 2, 6, 8, 4, 1, 3, 4, 5, 7, 3, 3, 2],
+        [-1, 10 ** 12, 10 ** 12, -1, 7]
+    )
+
+    for case in test_cases:
+        da = DynamicArray(case)
+        mode, frequency = find_mode(da)
+        print(f"Input: {da}\nMode : {mode}, Frequency: {frequency}\n")
@@ -0,0 +1,375 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Hash map for data larger than memory. Keys are split into
+#              partitions by hash, each a separate chaining HashMap. When the
+#              map holds more entries than its memory budget, the least
+#              recently used partitions are spilled to files, and changes to
+#              a spilled partition are appended to its file in batches until
+#              it is needed again.
+
+
+import os
+import pickle
+import shutil
+import tempfile
+
+from a6_include import DynamicArray, as_list, hash_function_1, hash_function_2
+from hash_map_sc import HashMap
+
+
+# Operation codes of spill file records.
+PUT = 'p'
+REMOVE = 'r'
+INCREMENT = 'i'
+
+
+class SpillingHashMap:
+    def __init__(self,
+                 memory_budget: int = 100000,
+                 partitions: int = 16,
+                 function: callable = hash_function_1,
+                 directory: str = None,
+                 batch_size: int = 1024) -> None:
+        """
+        Initialize new SpillingHashMap that keeps at most about memory_budget
+        entries (and pending records) in memory, spilling partitions to
+        files in directory (a new temporary directory by default). Records
+        for a spilled partition are written batch_size at a time. Each
+        partition on its own must fit in memory.
+        """
+        self._partitions = partitions
+        self._hash_function = function
+        self._memory_budget = memory_budget
+        self._batch_size = batch_size
+        self._own_directory = directory is None
+        self._directory = tempfile.mkdtemp() if directory is None else directory
+
+        # A partition is resident (a HashMap in _maps) or spilled (None in
+        # _maps, with its records in a file and _buffers).
+        self._maps = [HashMap(11, function) for _ in range(partitions)]
+        self._buffers = [[] for _ in range(partitions)]
+
+        # Entry counts of spilled partitions, None for one with records
+        # appended since, whose count isn't known until it's read.
+        self._sizes = [0] * partitions
+
+        self._last_used = [0] * partitions
+        self._clock = 0
+        self._in_memory = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for p in range(self._partitions):
+            state = 'spilled' if self._maps[p] is None else 'resident'
+            out += str(p) + ': ' + state + '\n'
+        return out
+
+    def __enter__(self) -> "SpillingHashMap":
+        """Return the map for use in a with statement."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the map at the end of a with statement."""
+        self.close()
+
+    def get_size(self) -> int:
+        """
+        Return size of map. Only spilled partitions changed since their
+        entries were last counted are read to count them.
+        """
+        size = 0
+        for p in range(self._partitions):
+            if self._maps[p] is not None:
+                size += self._maps[p].get_size()
+            else:
+                if self._sizes[p] is None:
+                    self._read_partition(p)
+                size += self._sizes[p]
+        return size
+
+    def get_spilled_count(self) -> int:
+        """
+        Return the number of partitions currently spilled to files.
+        """
+        return self._maps.count(None)
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Adds the input key/value pair to the SpillingHashMap.
+        """
+        p = self._partition(key)
+        if self._maps[p] is None:
+            self._append(p, (PUT, key, value))
+        else:
+            self._update(p, HashMap.put, key, value)
+
+    def increment(self, key: str, delta: int = 1) -> None:
+        """
+        Adds delta to the value of the input key's entry, starting from 0 if
+        the key doesn't exist yet. A spilled partition isn't read back; the
+        increment is recorded and applied when it is.
+        """
+        p = self._partition(key)
+        if self._maps[p] is None:
+            self._append(p, (INCREMENT, key, delta))
+        else:
+            self._update(p, HashMap.increment, key, delta)
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the entry matching input key from the SpillingHashMap.
+        """
+        p = self._partition(key)
+        if self._maps[p] is None:
+            self._append(p, (REMOVE, key))
+        else:
+            self._update(p, HashMap.remove, key)
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry if it exists or None
+        otherwise, reading its partition back into memory if it was spilled.
+        """
+        return self._resident(self._partition(key)).get(key)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the input key exists in the SpillingHashMap or False
+        otherwise, reading its partition back into memory if it was spilled.
+        """
+        return self._resident(self._partition(key)).contains_key(key)
+
+    def clear(self) -> None:
+        """
+        Clears all entries from the SpillingHashMap and its spill files.
+        """
+        for p in range(self._partitions):
+            if os.path.exists(self._path(p)):
+                os.remove(self._path(p))
+        self._maps = [HashMap(11, self._hash_function)
+                      for _ in range(self._partitions)]
+        self._buffers = [[] for _ in range(self._partitions)]
+        self._sizes = [0] * self._partitions
+        self._in_memory = 0
+
+    def iter_keys_and_values(self):
+        """
+        Yields (key, value) for every entry, one partition at a time, so
+        spilled partitions are read without making them resident.
+        """
+        for p in range(self._partitions):
+            map = self._maps[p]
+            if map is None:
+                map = self._read_partition(p)
+            for pair in as_list(map.get_keys_and_values()):
+                yield pair
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the
+        SpillingHashMap, merging spilled partitions from their files.
+        """
+        return DynamicArray(list(self.iter_keys_and_values()))
+
+    def close(self) -> None:
+        """
+        Deletes the spill files, and the spill directory if it was created
+        by the map.
+        """
+        for p in range(self._partitions):
+            if os.path.exists(self._path(p)):
+                os.remove(self._path(p))
+        if self._own_directory:
+            shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _partition(self, key: str) -> int:
+        """
+        Returns the partition of input key, marking it as used.
+        """
+        p = self._hash_function(key) % self._partitions
+        self._clock += 1
+        self._last_used[p] = self._clock
+        return p
+
+    def _path(self, p: int) -> str:
+        """Return the path of the spill file of partition p."""
+        return os.path.join(self._directory, 'partition-' + str(p) + '.spill')
+
+    def _update(self, p: int, operation: callable, *args) -> None:
+        """
+        Applies a HashMap method to resident partition p, growing its table
+        and spilling other partitions as needed.
+        """
+        map = self._maps[p]
+        size = map.get_size()
+        operation(map, *args)
+        self._in_memory += map.get_size() - size
+        if map.table_load() > 1:
+            map.resize_table(map.get_capacity() * 2)
+        if self._in_memory > self._memory_budget:
+            self._spill(p)
+
+    def _append(self, p: int, record: tuple) -> None:
+        """
+        Buffers a record for spilled partition p, writing the buffer to its
+        file once it holds batch_size records.
+        """
+        self._buffers[p].append(record)
+        self._sizes[p] = None
+        self._in_memory += 1
+        if len(self._buffers[p]) >= self._batch_size:
+            self._flush(p)
+        if self._in_memory > self._memory_budget:
+            self._spill(p)
+
+    def _flush(self, p: int) -> None:
+        """
+        Appends the buffered records of partition p to its file as one batch.
+        """
+        if not self._buffers[p]:
+            return
+        with open(self._path(p), 'ab') as fileobj:
+            pickle.dump(self._buffers[p], fileobj, pickle.HIGHEST_PROTOCOL)
+        self._in_memory -= len(self._buffers[p])
+        self._buffers[p] = []
+
+    def _spill(self, keep: int) -> None:
+        """
+        Spills least recently used resident partitions other than keep, and
+        then flushes record buffers, until the map is within its budget.
+        """
+        while self._in_memory > self._memory_budget:
+            victim = None
+            for p in range(self._partitions):
+                if (p != keep and self._maps[p] is not None
+                        and (victim is None
+                             or self._last_used[p] < self._last_used[victim])):
+                    victim = p
+            if victim is None:
+                break
+
+            # The resident map is the whole partition, so it replaces the file.
+            map = self._maps[victim]
+            with open(self._path(victim), 'wb') as fileobj:
+                records = [(PUT, key, value)
+                           for key, value in as_list(map.get_keys_and_values())]
+                for start in range(0, len(records), self._batch_size):
+                    pickle.dump(records[start:start + self._batch_size],
+                                fileobj, pickle.HIGHEST_PROTOCOL)
+            self._maps[victim] = None
+            self._sizes[victim] = map.get_size()
+            self._in_memory -= map.get_size()
+
+        if self._in_memory > self._memory_budget:
+            for p in range(self._partitions):
+                self._flush(p)
+
+    def _read_partition(self, p: int) -> HashMap:
+        """
+        Returns a HashMap of spilled partition p built from its file and
+        buffered records, noting its entry count.
+        """
+        self._flush(p)
+        map = HashMap(11, self._hash_function)
+        if not os.path.exists(self._path(p)):
+            self._sizes[p] = 0
+            return map
+
+        with open(self._path(p), 'rb') as fileobj:
+            while True:
+                try:
+                    records = pickle.load(fileobj)
+                except EOFError:
+                    break
+                for record in records:
+                    if record[0] == PUT:
+                        map.put(record[1], record[2])
+                    elif record[0] == INCREMENT:
+                        map.increment(record[1], record[2])
+                    else:
+                        map.remove(record[1])
+                    if map.table_load() > 1:
+                        map.resize_table(map.get_capacity() * 2)
+        self._sizes[p] = map.get_size()
+        return map
+
+    def _resident(self, p: int) -> HashMap:
+        """
+        Returns the HashMap of partition p, reading it back into memory and
+        deleting its file if it was spilled.
+        """
+        if self._maps[p] is None:
+            map = self._read_partition(p)
+            if os.path.exists(self._path(p)):
+                os.remove(self._path(p))
+            self._maps[p] = map
+            self._in_memory += map.get_size()
+            self._spill(p)
+        return self._maps[p]
+
+
+def find_mode(da: DynamicArray, memory_budget: int = 100000) -> (DynamicArray, int):
+    """
+    Returns a tuple of 1) an array of the highest occurrence values in the
+    input array and 2) the number of occurrences of those values, keeping
+    at most about memory_budget counts in memory.
+    """
+    mode_arr = DynamicArray()
+    count = 0
+    with SpillingHashMap(memory_budget) as map:
+        for i in range(da.length()):
+            map.increment(da[i])
+
+        for key, value in map.iter_keys_and_values():
+            if value == count:
+                mode_arr.append(key)
+            if value > count:
+                mode_arr = DynamicArray()
+                mode_arr.append(key)
+                count = value
+
+    return mode_arr, count
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput / get / spill example 1")
+    print("---------------------------")
+    with SpillingHashMap(200, 8, hash_function_1, batch_size=16) as m:
+        for i in range(1000):
+            m.put('key' + str(i), i)
+        print(m.get_spilled_count() > 0, m.get_size())
+        m.remove('key5')
+        m.put('key6', 'six')
+        print(m.get('key5'), m.get('key6'), m.get('key999'), m.contains_key('key1000'))
+        print(sorted(m.iter_keys_and_values())[:3], m.get_keys_and_values().length())
+        m.clear()
+        print(m.get_size(), m.get_spilled_count(), m.get('key1'))
+
+    print("\nincrement example 1")
+    print("-------------------")
+    with SpillingHashMap(50, 4, hash_function_2, batch_size=8) as m:
+        for i in range(600):
+            m.increment('key' + str(i % 120))
+        print(m.get_spilled_count() > 0, m.get_size(), m.get('key7'), m.get('key119'))
+
+    print("\nfind_mode example 1")
+    print("-------------------")
+    test_cases = (
+        ["Arch", "Manjaro", "Manjaro", "Mint", "Mint", "Mint", "Ubuntu", "Ubuntu", "Ubuntu", "Ubuntu"],
+        ["2", "4", "2", "6", "8", "4", "1", "3", "4", "5", "7", "3", "3", "2"]
+    )
+    for case in test_cases:
+        da = DynamicArray(case)
+        mode, frequency = find_mode(da, 3)
+        print(f"Input: {da}\nMode : {mode}, Frequency: {frequency}\n")
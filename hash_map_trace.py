@@ -0,0 +1,385 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Workload tracing for the HashMaps. A TracingHashMap wraps a
+#              map and writes a compact binary trace of its operations, key
+#              hashes and timings, and replay re-runs a trace against any
+#              map to compare throughput and latency.
+
+
+import struct
+import time
+
+from a6_include import as_list, hash_function_1, hash_function_2
+
+
+# Trace files start with MAGIC and a byte that is 1 if keys were recorded,
+# followed by one record per operation: the operation code, the key's hash
+# (the new capacity for resize_table), the duration in nanoseconds and a key
+# field. With keys recorded, the key field is the length of the UTF-8 key
+# bytes that follow; otherwise it's the key's ordinal, a number given to
+# each distinct key in order of first use.
+MAGIC = b'HMTRACE2'
+RECORD = struct.Struct('<BQQI')
+
+# Key field of a record for an operation without a key.
+NO_KEY = 0xFFFFFFFF
+
+# Operation codes of trace records.
+PUT = 1
+GET = 2
+REMOVE = 3
+CONTAINS_KEY = 4
+RESIZE_TABLE = 5
+CLEAR = 6
+POP = 7
+SETDEFAULT = 8
+INCREMENT = 9
+COMPUTE = 10
+
+OPERATION_NAMES = {PUT: 'put', GET: 'get', REMOVE: 'remove',
+                   CONTAINS_KEY: 'contains_key', RESIZE_TABLE: 'resize_table',
+                   CLEAR: 'clear', POP: 'pop', SETDEFAULT: 'setdefault',
+                   INCREMENT: 'increment', COMPUTE: 'compute'}
+
+# Methods that change a map in ways a trace can't replay. TracingHashMap
+# refuses them rather than let the map and its trace drift apart.
+UNTRACED_METHODS = frozenset({'merge', 'put_if_absent', 'reseed'})
+
+# Stored hashes are kept to 64 bits to fit the record.
+HASH_MASK = (1 << 64) - 1
+
+
+def encode_record(op: int, hash: int, nanoseconds: int,
+                  key: object = None) -> bytes:
+    """
+    Returns the bytes of a trace record, followed by the key if given as
+    bytes. key may instead be the key's ordinal, or None for an operation
+    without a key.
+    """
+    if key is None:
+        return RECORD.pack(op, hash & HASH_MASK, nanoseconds, NO_KEY)
+    if type(key) is int:
+        return RECORD.pack(op, hash & HASH_MASK, nanoseconds, key)
+    return RECORD.pack(op, hash & HASH_MASK, nanoseconds, len(key)) + key
+
+
+def read_trace(fileobj):
+    """
+    Yields (op, hash, nanoseconds, key) for each complete record of a trace
+    file, where key is the key's ordinal if keys weren't recorded and None
+    for an operation without a key. Stops at a torn record at the end of the
+    file. Raises ValueError if the file isn't a trace.
+    """
+    if fileobj.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a HashMap trace file")
+    record_keys = fileobj.read(1) == b'\x01'
+
+    while True:
+        header = fileobj.read(RECORD.size)
+        if len(header) < RECORD.size:
+            return
+        op, hash, nanoseconds, key = RECORD.unpack(header)
+        if key == NO_KEY:
+            key = None
+        elif record_keys:
+            encoded = fileobj.read(key)
+            if len(encoded) < key:
+                return
+            key = encoded.decode()
+        yield op, hash, nanoseconds, key
+
+
+class TracingHashMap:
+    def __init__(self, map, path: str, record_keys: bool = True,
+                 buffer_size: int = 4096) -> None:
+        """
+        Initialize new TracingHashMap that passes every call through to map,
+        writing a trace of the calls that use or change its entries to path.
+        Records are written buffer_size at a time. Keys must be strings when
+        record_keys is True; without keys, a replay can only use a stand-in
+        key for each distinct key.
+        """
+        self._map = map
+        self._record_keys = record_keys
+        self._ordinals = None if record_keys else {}
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC + (b'\x01' if record_keys else b'\x00'))
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        return str(self._map)
+
+    def __getattr__(self, name: str) -> object:
+        """
+        Pass any other method or attribute through to the wrapped map,
+        without tracing it. Raises AttributeError for the methods in
+        UNTRACED_METHODS, whose changes a trace couldn't replay.
+        """
+        if name in UNTRACED_METHODS:
+            raise AttributeError("TracingHashMap can't trace " + name)
+        return getattr(self._map, name)
+
+    def __enter__(self) -> "TracingHashMap":
+        """Return the map for use in a with statement."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the trace at the end of a with statement."""
+        self.close()
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Adds the input key/value pair to the wrapped map.
+        """
+        self._traced(PUT, self._map.put, key, value)
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of the input key's entry in the wrapped map.
+        """
+        return self._traced(GET, self._map.get, key)
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the entry matching input key from the wrapped map.
+        """
+        self._traced(REMOVE, self._map.remove, key)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if input key is contained in the wrapped map, False
+        otherwise.
+        """
+        return self._traced(CONTAINS_KEY, self._map.contains_key, key)
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes the entry matching input key from the wrapped map and returns
+        its value, or returns default if the key doesn't exist.
+        """
+        return self._traced(POP, self._map.pop, key, default)
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Returns the value of the input key's entry in the wrapped map, first
+        adding the key with the default value if it doesn't exist.
+        """
+        return self._traced(SETDEFAULT, self._map.setdefault, key, default)
+
+    def increment(self, key: str, delta: int = 1) -> int:
+        """
+        Adds delta to the value of the input key's entry in the wrapped map
+        and returns the new value.
+        """
+        return self._traced(INCREMENT, self._map.increment, key, delta)
+
+    def compute(self, key: str, function: callable) -> object:
+        """
+        Replaces the value of the input key's entry in the wrapped map with
+        function(value) and returns the new value.
+        """
+        return self._traced(COMPUTE, self._map.compute, key, function)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes the wrapped map's capacity to the input capacity.
+        """
+        start = time.perf_counter_ns()
+        self._map.resize_table(new_capacity)
+        self._buffer.append(encode_record(RESIZE_TABLE, new_capacity,
+                                          time.perf_counter_ns() - start))
+
+    def clear(self) -> None:
+        """
+        Clears all entries from the wrapped map.
+        """
+        start = time.perf_counter_ns()
+        self._map.clear()
+        self._buffer.append(encode_record(CLEAR, 0,
+                                          time.perf_counter_ns() - start))
+
+    def flush(self) -> None:
+        """
+        Writes buffered records to the trace file.
+        """
+        self._file.write(b''.join(self._buffer))
+        self._file.flush()
+        self._buffer = []
+
+    def close(self) -> None:
+        """
+        Writes buffered records and closes the trace file.
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def _traced(self, op: int, method: callable, key: str, *args) -> object:
+        """
+        Calls a method of the wrapped map on input key and buffers a record
+        of the call. The key is hashed with the map's hash function before
+        the call, which may reseed it, and outside the timing.
+        """
+        hash = self._map._hash_function(key)
+        start = time.perf_counter_ns()
+        result = method(key, *args)
+        nanoseconds = time.perf_counter_ns() - start
+
+        if self._record_keys:
+            encoded = key.encode()
+        else:
+            encoded = self._ordinals.setdefault(key, len(self._ordinals))
+        self._buffer.append(encode_record(op, hash, nanoseconds, encoded))
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+        return result
+
+
+def replay(path: str, map) -> dict:
+    """
+    Re-runs the trace in path against map and returns a dictionary of
+    operation name to the list of durations of its calls in nanoseconds.
+    Records without their key use the key's ordinal as a string in its
+    place, which keeps which operations hit the same key but not which keys
+    collide. Values put, set by default or computed are the record numbers,
+    and increments add 1.
+    """
+    durations = {name: [] for name in OPERATION_NAMES.values()}
+    with open(path, 'rb') as fileobj:
+        for i, (op, hash, nanoseconds, key) in enumerate(read_trace(fileobj)):
+            call = getattr(map, OPERATION_NAMES[op])
+            if type(key) is int:
+                key = str(key)
+            if op == RESIZE_TABLE:
+                args = (hash,)
+            elif op == CLEAR:
+                args = ()
+            elif op == PUT or op == SETDEFAULT:
+                args = (key, i)
+            elif op == COMPUTE:
+                args = (key, lambda value, i=i: i)
+            else:
+                args = (key,)
+
+            start = time.perf_counter_ns()
+            call(*args)
+            durations[OPERATION_NAMES[op]].append(time.perf_counter_ns() - start)
+
+    return durations
+
+
+def recorded_durations(path: str) -> dict:
+    """
+    Returns the durations recorded in the trace in path, in the same form
+    as replay.
+    """
+    durations = {name: [] for name in OPERATION_NAMES.values()}
+    with open(path, 'rb') as fileobj:
+        for op, hash, nanoseconds, key in read_trace(fileobj):
+            durations[OPERATION_NAMES[op]].append(nanoseconds)
+    return durations
+
+
+def summarize(durations: list) -> (int, float, int, int):
+    """
+    Returns a tuple of the number of calls, their total seconds and the
+    median and 99th percentile of their durations in nanoseconds.
+    """
+    if not durations:
+        return 0, 0.0, 0, 0
+    ordered = sorted(durations)
+    return (len(ordered), sum(ordered) / 1e9, ordered[len(ordered) // 2],
+            ordered[min(len(ordered) - 1, len(ordered) * 99 // 100)])
+
+
+def compare(path: str, maps: dict) -> str:
+    """
+    Replays the trace in path against each map of maps, a dictionary of
+    name to map, and returns a report of each operation's throughput and
+    latency as recorded and as replayed, with the change in total time.
+    """
+    results = {'recorded': recorded_durations(path)}
+    for name, map in maps.items():
+        results[name] = replay(path, map)
+
+    width = max(len(name) for name in results)
+    lines = []
+    for op in OPERATION_NAMES.values():
+        count, base_seconds = summarize(results['recorded'][op])[:2]
+        if count == 0:
+            continue
+        lines.append(op + ' (' + str(count) + ' calls)')
+        for name, durations in results.items():
+            count, seconds, median, p99 = summarize(durations[op])
+            change = ''
+            if name != 'recorded' and base_seconds:
+                change = '  {:+.0%}'.format(seconds / base_seconds - 1)
+            lines.append('  {}  {:>10.0f} ops/s  p50 {:>7} ns  p99 {:>7} ns{}'
+                         .format(name.ljust(width), count / seconds if seconds else 0,
+                                 median, p99, change))
+    return '\n'.join(lines)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    import io
+    import os
+    import tempfile
+
+    import hash_map_oa
+    import hash_map_sc
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'workload.trace')
+
+    print("\nrecord example 1")
+    print("----------------")
+    with TracingHashMap(hash_map_sc.HashMap(11, hash_function_1), path, buffer_size=16) as m:
+        for i in range(100):
+            m.put('key' + str(i % 40), i)
+            m.get('key' + str(i % 50))
+        m.remove('key3')
+        m.resize_table(101)
+        print(m.get_size(), m.get_capacity(), m.contains_key('key3'), m.get('key39'))
+    with open(path, 'rb') as fileobj:
+        records = list(read_trace(fileobj))
+    print(len(records), records[0][0] == PUT, records[0][3], records[-1][:2])
+    print(os.path.getsize(path) == len(MAGIC) + 1 + len(records) * RECORD.size
+          + sum(len(key) for op, hash, ns, key in records if key is not None))
+
+    print("\nreplay example 1")
+    print("----------------")
+    m = hash_map_oa.HashMap(11, hash_function_2)
+    durations = replay(path, m)
+    print(m.get_size(), m.get_capacity(), m.get('key39'),
+          {op: len(calls) for op, calls in durations.items() if calls})
+    report = compare(path, {'SC hash 2': hash_map_sc.HashMap(11, hash_function_2),
+                            'OA hash 1': hash_map_oa.HashMap(11, hash_function_1)})
+    print([line.split()[0] for line in report.splitlines() if not line.startswith(' ')])
+
+    print("\nkeyless trace example 1")
+    print("-----------------------")
+    with TracingHashMap(hash_map_oa.HashMap(11, hash_function_1), path, False) as m:
+        for key in ('a', 'b', 'a', 'c'):
+            m.put(key, 1)
+    m = hash_map_sc.HashMap(11, hash_function_1)
+    replay(path, m)
+    print(m.get_size(), sorted(key for key, value in as_list(m.get_keys_and_values())))
+    try:
+        list(read_trace(io.BytesIO(b'not a trace')))
+    except ValueError as error:
+        print(error)
+
+    os.remove(path)
+    os.rmdir(directory)
@@ -0,0 +1,214 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Implementation of a hash multimap on top of the separate
+#              chaining HashMap. A key with one value stores it directly in
+#              its node; only keys with several values get a value list.
+
+
+from a6_include import DynamicArray, as_list, hash_function_1, hash_function_2
+from hash_map_sc import HashMap
+
+
+class _Values(list):
+    """
+    List of the values of a key that has more than one, told apart from a
+    single value that happens to be a list.
+    """
+    __slots__ = ()
+
+
+# Returned by pop for a key that doesn't exist.
+_MISSING = object()
+
+
+class HashMultiMap:
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_function_1) -> None:
+        """
+        Initialize new HashMultiMap that uses separate chaining for collision
+        resolution
+        """
+        self._map = HashMap(capacity, function)
+        self._value_count = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        return str(self._map)
+
+    def get_size(self) -> int:
+        """
+        Return number of keys in the multimap
+        """
+        return self._map.get_size()
+
+    def get_value_count(self) -> int:
+        """
+        Return number of key/value pairs in the multimap
+        """
+        return self._value_count
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of multimap
+        """
+        return self._map.get_capacity()
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Adds the input value to the values of the input key.
+        """
+        # A new key is stored with its value in the same lookup.
+        node = self._map.put_if_absent(key, value)
+        if node is not None:
+            if type(node.value) is _Values:
+                node.value.append(value)
+            else:
+                node.value = _Values((node.value, value))
+        self._value_count += 1
+
+    def get(self, key: str) -> DynamicArray:
+        """
+        Returns a DynamicArray of the values of the input key, empty if the
+        key doesn't exist.
+        """
+        node = self._map.get_node(key)
+        if node is None:
+            return DynamicArray()
+        if type(node.value) is _Values:
+            return DynamicArray(node.value)
+        return DynamicArray([node.value])
+
+    def count(self, key: str) -> int:
+        """
+        Returns the number of values of the input key.
+        """
+        node = self._map.get_node(key)
+        if node is None:
+            return 0
+        if type(node.value) is _Values:
+            return len(node.value)
+        return 1
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the input key has any values, False otherwise.
+        """
+        return self._map.contains_key(key)
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the input key and all of its values.
+        """
+        values = self._map.pop(key, _MISSING)
+        if values is _MISSING:
+            return
+        self._value_count -= len(values) if type(values) is _Values else 1
+
+    def remove_value(self, key: str, value: object) -> bool:
+        """
+        Removes one occurrence of the input value from the values of the
+        input key. Returns True if a value was removed.
+        """
+        node = self._map.get_node(key)
+        if node is None:
+            return False
+
+        if type(node.value) is not _Values:
+            if node.value != value:
+                return False
+            self._map.remove(key)
+        else:
+            if value not in node.value:
+                return False
+            node.value.remove(value)
+            # Store a lone remaining value directly again.
+            if len(node.value) == 1:
+                node.value = node.value[0]
+
+        self._value_count -= 1
+        return True
+
+    def table_load(self) -> float:
+        """
+        Returns the current load factor (keys per bucket) of a HashMultiMap.
+        """
+        return self._map.table_load()
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets in a HashMultiMap.
+        """
+        return self._map.empty_buckets()
+
+    def clear(self) -> None:
+        """
+        Clears all keys and values from a HashMultiMap.
+        """
+        self._map.clear()
+        self._value_count = 0
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes the HashMultiMap's capacity to the input capacity.
+        """
+        self._map.resize_table(new_capacity)
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of tuples of all key/value pairs in the
+        HashMultiMap, one tuple per value.
+        """
+        table_array = DynamicArray()
+        for key, value in as_list(self._map.get_keys_and_values()):
+            if type(value) is _Values:
+                for item in value:
+                    table_array.append((key, item))
+            else:
+                table_array.append((key, value))
+
+        return table_array
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput / get example 1")
+    print("-------------------")
+    m = HashMultiMap(53, hash_function_2)
+    for i in range(30):
+        m.put('key' + str(i % 7), i)
+    print(m.get_size(), m.get_value_count(), m.get_capacity())
+    print(m.get('key3'), m.count('key3'), m.get('missing'), m.count('missing'))
+    m.put('list', [1, 2])
+    print(m.get('list'), m.count('list'))
+
+    print("\nremove / remove_value example 1")
+    print("-------------------------------")
+    print(m.remove_value('key3', 10), m.remove_value('key3', 99), m.get('key3'))
+    for value in (3, 17):
+        m.remove_value('key3', value)
+    print(m.get('key3'), m.count('key3'), m.remove_value('key3', 24))
+    print(m.contains_key('key3'), m.get_size(), m.get_value_count())
+    m.remove('key0')
+    print(m.contains_key('key0'), m.get_size(), m.get_value_count())
+
+    print("\nget_keys_and_values example 1")
+    print("-----------------------------")
+    m = HashMultiMap(11, hash_function_2)
+    for i in range(1, 4):
+        m.put(str(i), i * 10)
+        m.put(str(i), i * 100)
+    m.put('4', 40)
+    m.resize_table(2)
+    print(m.get_keys_and_values())
+    m.clear()
+    print(m.get_size(), m.get_value_count(), m.empty_buckets())
@@ -0,0 +1,329 @@
+# Name: Kirby Little
+# OSU Email: littleki@oregonstate.edu
+# Course: CS261 - Data Structures
+# Assignment: 6
+# Due Date: 08/09/2022
+# Description: Implementation of a hash set using open addressing with
+#              quadratic probing, like the OA HashMap, but storing only keys
+#              (and their hashes) instead of HashEntry objects.
+
+
+from a6_include import (DynamicArray, FastDynamicArray, hash_function_1,
+                        hash_function_2)
+from hash_map_base import HashTableBase
+
+
+class _Tombstone:
+    """
+    Placeholder left in the slot of a removed key.
+    """
+
+    def __repr__(self) -> str:
+        """Return a readable name for the placeholder."""
+        return 'TS'
+
+
+_TOMBSTONE = _Tombstone()
+
+
+class HashSet(HashTableBase):
+    def __init__(self, capacity: int, function) -> None:
+        """
+        Initialize new HashSet that uses quadratic probing for collision
+        resolution
+        """
+        # capacity must be a prime number
+        self._capacity = self._next_prime(capacity)
+        self._keys = FastDynamicArray(length=self._capacity)
+        self._hashes = FastDynamicArray(length=self._capacity, value=0)
+
+        self._hash_function = function
+        self._size = 0
+        self._occupied = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        return "{" + ", ".join(str(key) for key in self) + "}"
+
+    def __iter__(self):
+        """
+        Return an iterator over the keys of the set.
+        """
+        return (key for key in self._keys
+                if key is not None and key is not _TOMBSTONE)
+
+    # ------------------------------------------------------------------ #
+
+    def add(self, key: str) -> None:
+        """
+        Adds the input key to a HashSet object.
+        """
+        self._add_hashed(key, self._hash_function(key))
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty slots in a HashSet object.
+        """
+        return self._capacity - self._occupied
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes a HashSet object's capacity to the input capacity. Adjusts
+        the new capacity to a prime number if it is not. Keys keep their
+        stored hashes, so nothing is rehashed.
+        """
+        if new_capacity < self._size:
+            return
+
+        # Make sure new capacity is prime and make it next nearest prime if
+        # not, doubling it until the set would be at most half full.
+        if not self._is_prime(new_capacity):
+            new_capacity = self._next_prime(new_capacity)
+        while self._size * 2 > new_capacity:
+            new_capacity = self._next_prime(new_capacity * 2)
+
+        keys, hashes = self._keys, self._hashes
+        self._capacity = new_capacity
+        self._keys = FastDynamicArray(length=new_capacity)
+        self._hashes = FastDynamicArray(length=new_capacity, value=0)
+        self._size = 0
+        self._occupied = 0
+        for i in range(keys.length()):
+            key = keys.get_unchecked(i)
+            if key is not None and key is not _TOMBSTONE:
+                index, found = self._probe(key, hashes.get_unchecked(i))
+                self._store(index, key, hashes.get_unchecked(i))
+
+    def contains(self, key: str) -> bool:
+        """
+        Returns True if input key is in the HashSet, False otherwise.
+        """
+        if self._size == 0:
+            return False
+
+        return self._probe(key, self._hash_function(key))[1]
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if input key is in the HashSet, False otherwise.
+        """
+        return self.contains(key)
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the input key from the HashSet.
+        """
+        index, found = self._probe(key, self._hash_function(key))
+        if found:
+            self._keys.set_unchecked(index, _TOMBSTONE)
+            self._size -= 1
+
+        return
+
+    def clear(self) -> None:
+        """
+        Clears the HashSet of all keys.
+        """
+        self._keys = FastDynamicArray(length=self._capacity)
+        self._hashes = FastDynamicArray(length=self._capacity, value=0)
+        self._size = 0
+        self._occupied = 0
+
+    def get_keys(self) -> DynamicArray:
+        """
+        Returns a DynamicArray of all keys in the HashSet.
+        """
+        return DynamicArray(list(self))
+
+    def union(self, other: "HashSet") -> "HashSet":
+        """
+        Returns a new HashSet of the keys in either this or the other set.
+        """
+        result = self._empty_result(self._size + other._size)
+        for source in (self, other):
+            for key, hash in result._hashed_keys(source):
+                result._add_hashed(key, hash)
+
+        result.FLOOD_PROBE_LENGTH = self.FLOOD_PROBE_LENGTH
+        return result
+
+    def intersection(self, other: "HashSet") -> "HashSet":
+        """
+        Returns a new HashSet of the keys in both this and the other set.
+        """
+        # Walk the smaller set, probing the larger one.
+        small, large = (self, other) if self._size <= other._size else (other, self)
+        result = self._empty_result(small._size)
+        for key, hash in small._hashed_keys(small):
+            large_hash = large._hash_of(key, hash, small)
+            if large._probe(key, large_hash)[1]:
+                result._add_hashed(key, hash if small is self else large_hash)
+
+        result.FLOOD_PROBE_LENGTH = self.FLOOD_PROBE_LENGTH
+        return result
+
+    def difference(self, other: "HashSet") -> "HashSet":
+        """
+        Returns a new HashSet of the keys in this set but not the other set.
+        """
+        result = self._empty_result(self._size)
+        for key, hash in self._hashed_keys(self):
+            if (other._size == 0
+                    or not other._probe(key, other._hash_of(key, hash, self))[1]):
+                result._add_hashed(key, hash)
+
+        result.FLOOD_PROBE_LENGTH = self.FLOOD_PROBE_LENGTH
+        return result
+
+    def _rehash_keys(self) -> None:
+        """
+        Recomputes the stored hash of every key with the hash function.
+        """
+        for i in range(self._capacity):
+            key = self._keys.get_unchecked(i)
+            if key is not None and key is not _TOMBSTONE:
+                self._hashes.set_unchecked(i, self._hash_function(key))
+
+    def _empty_result(self, size: int) -> "HashSet":
+        """
+        Returns an empty HashSet with this set's hash function and room for
+        size keys. Its flood detection is off while it's being filled with
+        precomputed hashes, which a reseed would invalidate.
+        """
+        result = HashSet(2 * size, self._hash_function)
+        result.FLOOD_PROBE_LENGTH = None
+        return result
+
+    def _hashed_keys(self, source: "HashSet"):
+        """
+        Yields (key, hash) for every key of source, with hashes for this
+        set's hash function.
+        """
+        for i in range(source._capacity):
+            key = source._keys.get_unchecked(i)
+            if key is not None and key is not _TOMBSTONE:
+                yield key, self._hash_of(key, source._hashes.get_unchecked(i),
+                                         source)
+
+    def _hash_of(self, key: str, hash: int, source: "HashSet") -> int:
+        """
+        Returns this set's hash of input key, given its hash in source. The
+        given hash is reused when both sets hash the same way.
+        """
+        if source._hash_function == self._hash_function:
+            return hash
+        return self._hash_function(key)
+
+    def _add_hashed(self, key: str, hash: int) -> None:
+        """
+        Adds input key with its precomputed hash, resizing first if the new
+        key would fill over half of the slots (just clearing out tombstones
+        if they are most of those).
+        """
+        # Quadratic probing only reaches about half of the slots, so keeping
+        # half of them empty lets every probe sequence reach an empty one.
+        if (self._occupied + 1) * 2 > self._capacity:
+            if self._size * 4 >= self._capacity:
+                self.resize_table(self._capacity * 2)
+            else:
+                self.resize_table(self._capacity)
+
+        index, found = self._probe(key, hash)
+        if found:
+            return
+
+        if (self.FLOOD_PROBE_LENGTH is not None
+                and self._probe_length > self.FLOOD_PROBE_LENGTH):
+            self.reseed()
+            hash = self._hash_function(key)
+            index, found = self._probe(key, hash)
+
+        self._store(index, key, hash)
+
+    def _store(self, index: int, key: str, hash: int) -> None:
+        """
+        Writes an absent key and its hash into the slot at index.
+        """
+        if self._keys.get_unchecked(index) is None:
+            self._occupied += 1
+        self._keys.set_unchecked(index, key)
+        self._hashes.set_unchecked(index, hash)
+        self._size += 1
+
+    def _probe(self, key: str, hash: int) -> (int, bool):
+        """
+        Returns a tuple of 1) the index of the slot holding input key, or the
+        index a new key should be placed at, and 2) whether the key was found.
+        """
+        index_init = hash % self._capacity
+        index = index_init
+        slot = self._keys.get_unchecked(index)
+        tombstone_i = None
+        j = 1
+
+        # Probe until an empty slot, comparing stored hashes before keys and
+        # marking the first tombstone for reuse.
+        while slot is not None:
+            if slot is _TOMBSTONE:
+                if tombstone_i is None:
+                    tombstone_i = index
+            elif self._hashes.get_unchecked(index) == hash and slot == key:
+                self._probe_length = j
+                return index, True
+            index = (index_init + j ** 2) % self._capacity
+            slot = self._keys.get_unchecked(index)
+            j += 1
+
+        self._probe_length = j
+        if tombstone_i is not None:
+            return tombstone_i, False
+        return index, False
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nadd example 1")
+    print("-------------")
+    s = HashSet(53, hash_function_1)
+    for i in range(150):
+        s.add("str" + str(i // 2))
+        if i % 25 == 24:
+            print(s.empty_buckets(), round(s.table_load(), 2), s.get_size(), s.get_capacity())
+
+    print("\ncontains / remove example 1")
+    print("---------------------------")
+    s = HashSet(11, hash_function_2)
+    keys = [i for i in range(1, 1000, 20)]
+    for key in keys:
+        s.add(str(key))
+    result = True
+    for key in keys:
+        # all added keys must be present
+        result &= s.contains(str(key))
+        # NOT added keys must be absent
+        result &= not s.contains(str(key + 1))
+    print(s.get_size(), result)
+    for key in keys[::2]:
+        s.remove(str(key))
+    print(s.get_size(), s.contains("1"), s.contains("21"))
+
+    print("\nunion / intersection / difference example 1")
+    print("-------------------------------------------")
+    a = HashSet(11, hash_function_2)
+    b = HashSet(11, hash_function_2)
+    for i in range(10):
+        a.add(str(i))
+        b.add(str(i + 5))
+    print(sorted(a.union(b)), a.union(b).get_size())
+    print(sorted(a.intersection(b)), sorted(b.intersection(a)))
+    print(sorted(a.difference(b)), sorted(b.difference(a)))
+    c = HashSet(11, hash_function_1)
+    c.add("7")
+    c.add("x")
+    print(sorted(a.intersection(c)), sorted(c.difference(a)))
+    a.clear()
+    print(a.get_size(), a.empty_buckets(), sorted(b.difference(a)) == sorted(b))
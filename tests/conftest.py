@@ -0,0 +1,8 @@
+# Description: pytest configuration. The modules under test live at the root
+#              of the repository, next to this directory.
+
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,30 @@
+# Description: Tests for the shared arrays in a6_include.
+
+
+from a6_include import GenerationArray, LinkedList
+
+
+def test_generation_array_reset():
+    a = GenerationArray(4)
+    a[0] = 'x'
+    a.set_unchecked(3, 'y')
+    a.append('z')
+    assert list(a) == ['x', None, None, 'y', 'z']
+
+    a.reset()
+    assert list(a) == [None] * 5 and a.length() == 5
+    a[1] = 'w'
+    a.reset()
+    a.reset()
+    assert a[1] is None
+
+
+def test_generation_array_reset_makes_fresh_empties():
+    a = GenerationArray(3, LinkedList)
+    a.get_unchecked(0).insert('k', 1)
+    first = a.get_unchecked(0)
+    a.reset()
+
+    bucket = a.get_unchecked(0)
+    assert bucket is not first and bucket.length() == 0
+    assert first.length() == 1 and a.get_unchecked(0) is bucket
@@ -0,0 +1,48 @@
+# Description: Tests for the process-pool bulk build of the HashMaps.
+
+
+import pytest
+
+import bulk_build
+import hash_map_oa
+import hash_map_sc
+from a6_include import as_list, hash_function_2
+
+
+def zero_hash(key: str) -> int:
+    """Hash every key to 0, as a flooding input would."""
+    return 0
+
+
+def put_all(map, pairs: list):
+    """Put pairs into map in order and return it."""
+    for key, value in pairs:
+        map.put(key, value)
+    return map
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+@pytest.mark.parametrize('build, module', [(bulk_build.build_sc, hash_map_sc),
+                                           (bulk_build.build_oa, hash_map_oa)])
+def test_build_matches_put(build, module, workers):
+    pairs = [('str' + str(i // 3), i) for i in range(600)]
+    m = build(pairs, 53, hash_function_2, workers)
+    expected = put_all(module.HashMap(53, hash_function_2), pairs)
+
+    assert m.get_size() == expected.get_size() == 200
+    assert (sorted(as_list(m.get_keys_and_values()))
+            == sorted(as_list(expected.get_keys_and_values())))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_build_sc_detects_flooding(workers):
+    pairs = [('key' + str(i), i) for i in range(100)]
+    m = bulk_build.build_sc(pairs, 11, zero_hash, workers)
+
+    assert m._hash_function is not zero_hash
+    assert m.get_size() == 100
+    assert all(m.get(key) == value for key, value in pairs)
+
+
+def test_bounds():
+    assert bulk_build.bounds(10, 3) == [(0, 4), (4, 7), (7, 10)]
@@ -0,0 +1,68 @@
+# Description: Tests for AdaptiveHashMap.
+
+
+import pytest
+
+from a6_include import SeededHash, hash_function_1
+from hash_map_adaptive import (OPEN_ADDRESSING, SEPARATE_CHAINING,
+                               AdaptiveHashMap)
+
+
+@pytest.mark.parametrize('layout', [SEPARATE_CHAINING, OPEN_ADDRESSING])
+def test_put_get_remove(layout):
+    m = AdaptiveHashMap(11, hash_function_1, layout)
+    for i in range(500):
+        m.put('key' + str(i), i)
+    for i in range(0, 500, 2):
+        m.remove('key' + str(i))
+
+    assert m.get_size() == 250
+    assert m.get('key1') == 1 and m.get('key0') is None
+    assert m.contains_key('key499') and not m.contains_key('key498')
+
+
+@pytest.mark.parametrize('layout', [SEPARATE_CHAINING, OPEN_ADDRESSING])
+def test_none_value_counts_as_a_hit(layout):
+    m = AdaptiveHashMap(11, hash_function_1, layout)
+    m.put('a', None)
+    assert m.get('a') is None and m.get('b') is None
+    assert m._lookups == 2 and m._hits == 1
+
+
+def test_only_sampled_lookups_hash_key_again():
+    calls = []
+
+    def counting_hash(key: str) -> int:
+        calls.append(key)
+        return hash_function_1(key)
+
+    m = AdaptiveHashMap(53, counting_hash, SEPARATE_CHAINING)
+    m.put('a', 1)
+    del calls[:]
+    for i in range(AdaptiveHashMap.SAMPLE_EVERY - 1):
+        m.get('a')
+    assert len(calls) == AdaptiveHashMap.SAMPLE_EVERY - 1 and m._samples == 0
+
+    m.contains_key('a')
+    assert len(calls) == AdaptiveHashMap.SAMPLE_EVERY + 1
+    assert m._samples == 1 and m._observed == 1
+    assert not hasattr(m._map, '_searched')
+
+
+def test_sampled_probe_length_is_recorded():
+    m = AdaptiveHashMap(53, hash_function_1, OPEN_ADDRESSING)
+    m.put('a', 1)
+    for i in range(AdaptiveHashMap.SAMPLE_EVERY):
+        m.get('a')
+    assert m._samples == 1 and m._observed == 1
+
+
+def test_clear_starts_sampling_over():
+    m = AdaptiveHashMap(11, SeededHash(1))
+    for i in range(100):
+        m.put('key' + str(i), i)
+        m.get('key' + str(i))
+    m.clear()
+
+    assert m.get_size() == 0
+    assert m.estimate_costs() == {SEPARATE_CHAINING: 0.0, OPEN_ADDRESSING: 0.0}
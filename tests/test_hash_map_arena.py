@@ -0,0 +1,29 @@
+# Description: Tests for the arena-backed ArenaHashMap.
+
+
+from a6_include import hash_function_1, hash_function_2
+from hash_map_arena import ArenaHashMap
+
+
+def test_resize_compacts_arena():
+    m = ArenaHashMap(11, hash_function_2)
+    for key in ('1', '2', 'über', '日本', '5'):
+        m.put(key, key * 2)
+    assert m.get_arena_size() == 3 + 5 + 6
+    assert m.pop('über') == 'überüber' and m.get_arena_size() == 14
+
+    m.resize_table(7)
+    assert m.get_arena_size() == 9
+    assert sorted(m) == ['1', '2', '5', '日本'] and m.get('日本') == '日本日本'
+
+
+def test_churn_compacts_arena():
+    m = ArenaHashMap(11, hash_function_1)
+    for i in range(10000):
+        m.put('somekey', i)
+        m.remove('somekey')
+
+    assert m.get_size() == 0
+    assert m.get_arena_size() <= 2 * len('somekey') + m.get_capacity()
+    m.put('somekey', 'last')
+    assert m.get('somekey') == 'last' and list(m) == ['somekey']
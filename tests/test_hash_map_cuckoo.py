@@ -0,0 +1,69 @@
+# Description: Tests for the bucketized CuckooHashMap.
+
+
+from a6_include import hash_function_1
+from hash_map_cuckoo import CuckooHashMap
+
+
+def zero_hash(key: str) -> int:
+    """Hash every key to 0, so all keys share the same two buckets."""
+    return 0
+
+
+def colliding_map(extra: int) -> (CuckooHashMap, list):
+    """
+    Return a CuckooHashMap holding enough colliding keys to fill their
+    buckets with extra keys left over for the stash, and the keys.
+    """
+    m = CuckooHashMap(11, zero_hash)
+    slots = len(set(m.calc_indices(0))) * m.SLOTS
+    keys = ['key' + str(i) for i in range(slots + extra)]
+    for i, key in enumerate(keys):
+        m.put(key, i)
+    return m, keys
+
+
+def test_full_buckets_use_the_stash():
+    m, keys = colliding_map(2)
+    assert len(m._stash) == 2 and m.get_size() == len(keys)
+    assert all(m.get(key) == i for i, key in enumerate(keys))
+
+    stashed = m._stash[0][1]
+    m.put(stashed, 'updated')
+    assert m.get(stashed) == 'updated' and len(m._stash) == 2
+
+
+def test_remove_drains_the_stash():
+    m, keys = colliding_map(2)
+    bucketed = [key for key in keys if m._find_stash(key) is None]
+    m.remove(bucketed[0])
+    assert len(m._stash) == 1 and m.get_size() == len(keys) - 1
+
+    m.remove(m._stash[0][1])
+    assert not m._stash and m.get_size() == len(keys) - 2
+    assert not m.contains_key(bucketed[0])
+
+
+def test_stash_overflow_rebuilds_with_a_seeded_hash():
+    # More keys than two buckets and the stash can hold, whatever the seeds.
+    m = CuckooHashMap(11, zero_hash)
+    keys = ['key' + str(i) for i in range(2 * m.SLOTS + m.STASH_SIZE + 1)]
+    for i, key in enumerate(keys):
+        m.put(key, i)
+
+    assert m._hash_function is not zero_hash
+    assert len(m._stash) <= m.STASH_SIZE
+    assert m.get_size() == len(keys)
+    assert all(m.get(key) == i for i, key in enumerate(keys))
+
+
+def test_lookups_touch_two_buckets_at_high_load():
+    m = CuckooHashMap(11, hash_function_1)
+    for i in range(1000):
+        m.put('key' + str(i), i)
+    assert m.table_load() <= m.MAX_LOAD and len(m._stash) <= m.STASH_SIZE
+    for i in range(0, 1000, 2):
+        m.remove('key' + str(i))
+    assert m.get_size() == 500
+    assert all(m.get('key' + str(i)) == (i if i % 2 else None)
+               for i in range(1000))
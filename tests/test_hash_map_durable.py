@@ -0,0 +1,92 @@
+# Description: Tests for DurableHashMap.
+
+
+import os
+
+from a6_include import hash_function_1
+from hash_map_durable import HEADER, PUT, DurableHashMap, encode_record
+
+
+def test_reopen_replays_log(tmp_path):
+    path = str(tmp_path / 'store')
+    with DurableHashMap(path, 53, hash_function_1) as m:
+        for i in range(10):
+            m.put('key' + str(i), i)
+        m.remove('key3')
+        m.put('key1', 100)
+
+    with DurableHashMap(path, 53, hash_function_1) as m:
+        assert m.get_size() == 9
+        assert m.get('key1') == 100 and not m.contains_key('key3')
+
+
+def test_checkpoint_keeps_the_record_that_triggered_it(tmp_path):
+    # The checkpoint taken by the fourth put must include that put.
+    path = str(tmp_path / 'store')
+    with DurableHashMap(path, checkpoint_every=4) as m:
+        for i in range(4):
+            m.put('key' + str(i), i)
+        m.remove('key0')
+        m.remove('key1')
+        m.remove('key2')
+        m.clear()
+
+    with DurableHashMap(path, checkpoint_every=4) as m:
+        assert m.get_size() == 0
+
+    with DurableHashMap(path, checkpoint_every=4) as m:
+        for i in range(4):
+            m.put('key' + str(i), i)
+    with DurableHashMap(path) as m:
+        assert sorted(m.get(key) for key in ('key0', 'key1', 'key2', 'key3')) == [0, 1, 2, 3]
+
+
+def test_remove_looks_key_up_once(tmp_path):
+    calls = []
+
+    def counting_hash(key: str) -> int:
+        calls.append(key)
+        return hash_function_1(key)
+
+    with DurableHashMap(str(tmp_path / 'store'), 53, counting_hash) as m:
+        m.put('a', 1)
+        records = m._log_records
+        del calls[:]
+        m.remove('a')
+        m.remove('missing')
+
+        assert calls == ['a', 'missing']
+        assert m._log_records == records + 1
+        assert not m.contains_key('a')
+
+
+def test_torn_log_tail_is_discarded(tmp_path):
+    # A crash mid-write leaves a partial record at the end of the log.
+    path = str(tmp_path / 'store')
+    with DurableHashMap(path, sync='always') as m:
+        m.put('a', 1)
+        m.put('b', 2)
+    size = os.path.getsize(path + '.log')
+    with open(path + '.log', 'ab') as fileobj:
+        fileobj.write(encode_record((PUT, 'c', 3))[:-1])
+
+    with DurableHashMap(path) as m:
+        assert m.get_size() == 2 and not m.contains_key('c')
+        assert os.path.getsize(path + '.log') == size
+        m.put('c', 3)
+    with DurableHashMap(path) as m:
+        assert m.get('c') == 3 and m.get_size() == 3
+
+
+def test_corrupt_record_ends_replay(tmp_path):
+    path = str(tmp_path / 'store')
+    with DurableHashMap(path, sync='always') as m:
+        m.put('a', 1)
+        m.put('b', 2)
+        m.put('c', 3)
+    with open(path + '.log', 'r+b') as fileobj:
+        fileobj.seek(len(encode_record((PUT, 'a', 1))) + HEADER.size)
+        fileobj.write(b'\xff')
+
+    with DurableHashMap(path) as m:
+        assert m.get('a') == 1 and m.get_size() == 1
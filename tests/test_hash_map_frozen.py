@@ -0,0 +1,36 @@
+# Description: Tests for FrozenHashMap.
+
+
+import os
+import subprocess
+import sys
+
+from a6_include import DynamicArray, as_list, hash_function_2
+from hash_map_frozen import FrozenHashMap
+from hash_map_oa import HashMap
+
+
+def test_as_list():
+    assert as_list(DynamicArray([1, 2, 3])) == [1, 2, 3]
+    assert as_list(iter('ab')) == ['a', 'b']
+
+
+def test_build_from_map_and_pairs():
+    source = HashMap(11, hash_function_2)
+    for i in range(100):
+        source.put('key' + str(i), i)
+    m = FrozenHashMap(source.get_keys_and_values(), 1)
+    assert m.get_size() == 100 and m.get_capacity() == 100
+    assert all(m.get('key' + str(i)) == i for i in range(100))
+    assert m.get('key100') is None and not m.contains_key('key100')
+
+    m = FrozenHashMap([('a', 1), ('b', 2), ('a', 3)])
+    assert m.get_size() == 2 and m.get('a') == 3
+
+
+def test_does_not_import_bulk_build():
+    # Run in a fresh interpreter, since other tests may import bulk_build.
+    code = "import sys, hash_map_frozen; print('bulk_build' in sys.modules)"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                            text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+    assert result.stdout.strip() == 'False'
@@ -0,0 +1,59 @@
+# Description: Tests for IntHashMap and the integer find_mode.
+
+
+import pytest
+
+import hash_map_sc
+from a6_include import DynamicArray, as_list
+from hash_map_int import IntHashMap, find_mode
+
+
+def test_put_get_remove():
+    m = IntHashMap()
+    for key in range(-500, 500, 7):
+        m.put(key, key * 3)
+    for key in range(-500, 500, 14):
+        m.remove(key)
+
+    assert m.get_size() == 71
+    assert m.get(-493) == -1479 and m.get(-500) is None
+    assert sorted(m) == list(range(-493, 500, 14))
+
+
+@pytest.mark.parametrize('call', [lambda m: m.put(1, 2 ** 70),
+                                  lambda m: m.put(2 ** 70, 1),
+                                  lambda m: m.increment(1, 2 ** 70),
+                                  lambda m: m.increment(2, 2 ** 63)])
+def test_overflow_leaves_map_unchanged(call):
+    m = IntHashMap()
+    m.put(2, 2 ** 63 - 2 ** 62)
+    with pytest.raises(OverflowError):
+        call(m)
+
+    assert m.get_size() == 1 and m.empty_buckets() == m.get_capacity() - 1
+    assert not m.contains_key(1) and not m.contains_key(2 ** 70)
+    assert m.get(2) == 2 ** 63 - 2 ** 62
+    assert list(m) == [2]
+
+
+def test_increment_all_rejects_non_ints():
+    m = IntHashMap()
+    with pytest.raises(TypeError):
+        m.increment_all([1, 2, True])
+    assert m.get(1) == 1 and m.get(2) == 1 and m.get_size() == 2
+
+
+def test_find_mode():
+    mode, count = find_mode([5, -5, 5, -5, 5, 2 ** 63 - 1])
+    assert (as_list(mode), count) == ([5], 3)
+    mode, count = find_mode(iter([1, 1, 2, 2, 3]), 5)
+    assert (sorted(as_list(mode)), count) == ([1, 2], 2)
+
+
+@pytest.mark.parametrize('values, expected', [
+    ([1, 1, 2, 3, 3, 4], [1, 3]),
+    (['b', 'a', 'b', 'a'], ['a', 'b']),
+])
+def test_sc_find_mode_picks_the_map_from_the_input(values, expected):
+    mode, count = hash_map_sc.find_mode(DynamicArray(values))
+    assert (sorted(as_list(mode)), count) == (expected, 2)
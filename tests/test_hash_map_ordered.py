@@ -0,0 +1,33 @@
+# Description: Tests for the insertion-ordered OrderedHashMap.
+
+
+from a6_include import as_list, hash_function_1, hash_function_2
+from hash_map_ordered import OrderedHashMap
+
+
+def test_order_kept_across_resizes():
+    m = OrderedHashMap(11, hash_function_2)
+    keys = ['key' + str(i) for i in range(200, 0, -1)]
+    for key in keys:
+        m.put(key, key)
+    m.put('key150', 'updated')
+    for key in keys[::3]:
+        m.remove(key)
+    m.resize_table(3)
+    m.resize_table(1009)
+
+    expected = [key for i, key in enumerate(keys) if i % 3]
+    assert list(m) == expected
+    assert [key for key, value in as_list(m.get_keys_and_values())] == expected
+    assert m.get('key150') == 'updated' and m.get_size() == len(expected)
+
+
+def test_churn_compacts_entries():
+    m = OrderedHashMap(11, hash_function_1)
+    for i in range(10000):
+        m.put('k', i)
+        m.remove('k')
+
+    assert m.get_size() == 0 and m._keys.length() <= m.get_capacity()
+    m.put('k', 'last')
+    assert list(m) == ['k'] and m.get('k') == 'last'
@@ -0,0 +1,244 @@
+# Description: Tests for the separate chaining HashMap.
+
+
+import gc
+import io
+
+import pytest
+
+from a6_include import (DynamicArray, FastDynamicArray, SeededHash,
+                        hash_function_1, hash_function_2)
+from hash_map_sc import HashMap, TreeBucket, find_mode
+
+
+def pairs(map) -> list:
+    """Return the sorted key/value pairs of map."""
+    keys_values = map.get_keys_and_values()
+    return sorted(keys_values[i] for i in range(keys_values.length()))
+
+
+@pytest.mark.parametrize('function', [hash_function_1, hash_function_2])
+def test_put_get_remove(function):
+    m = HashMap(11, function)
+    for i in range(200):
+        m.put('key' + str(i), i)
+    m.put('key7', 'seven')
+    for i in range(0, 200, 2):
+        m.remove('key' + str(i))
+
+    assert m.get_size() == 100
+    assert m.get('key7') == 'seven'
+    assert m.get('key8') is None
+    assert m.contains_key('key199') and not m.contains_key('key198')
+    assert m.empty_buckets() == sum(m._buckets.get_unchecked(i).length() == 0
+                                    for i in range(m.get_capacity()))
+
+
+def test_single_pass_helpers():
+    m = HashMap(53, hash_function_1)
+    assert m.setdefault('a', 1) == 1 and m.setdefault('a', 2) == 1
+    assert m.compute('a', lambda v: v + 10) == 11
+    assert m.compute('b', lambda v: [v]) == [None]
+    assert m.increment('c') == 1 and m.increment('c', 5) == 6
+    assert m.pop('c') == 6 and m.pop('c', 'missing') == 'missing'
+    assert m.get_size() == 2
+
+
+def test_merge_aligned_and_unaligned():
+    a = HashMap(53, hash_function_1)
+    b = HashMap(53, hash_function_1)
+    for i in range(30):
+        a.increment('key' + str(i % 20))
+        b.increment('key' + str(i % 25 + 10))
+    expected = {}
+    for map in (a, b):
+        for key, value in pairs(map):
+            expected[key] = expected.get(key, 0) + value
+
+    a.merge(b, lambda x, y: x + y)
+    assert pairs(a) == sorted(expected.items())
+
+    c = HashMap(11, hash_function_2)
+    c.put('key0', 'zero')
+    c.merge(a)
+    assert pairs(c) == sorted(expected.items())
+
+
+def test_pop_unlinks_from_chain_and_tree():
+    # hash_function_1 puts every anagram in one bucket, which becomes a
+    # TreeBucket past TREEIFY_THRESHOLD.
+    anagrams = ['abcd', 'abdc', 'acbd', 'acdb', 'adbc', 'adcb',
+                'bacd', 'badc', 'bcad', 'bcda', 'bdac', 'bdca']
+    for count in (3, len(anagrams)):
+        m = HashMap(11, hash_function_1)
+        for i, key in enumerate(anagrams[:count]):
+            m.put(key, i)
+        for i, key in enumerate(anagrams[:count]):
+            assert m.pop(key) == i
+            assert m.pop(key, 'gone') == 'gone'
+            assert m.get_size() == count - i - 1
+        assert m.empty_buckets() == m.get_capacity()
+
+
+def test_put_if_absent():
+    m = HashMap(11, hash_function_1)
+    assert m.put_if_absent('a', 1) is None
+    node = m.put_if_absent('a', 2)
+    assert node.key == 'a' and node.value == 1 and m.get_size() == 1
+
+
+def test_tree_bucket_with_unorderable_keys():
+    # Every key lands in bucket 0, which becomes a TreeBucket of strings
+    # before keys that can't be compared with strings arrive.
+    m = HashMap(11, lambda key: 0)
+    m.FLOOD_CHAIN_LENGTH = None
+    for i in range(12):
+        m.put('key' + str(i), i)
+    assert isinstance(m._buckets[0], TreeBucket)
+
+    assert m.get(5) is None and not m.contains_key((1, 2))
+    assert m.pop(5, 'missing') == 'missing'
+    m.put(5, 'five')
+    m.put((1, 2), 'pair')
+    m.put('key3', 'three')
+    assert m.get(5) == 'five' and m.get((1, 2)) == 'pair'
+    assert m.get('key3') == 'three' and m.get_size() == 14
+    assert m.pop(5) == 'five' and m.get_size() == 13
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_resize_with_mixed_key_types(seed):
+    # Str and int keys can't be ordered against each other, so a chain that
+    # gets long while resizing must stay a list if it holds both.
+    m = HashMap(11, SeededHash(seed))
+    keys = [i if i % 2 else 'key' + str(i) for i in range(150)]
+    for key in keys:
+        m.put(key, key)
+    m.resize_table(7)
+    m.resize_table(3)
+
+    assert m.get_size() == 150
+    assert all(m.get(key) == key for key in keys)
+    m.reseed(seed + 1)
+    assert all(m.get(key) == key for key in keys)
+
+
+def test_public_arrays_are_dynamic_arrays():
+    # Only the bucket array is a FastDynamicArray.
+    m = HashMap(11, hash_function_1)
+    m.put('a', 1)
+    assert isinstance(m._buckets, FastDynamicArray)
+    assert type(m.get_keys_and_values()) is DynamicArray
+    assert type(m.snapshot().get_keys_and_values()) is DynamicArray
+    mode, count = find_mode(DynamicArray(['a', 'b', 'a']))
+    assert type(mode) is DynamicArray and count == 2
+
+
+def test_snapshot_keeps_old_view():
+    m = HashMap(11, hash_function_1)
+    for i in range(10):
+        m.put('key' + str(i), i)
+    snapshot = m.snapshot()
+    m.put('key0', 'new')
+    m.remove('key1')
+    m.put('key10', 10)
+
+    assert snapshot.get('key0') == 0 and snapshot.get('key1') == 1
+    assert not snapshot.contains_key('key10')
+    assert snapshot.get_size() == 10 and m.get_size() == 10
+
+
+def test_snapshots_released_once_collected():
+    m = HashMap(11, hash_function_1)
+    m.put('a', 1)
+    snapshot = m.snapshot()
+    m.put('a', 2)
+    del snapshot
+    gc.collect()
+
+    # Changes after the last snapshot is gone don't record preserved buckets.
+    for i in range(20):
+        m.put('key' + str(i), i)
+    assert m._snapshots is None and not m._preserved
+
+
+def test_bloom_filter_insert_hashes_key_once():
+    calls = []
+
+    def counting_hash(key: str) -> int:
+        calls.append(key)
+        return hash_function_2(key)
+
+    m = HashMap(53, counting_hash)
+    m.enable_bloom_filter()
+    m.put('a', 1)
+    m.setdefault('b', 2)
+    m.increment('c')
+    m.compute('d', lambda value: 4)
+    assert calls == ['a', 'b', 'c', 'd']
+    assert all(m.contains_key(key) for key in 'abcd')
+    assert not m.contains_key('e')
+
+
+def test_single_pass_helpers_hash_key_once():
+    calls = []
+
+    def counting_hash(key: str) -> int:
+        calls.append(key)
+        return hash_function_1(key)
+
+    m = HashMap(53, counting_hash)
+    m.setdefault('a', 1)
+    m.setdefault('a', 2)
+    m.compute('a', lambda v: v + 1)
+    m.compute('b', lambda v: v)
+    m.increment('c')
+    m.increment('c')
+    m.pop('c')
+    m.pop('c')
+    assert calls == ['a', 'a', 'a', 'b', 'c', 'c', 'c', 'c']
+    assert m.get('a') == 2 and m.contains_key('b') and m.get('b') is None
+
+
+def test_clear_empties_buckets_and_keeps_snapshots():
+    m = HashMap(11, hash_function_1)
+    for i in range(30):
+        m.put('key' + str(i), i)
+    snapshot = m.snapshot()
+    for _ in range(2):
+        m.clear()
+        assert m.get_size() == 0 and m.empty_buckets() == m.get_capacity()
+        assert not m.contains_key('key1') and m.get_keys_and_values().length() == 0
+
+        m.put('key1', 'new')
+        assert m.empty_buckets() == m.get_capacity() - 1
+        assert pairs(m) == [('key1', 'new')]
+
+    assert snapshot.get('key1') == 1 and snapshot.get_size() == 30
+
+
+def test_write_to_streams_lines_with_limits():
+    m = HashMap(11, hash_function_1)
+    for i in range(5):
+        m.put('key' + str(i), i)
+    full = io.StringIO()
+    assert m.write_to(full, only_nonempty=False) == m.get_capacity()
+    assert full.getvalue() == str(m)
+
+    nonempty = io.StringIO()
+    written = m.write_to(nonempty)
+    assert written == m.get_capacity() - m.empty_buckets()
+    assert set(nonempty.getvalue().splitlines()) <= set(str(m).splitlines())
+
+    limited = io.StringIO()
+    assert m.write_to(limited, limit=2) == 2
+    assert limited.getvalue() == ''.join(nonempty.getvalue().splitlines(True)[:2])
+    assert m.write_to(io.StringIO(), limit=0) == 0
+
+
+def test_summary_length_does_not_depend_on_contents():
+    m = HashMap(11, hash_function_1)
+    empty = repr(m)
+    for i in range(1000):
+        m.put('key' + str(i) * 50, 'value' * 100)
+    assert repr(m) == m.summary() and len(repr(m)) < len(empty) + 20
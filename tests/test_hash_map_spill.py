@@ -0,0 +1,38 @@
+# Description: Tests for SpillingHashMap.
+
+
+from a6_include import hash_function_1
+from hash_map_spill import SpillingHashMap
+
+
+def test_put_get_remove_across_spills(tmp_path):
+    with SpillingHashMap(200, 8, hash_function_1, str(tmp_path), 16) as m:
+        for i in range(1000):
+            m.put('key' + str(i), i)
+        m.remove('key5')
+        m.increment('key6', 10)
+
+        assert m.get_spilled_count() > 0
+        assert m.get('key5') is None and m.get('key6') == 16
+        assert m.get_size() == 999
+        assert sorted(m.iter_keys_and_values())[0] == ('key0', 0)
+
+
+def test_get_size_reads_only_changed_partitions(tmp_path, monkeypatch):
+    with SpillingHashMap(200, 8, hash_function_1, str(tmp_path), 16) as m:
+        for i in range(1000):
+            m.put('key' + str(i), i)
+        assert m.get_size() == 1000
+        spilled = [p for p in range(8) if m._maps[p] is None]
+        key = next('key' + str(i) for i in range(1000)
+                   if hash_function_1('key' + str(i)) % 8 == spilled[0])
+        m.remove(key)
+
+        reads = []
+        read_partition = m._read_partition
+        monkeypatch.setattr(m, '_read_partition',
+                            lambda p: reads.append(p) or read_partition(p))
+        assert m.get_size() == 999
+        assert reads == [spilled[0]]
+        assert m.get_size() == 999
+        assert reads == [spilled[0]]
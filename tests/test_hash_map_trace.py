@@ -0,0 +1,105 @@
+# Description: Tests for the workload trace recorder and replayer.
+
+
+import pytest
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import as_list, hash_function_1
+from hash_map_trace import (CLEAR, POP, PUT, TracingHashMap, read_trace,
+                            replay)
+
+
+def zero_hash(key: str) -> int:
+    """Hash every key to 0, as a flooding input would."""
+    return 0
+
+
+def keys(map) -> list:
+    """Return the sorted keys of map."""
+    return sorted(key for key, value in as_list(map.get_keys_and_values()))
+
+
+def workload(map) -> None:
+    """Run a workload that uses every traced method on map."""
+    for i in range(60):
+        map.put('key' + str(i % 25), i)
+        map.get('key' + str(i % 30))
+    map.remove('key3')
+    map.pop('key4')
+    map.pop('missing', None)
+    map.setdefault('key5', 0)
+    map.setdefault('new', 0)
+    map.increment('count')
+    map.compute('computed', lambda value: 1)
+    map.contains_key('key6')
+    map.resize_table(53)
+    map.clear()
+    for i in range(10):
+        map.put('after' + str(i), i)
+    map.remove('after0')
+
+
+@pytest.mark.parametrize('record_keys', [True, False])
+@pytest.mark.parametrize('module', [hash_map_sc, hash_map_oa])
+def test_replay_reproduces_the_traced_map(tmp_path, module, record_keys):
+    path = str(tmp_path / 'trace')
+    traced = module.HashMap(11, hash_function_1)
+    with TracingHashMap(traced, path, record_keys) as m:
+        workload(m)
+
+    replayed = module.HashMap(11, hash_function_1)
+    durations = replay(path, replayed)
+    assert replayed.get_size() == traced.get_size() == 9
+    assert replayed.get_capacity() == traced.get_capacity()
+    assert len(durations['clear']) == 1 and len(durations['pop']) == 2
+    if record_keys:
+        assert keys(replayed) == keys(traced)
+
+
+def test_keyless_trace_keeps_keys_with_equal_hashes_apart(tmp_path):
+    # The anagrams hash the same under hash_function_1.
+    path = str(tmp_path / 'trace')
+    with TracingHashMap(hash_map_sc.HashMap(11, hash_function_1), path,
+                        False) as m:
+        for key in ('ab', 'ba', 'ab', 'abc', 'cab'):
+            m.put(key, 1)
+        m.remove('ba')
+
+    replayed = hash_map_sc.HashMap(11, hash_function_1)
+    replay(path, replayed)
+    assert keys(replayed) == ['0', '2', '3']
+
+
+def test_records_hash_from_before_a_reseed(tmp_path):
+    path = str(tmp_path / 'trace')
+    map = hash_map_sc.HashMap(11, zero_hash)
+    with TracingHashMap(map, path) as m:
+        for i in range(40):
+            m.put('key' + str(i), i)
+    assert map._hash_function is not zero_hash
+
+    with open(path, 'rb') as fileobj:
+        records = list(read_trace(fileobj))
+    # The put that made the chain long enough to reseed is recorded with the
+    # hash it was looked up with; later puts use the new function.
+    reseeded = hash_map_sc.HashMap.FLOOD_CHAIN_LENGTH + 1
+    assert [hash for op, hash, ns, key in records[:reseeded]] == [0] * reseeded
+    assert all(hash == map._hash_function(key)
+               for op, hash, ns, key in records[reseeded:])
+
+
+def test_clear_and_pop_are_recorded_and_others_refused(tmp_path):
+    path = str(tmp_path / 'trace')
+    with TracingHashMap(hash_map_sc.HashMap(11, hash_function_1), path) as m:
+        m.put('a', 1)
+        assert m.pop('a') == 1
+        m.clear()
+        for name in ('merge', 'put_if_absent', 'reseed'):
+            with pytest.raises(AttributeError):
+                getattr(m, name)
+        assert m.get_size() == 0
+
+    with open(path, 'rb') as fileobj:
+        ops = [op for op, hash, ns, key in read_trace(fileobj)]
+    assert ops == [PUT, POP, CLEAR]
@@ -0,0 +1,39 @@
+# Description: Tests for HashMultiMap.
+
+
+from a6_include import as_list, hash_function_2
+from hash_multimap import HashMultiMap
+
+
+def test_put_remove_counts():
+    m = HashMultiMap(11, hash_function_2)
+    for i in range(30):
+        m.put('key' + str(i % 7), i)
+    m.put('list', [1, 2])
+    assert m.get_size() == 8 and m.get_value_count() == 31
+    assert m.count('key3') == 4 and m.count('list') == 1
+
+    m.remove('key3')
+    m.remove('list')
+    m.remove('missing')
+    assert m.get_size() == 6 and m.get_value_count() == 26
+    assert not m.contains_key('key3')
+
+    assert m.remove_value('key0', 7) and not m.remove_value('key0', 99)
+    assert m.get_value_count() == 25
+
+
+def test_remove_value_keeps_storage_consistent():
+    m = HashMultiMap(11, hash_function_2)
+    m.put('a', 1)
+    m.put('a', 2)
+    m.put('a', 2)
+    assert m.remove_value('a', 2) and m.count('a') == 2
+    assert m.remove_value('a', 1)
+    assert m.count('a') == 1 and as_list(m.get('a')) == [2]
+
+    # Removing the last value removes the key.
+    assert not m.remove_value('a', 1)
+    assert m.remove_value('a', 2)
+    assert not m.contains_key('a') and m.get_size() == 0
+    assert m.get_value_count() == 0 and not m.remove_value('a', 2)
@@ -0,0 +1,53 @@
+# Description: Tests for HashSet.
+
+
+import pytest
+
+from a6_include import SeededHash, hash_function_1, hash_function_2
+from hash_set import HashSet
+
+
+def make_set(keys, function=hash_function_2) -> HashSet:
+    """Return a HashSet of keys."""
+    s = HashSet(11, function)
+    for key in keys:
+        s.add(key)
+    return s
+
+
+def test_add_remove_churn_keeps_an_empty_slot_on_every_probe():
+    # Quadratic probing only reaches about half of the slots, so tombstones
+    # must not fill more than half of them.
+    s = HashSet(11, hash_function_2)
+    for i in range(500):
+        s.add('k' + str(i))
+        s.remove('k' + str(i))
+        assert s._occupied * 2 <= s.get_capacity()
+    assert s.get_size() == 0 and s.get_capacity() == 11
+    assert not s.contains('missing')
+
+
+@pytest.mark.parametrize('function', [hash_function_2, SeededHash(3)])
+def test_set_operations(function):
+    # The second set may hash differently, so stored hashes can't be reused.
+    a = make_set(['k' + str(i) for i in range(0, 60, 2)])
+    b = make_set(['k' + str(i) for i in range(0, 60, 3)], function)
+    a.remove('k0')
+    b.remove('k30')
+    a_keys, b_keys = set(a), set(b)
+
+    assert set(a.union(b)) == a_keys | b_keys
+    assert set(a.intersection(b)) == set(b.intersection(a)) == a_keys & b_keys
+    assert set(a.difference(b)) == a_keys - b_keys
+    assert set(b.difference(a)) == b_keys - a_keys
+    assert a.union(b).get_size() == len(a_keys | b_keys)
+    assert a.union(b).contains('k3') and not a.difference(b).contains('k6')
+
+
+def test_set_operations_with_empty_sets():
+    a = make_set(['x', 'y'])
+    empty = HashSet(11, hash_function_1)
+    assert set(a.union(empty)) == {'x', 'y'}
+    assert a.intersection(empty).get_size() == 0
+    assert set(a.difference(empty)) == {'x', 'y'}
+    assert empty.difference(a).get_size() == 0
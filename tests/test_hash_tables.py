@@ -0,0 +1,58 @@
+# Description: Tests shared by the hash tables built on HashTableBase.
+
+
+import pytest
+
+from a6_include import SeededHash, hash_function_1
+from hash_map_arena import ArenaHashMap
+from hash_map_compact import CompactHashMap
+from hash_map_cuckoo import CuckooHashMap
+from hash_map_ordered import OrderedHashMap
+from hash_set import HashSet
+
+MAPS = [ArenaHashMap, CompactHashMap, CuckooHashMap, OrderedHashMap]
+
+
+def fill(table, keys) -> None:
+    """Add every key to table, with its position as the value."""
+    for i, key in enumerate(keys):
+        if isinstance(table, HashSet):
+            table.add(key)
+        else:
+            table.put(key, i)
+
+
+@pytest.mark.parametrize('cls', MAPS + [HashSet])
+def test_reseed_keeps_entries(cls):
+    table = cls(11, hash_function_1)
+    keys = ['key' + str(i) for i in range(100)]
+    fill(table, keys)
+    table.reseed(42)
+
+    assert table._hash_function == SeededHash(42)
+    assert table.get_size() == 100 and table.get_capacity() >= 11
+    assert table.table_load() == table.get_size() / table.get_capacity()
+    assert all(table.contains_key(key) for key in keys)
+    assert not table.contains_key('key100')
+    if cls is not HashSet:
+        assert all(table.get(key) == i for i, key in enumerate(keys))
+
+
+@pytest.mark.parametrize('cls', MAPS + [HashSet])
+def test_flooding_switches_to_seeded_hash(cls):
+    # All permutations of the same letters collide under hash_function_1.
+    from itertools import permutations
+    keys = [''.join(p) for p in permutations('abcdef')][:200]
+    table = cls(11, hash_function_1)
+    fill(table, keys)
+
+    assert isinstance(table._hash_function, SeededHash)
+    assert table.get_size() == 200
+    assert all(table.contains_key(key) for key in keys)
+
+
+def test_prime_capacities():
+    table = CompactHashMap(20)
+    assert table.get_capacity() == 23
+    assert [n for n in range(30) if table._is_prime(n)] == [2, 3, 5, 7, 11, 13,
+                                                           17, 19, 23, 29]